@@ -0,0 +1,57 @@
+"""Add the background job queue.
+
+Revision ID: add_jobs
+Revises: add_sync_checkpoints
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "add_jobs"
+down_revision = "add_sync_checkpoints"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the jobs table and the partial index used to claim work."""
+    op.create_table(
+        "jobs",
+        sa.Column("itemid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "createdtimestamp", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+        sa.Column(
+            "updatedtimestamp", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+        sa.Column("kind", sa.String(length=100), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), server_default=sa.text("'{}'::jsonb"), nullable=False),
+        sa.Column("status", sa.String(length=20), server_default="queued", nullable=False),
+        sa.Column("priority", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("max_attempts", sa.Integer(), server_default="3", nullable=False),
+        sa.Column("run_after", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("locked_by", sa.String(length=255), nullable=True),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("result", postgresql.JSONB(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("itemid", name="pk__jobs"),
+        schema="budgetbuddy",
+    )
+    op.create_index(
+        "ix__jobs__claim",
+        "jobs",
+        ["status", sa.text("priority DESC"), "run_after"],
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+        schema="budgetbuddy",
+    )
+
+
+def downgrade() -> None:
+    """Drop the jobs table."""
+    op.drop_table("jobs", schema="budgetbuddy")
@@ -0,0 +1,84 @@
+"""Add monetary accounts and balance snapshots.
+
+Revision ID: add_monetary_accounts
+Revises: add_transaction_content_hash
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "add_monetary_accounts"
+down_revision = "add_transaction_content_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create monetary_accounts and the monetary_account_balances time series."""
+    op.create_table(
+        "monetary_accounts",
+        sa.Column("itemid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "createdtimestamp", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+        sa.Column(
+            "updatedtimestamp", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+        sa.Column("account_name", sa.String(length=255), nullable=False),
+        sa.Column("account_type", sa.String(length=50), nullable=True),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("balance", sa.Float(), nullable=False),
+        sa.Column("iban", sa.String(length=34), nullable=True),
+        sa.Column("bic", sa.String(length=11), nullable=True),
+        sa.Column("account_status", sa.String(length=50), nullable=True),
+        sa.Column("external_source", sa.String(length=50), nullable=True),
+        sa.Column("external_id", sa.String(length=255), nullable=True),
+        sa.Column("external_created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("external_updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("notes", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("itemid", name="pk__monetary_accounts"),
+        schema="budgetbuddy",
+    )
+    op.create_index(
+        "ix__budgetbuddy_monetary_accounts_iban", "monetary_accounts", ["iban"], unique=True, schema="budgetbuddy"
+    )
+    op.create_index(
+        "ix__budgetbuddy_monetary_accounts_external_id",
+        "monetary_accounts",
+        ["external_id"],
+        unique=True,
+        schema="budgetbuddy",
+    )
+
+    op.create_table(
+        "monetary_account_balances",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("monetary_account_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("balance", sa.Float(), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("captured_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["monetary_account_id"],
+            ["budgetbuddy.monetary_accounts.itemid"],
+            name="fk__monetary_account_balances__monetary_account_id__monetary_accounts",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name="pk__monetary_account_balances"),
+        schema="budgetbuddy",
+    )
+    op.create_index(
+        "ix__monetary_account_balances__account_captured_at",
+        "monetary_account_balances",
+        ["monetary_account_id", "captured_at"],
+        schema="budgetbuddy",
+    )
+
+
+def downgrade() -> None:
+    """Drop the balance snapshots and monetary accounts tables."""
+    op.drop_table("monetary_account_balances", schema="budgetbuddy")
+    op.drop_table("monetary_accounts", schema="budgetbuddy")
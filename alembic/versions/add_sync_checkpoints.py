@@ -0,0 +1,43 @@
+"""Add resumable checkpoints to sync watermarks.
+
+Revision ID: add_sync_checkpoints
+Revises: add_monetary_accounts
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_sync_checkpoints"
+down_revision = "add_monetary_accounts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add checkpoint columns and allow watermarks without a completed pass."""
+    op.alter_column(
+        "sync_watermarks", "last_payment_id", existing_type=sa.BigInteger(), nullable=True, schema="budgetbuddy"
+    )
+    op.add_column("sync_watermarks", sa.Column("resume_older_id", sa.BigInteger(), nullable=True), schema="budgetbuddy")
+    op.add_column(
+        "sync_watermarks", sa.Column("pending_payment_id", sa.BigInteger(), nullable=True), schema="budgetbuddy"
+    )
+    op.add_column(
+        "sync_watermarks",
+        sa.Column("pending_payment_created_at", sa.DateTime(timezone=True), nullable=True),
+        schema="budgetbuddy",
+    )
+
+
+def downgrade() -> None:
+    """Drop checkpoint columns; unfinished first passes are discarded."""
+    op.drop_column("sync_watermarks", "pending_payment_created_at", schema="budgetbuddy")
+    op.drop_column("sync_watermarks", "pending_payment_id", schema="budgetbuddy")
+    op.drop_column("sync_watermarks", "resume_older_id", schema="budgetbuddy")
+    op.execute("DELETE FROM budgetbuddy.sync_watermarks WHERE last_payment_id IS NULL")
+    op.alter_column(
+        "sync_watermarks", "last_payment_id", existing_type=sa.BigInteger(), nullable=False, schema="budgetbuddy"
+    )
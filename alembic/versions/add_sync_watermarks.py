@@ -0,0 +1,47 @@
+"""Add per-account sync watermarks.
+
+Revision ID: add_sync_watermarks
+Revises: add_external_fields
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "add_sync_watermarks"
+down_revision = "add_external_fields"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the sync_watermarks table used for incremental syncs."""
+    op.create_table(
+        "sync_watermarks",
+        sa.Column("itemid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "createdtimestamp", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+        sa.Column(
+            "updatedtimestamp", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+        sa.Column("external_source", sa.String(length=50), nullable=False),
+        sa.Column("monetary_account_id", sa.BigInteger(), nullable=False),
+        sa.Column("last_payment_id", sa.BigInteger(), nullable=False),
+        sa.Column("last_payment_created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("itemid", name="pk__sync_watermarks"),
+        sa.UniqueConstraint(
+            "external_source",
+            "monetary_account_id",
+            name="uq__sync_watermarks__external_source_monetary_account_id",
+        ),
+        schema="budgetbuddy",
+    )
+
+
+def downgrade() -> None:
+    """Drop the sync_watermarks table."""
+    op.drop_table("sync_watermarks", schema="budgetbuddy")
@@ -0,0 +1,26 @@
+"""Add content hash to transactions.
+
+Revision ID: add_transaction_content_hash
+Revises: add_sync_watermarks
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_transaction_content_hash"
+down_revision = "add_sync_watermarks"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add content_hash used to detect changed records on upsert."""
+    op.add_column("transactions", sa.Column("content_hash", sa.String(length=64), nullable=True), schema="budgetbuddy")
+
+
+def downgrade() -> None:
+    """Remove content_hash from transactions."""
+    op.drop_column("transactions", "content_hash", schema="budgetbuddy")
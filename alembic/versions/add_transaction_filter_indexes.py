@@ -0,0 +1,64 @@
+"""Add indexes for the transaction listing filters and amount order.
+
+Revision ID: add_transaction_filter_indexes
+Revises: add_transaction_keyset_indexes
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_transaction_filter_indexes"
+down_revision = "add_transaction_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index each common filter, followed by the created order and itemid."""
+    op.create_index("ix__transactions__amount_itemid", "transactions", ["amount", "itemid"], schema="budgetbuddy")
+    op.create_index(
+        "ix__transactions__category_created",
+        "transactions",
+        ["category", "createdtimestamp", "itemid"],
+        schema="budgetbuddy",
+        postgresql_where=sa.text("category IS NOT NULL"),
+    )
+    op.create_index(
+        "ix__transactions__source_created",
+        "transactions",
+        ["external_source", "createdtimestamp", "itemid"],
+        schema="budgetbuddy",
+    )
+    op.create_index(
+        "ix__transactions__type_created",
+        "transactions",
+        ["transaction_type", "createdtimestamp", "itemid"],
+        schema="budgetbuddy",
+        postgresql_where=sa.text("transaction_type IS NOT NULL"),
+    )
+    op.create_index(
+        "ix__transactions__iban_created",
+        "transactions",
+        [sa.text("upper(replace(counterparty_iban, ' ', ''))"), "createdtimestamp", "itemid"],
+        schema="budgetbuddy",
+        postgresql_where=sa.text("counterparty_iban IS NOT NULL"),
+    )
+    op.create_index(
+        "ix__transactions__currency_amount",
+        "transactions",
+        ["currency", "amount", "itemid"],
+        schema="budgetbuddy",
+    )
+
+
+def downgrade() -> None:
+    """Drop the listing filter indexes."""
+    op.drop_index("ix__transactions__currency_amount", table_name="transactions", schema="budgetbuddy")
+    op.drop_index("ix__transactions__iban_created", table_name="transactions", schema="budgetbuddy")
+    op.drop_index("ix__transactions__type_created", table_name="transactions", schema="budgetbuddy")
+    op.drop_index("ix__transactions__source_created", table_name="transactions", schema="budgetbuddy")
+    op.drop_index("ix__transactions__category_created", table_name="transactions", schema="budgetbuddy")
+    op.drop_index("ix__transactions__amount_itemid", table_name="transactions", schema="budgetbuddy")
@@ -0,0 +1,59 @@
+"""Add duplicate fingerprint to transactions.
+
+Revision ID: add_transaction_fingerprint
+Revises: add_jobs
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "add_transaction_fingerprint"
+down_revision = "add_jobs"
+branch_labels = None
+depends_on = None
+
+FINGERPRINT_EXPRESSION = (
+    "md5("
+    "round(amount::numeric, 2)::text"
+    " || '|' || upper(currency)"
+    " || '|' || ((coalesce(external_created_at, createdtimestamp) AT TIME ZONE 'UTC')::date - DATE '1970-01-01')::text"
+    " || '|' || upper(replace(coalesce(counterparty_iban, ''), ' ', ''))"
+    ")"
+)
+
+
+def upgrade() -> None:
+    """Add the generated fingerprint column and the duplicate_of link."""
+    op.add_column(
+        "transactions",
+        sa.Column("fingerprint", sa.String(length=32), sa.Computed(FINGERPRINT_EXPRESSION, persisted=True)),
+        schema="budgetbuddy",
+    )
+    op.add_column(
+        "transactions",
+        sa.Column(
+            "duplicate_of",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey(
+                "budgetbuddy.transactions.itemid",
+                name="fk__transactions__duplicate_of__transactions",
+                ondelete="SET NULL",
+            ),
+            nullable=True,
+        ),
+        schema="budgetbuddy",
+    )
+    op.create_index("ix__budgetbuddy_transactions_fingerprint", "transactions", ["fingerprint"], schema="budgetbuddy")
+    op.create_index("ix__budgetbuddy_transactions_duplicate_of", "transactions", ["duplicate_of"], schema="budgetbuddy")
+
+
+def downgrade() -> None:
+    """Remove the fingerprint and duplicate_of columns."""
+    op.drop_index("ix__budgetbuddy_transactions_duplicate_of", table_name="transactions", schema="budgetbuddy")
+    op.drop_index("ix__budgetbuddy_transactions_fingerprint", table_name="transactions", schema="budgetbuddy")
+    op.drop_column("transactions", "duplicate_of", schema="budgetbuddy")
+    op.drop_column("transactions", "fingerprint", schema="budgetbuddy")
@@ -0,0 +1,35 @@
+"""Add keyset pagination indexes to transactions.
+
+Revision ID: add_transaction_keyset_indexes
+Revises: add_transaction_fingerprint
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_transaction_keyset_indexes"
+down_revision = "add_transaction_fingerprint"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index both listing orders together with the itemid tie-breaker."""
+    op.create_index(
+        "ix__transactions__created_itemid", "transactions", ["createdtimestamp", "itemid"], schema="budgetbuddy"
+    )
+    op.create_index(
+        "ix__transactions__booked_itemid",
+        "transactions",
+        [sa.text("coalesce(external_created_at, createdtimestamp)"), "itemid"],
+        schema="budgetbuddy",
+    )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+    op.drop_index("ix__transactions__booked_itemid", table_name="transactions", schema="budgetbuddy")
+    op.drop_index("ix__transactions__created_itemid", table_name="transactions", schema="budgetbuddy")
@@ -0,0 +1,59 @@
+"""Leave the duplicate fingerprint NULL for transactions without a counterparty IBAN.
+
+Revision ID: fingerprint_requires_counterparty_iban
+Revises: add_transaction_filter_indexes
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "fingerprint_requires_counterparty_iban"
+down_revision = "add_transaction_filter_indexes"
+branch_labels = None
+depends_on = None
+
+FINGERPRINT_EXPRESSION = (
+    "md5("
+    "round(amount::numeric, 2)::text"
+    " || '|' || upper(currency)"
+    " || '|' || ((coalesce(external_created_at, createdtimestamp) AT TIME ZONE 'UTC')::date - DATE '1970-01-01')::text"
+    " || '|' || upper(replace(counterparty_iban, ' ', ''))"
+    ")"
+)
+
+PREVIOUS_FINGERPRINT_EXPRESSION = (
+    "md5("
+    "round(amount::numeric, 2)::text"
+    " || '|' || upper(currency)"
+    " || '|' || ((coalesce(external_created_at, createdtimestamp) AT TIME ZONE 'UTC')::date - DATE '1970-01-01')::text"
+    " || '|' || upper(replace(coalesce(counterparty_iban, ''), ' ', ''))"
+    ")"
+)
+
+
+def _replace_fingerprint(expression: str) -> None:
+    """Recreate the generated column; PostgreSQL cannot change its expression in place."""
+    op.drop_index("ix__budgetbuddy_transactions_fingerprint", table_name="transactions", schema="budgetbuddy")
+    op.drop_column("transactions", "fingerprint", schema="budgetbuddy")
+    op.add_column(
+        "transactions",
+        sa.Column("fingerprint", sa.String(length=32), sa.Computed(expression, persisted=True)),
+        schema="budgetbuddy",
+    )
+    op.create_index("ix__budgetbuddy_transactions_fingerprint", "transactions", ["fingerprint"], schema="budgetbuddy")
+
+
+def upgrade() -> None:
+    """Drop the IBAN-less fingerprints and the duplicate links they produced."""
+    # Equal fingerprints imply both rows lacked an IBAN, so clearing the
+    # links of IBAN-less rows removes every match the old expression made
+    op.execute("UPDATE budgetbuddy.transactions SET duplicate_of = NULL WHERE counterparty_iban IS NULL")
+    _replace_fingerprint(FINGERPRINT_EXPRESSION)
+
+
+def downgrade() -> None:
+    """Fingerprint IBAN-less transactions again; cleared links are not restored."""
+    _replace_fingerprint(PREVIOUS_FINGERPRINT_EXPRESSION)
@@ -1,14 +1,41 @@
 from __future__ import annotations
 
 from fastapi import FastAPI
-from src.budgetbuddy.api.routers.transaction import router as transactions_router
+from src.budgetbuddy.api.router.banking import router as banking_router
+from src.budgetbuddy.api.router.transaction import bulk_router as transactions_bulk_router
+from src.budgetbuddy.api.router.transaction import router as transactions_router
+from src.db.config import settings
 
-app = FastAPI(title="BudgetBuddy API")
 
-# Routers
-app.include_router(transactions_router)
+def create_app(async_api: bool | None = None) -> FastAPI:
+    """Build the API application.
 
+    Args:
+        async_api (bool | None): Serve the transaction CRUD routes from the
+            async engine. Defaults to the BB_ASYNC_API setting.
 
-@app.get("/")
-def read_root() -> dict[str, str]:
-    return {"status": "ok"}
+    Returns:
+        FastAPI: The application.
+    """
+    async_api = settings.async_api if async_api is None else async_api
+    app = FastAPI(title="BudgetBuddy API")
+
+    # Routers
+    app.include_router(transactions_bulk_router)
+    if async_api:
+        # Imported here so the async driver is only needed when enabled
+        from src.budgetbuddy.api.router.transaction_async import router as async_transactions_router
+
+        app.include_router(async_transactions_router)
+    else:
+        app.include_router(transactions_router)
+    app.include_router(banking_router)
+
+    @app.get("/")
+    def read_root() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+app = create_app()
@@ -0,0 +1,217 @@
+"""Move streamed request and response bodies between the event loop and
+blocking code (parsers, database COPY) without buffering them whole."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import queue
+import threading
+from collections.abc import AsyncIterator, Callable
+from typing import Any, BinaryIO
+
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+
+
+class BodyStreamReader(io.RawIOBase):
+    """Readable file object over chunks that the event loop feeds in.
+
+    The queue is bounded, so a slow reader (e.g. a database load) applies
+    backpressure to the upload instead of letting chunks pile up.
+    """
+
+    def __init__(self, max_chunks: int = 8):
+        self._chunks: queue.Queue[bytes | None] = queue.Queue(maxsize=max_chunks)
+        self._buffer = b""
+        self._eof = False
+        self._abandoned = threading.Event()
+        self._failed = threading.Event()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Read fed data into ``buffer``.
+
+        Raises:
+            OSError: If the body ended before it was complete.
+        """
+        while not self._buffer and not self._eof:
+            try:
+                chunk = self._chunks.get(timeout=0.1)
+            except queue.Empty:
+                if self._failed.is_set():
+                    raise OSError("request body ended before it was complete") from None
+                continue
+            if chunk is None:
+                self._eof = True
+            else:
+                self._buffer = chunk
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def feed(self, chunk: bytes | None) -> bool:
+        """Queue a chunk, or None for the end of the body; blocks while full.
+
+        Returns:
+            bool: False once the reader has stopped reading.
+        """
+        while not self._abandoned.is_set():
+            try:
+                self._chunks.put(chunk, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def abandon(self) -> None:
+        """Called by the reader when it stops early, so feeding never blocks."""
+        self._abandoned.set()
+
+    def fail(self) -> None:
+        """Called by the event loop when the body breaks off, so reading never blocks."""
+        self._failed.set()
+
+
+async def consume_request_body(request: Request, consume: Callable[[BinaryIO], Any]) -> Any:
+    """Run blocking ``consume`` on the request body while it is still arriving.
+
+    Args:
+        request (Request): The incoming request.
+        consume (Callable[[BinaryIO], Any]): Reads the body as a binary file;
+            runs on a worker thread.
+
+    Returns:
+        Any: What ``consume`` returned. Its exceptions are re-raised.
+
+    Raises:
+        ClientDisconnect: If the client went away mid-upload; ``consume``
+            sees an ``OSError`` and has finished when this is raised.
+    """
+    reader = BodyStreamReader()
+
+    def run() -> Any:
+        try:
+            return consume(io.BufferedReader(reader))
+        finally:
+            reader.abandon()
+
+    task = asyncio.ensure_future(run_in_threadpool(run))
+    try:
+        async for chunk in request.stream():
+            if chunk and not await run_in_threadpool(reader.feed, chunk):
+                break
+    except BaseException:
+        # Let ``consume`` fail and return its thread and session before giving up
+        reader.fail()
+        await asyncio.wait([task])
+        if not task.cancelled():
+            task.exception()  # retrieved; the stream's error is the one raised
+        raise
+    await run_in_threadpool(reader.feed, None)
+    return await task
+
+
+class BodyStreamWriter(io.RawIOBase):
+    """Writable file object whose data the event loop sends as it arrives.
+
+    Small writes (COPY writes one row at a time) are gathered into chunks
+    of ``chunk_size`` bytes. The queue is bounded, so a slow client
+    applies backpressure to the writer.
+    """
+
+    def __init__(self, max_chunks: int = 8, chunk_size: int = 64 * 1024):
+        self._chunks: queue.Queue[bytes] = queue.Queue(maxsize=max_chunks)
+        self._buffer = bytearray()
+        self._chunk_size = chunk_size
+        self._finished = threading.Event()
+        self._abandoned = threading.Event()
+
+    @property
+    def abandoned(self) -> bool:
+        return self._abandoned.is_set()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        if len(self._buffer) >= self._chunk_size:
+            self.flush()
+        return len(data)
+
+    def flush(self) -> None:
+        """Queue the buffered data; blocks while the queue is full.
+
+        Raises:
+            BrokenPipeError: If the client went away.
+        """
+        while self._buffer:
+            if self._abandoned.is_set():
+                raise BrokenPipeError("response body is no longer read")
+            try:
+                self._chunks.put(bytes(self._buffer), timeout=0.1)
+            except queue.Full:
+                continue
+            self._buffer.clear()
+
+    def finish(self) -> None:
+        """Mark the end of the body; called by the writer when it is done."""
+        self._finished.set()
+
+    def abandon(self) -> None:
+        """Called by the event loop when it stops sending, so writing never blocks."""
+        self._abandoned.set()
+
+    def next_chunk(self) -> bytes | None:
+        """Wait for the next chunk.
+
+        Returns:
+            bytes | None: The chunk, or None once the writer finished and
+                every chunk was taken.
+        """
+        while True:
+            try:
+                return self._chunks.get(timeout=0.1)
+            except queue.Empty:
+                if self._finished.is_set() and self._chunks.empty():
+                    return None
+
+
+async def produce_response_body(produce: Callable[[BinaryIO], Any]) -> AsyncIterator[bytes]:
+    """Run blocking ``produce`` and yield what it writes while it writes.
+
+    Meant as the body of a ``StreamingResponse``. If the client
+    disconnects, the next write raises ``BrokenPipeError`` inside
+    ``produce`` so it stops early.
+
+    Args:
+        produce (Callable[[BinaryIO], Any]): Writes the body to a binary
+            file; runs on a worker thread.
+
+    Yields:
+        bytes: Body chunks. Errors of ``produce`` are re-raised after the
+            chunks written before them.
+    """
+    writer = BodyStreamWriter()
+
+    def run() -> None:
+        try:
+            produce(writer)
+            writer.flush()
+        except BrokenPipeError:
+            if not writer.abandoned:
+                raise
+        finally:
+            writer.finish()
+
+    task = asyncio.ensure_future(run_in_threadpool(run))
+    try:
+        while (chunk := await run_in_threadpool(writer.next_chunk)) is not None:
+            yield chunk
+        await task
+    finally:
+        writer.abandon()
@@ -1,7 +1,11 @@
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 
-from sqlalchemy.orm import Session
-from src.db.session import SessionLocal
+from Cryptodome.PublicKey.RSA import RsaKey
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+from src.budgetbuddy.banking.bunq.callback import load_server_public_key
+from src.db.session import SessionLocal, get_async_sessionmaker
 
 
 def get_db() -> Iterator[Session]:
@@ -10,3 +14,24 @@ def get_db() -> Iterator[Session]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Session of the async engine, for routes that run on the event loop."""
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+def get_session_factory() -> sessionmaker:
+    """Session factory for work that outlives the request, e.g. background tasks."""
+    return SessionLocal
+
+
+def get_bunq_server_public_key() -> RsaKey:
+    """Bunq server public key used to verify callbacks."""
+    try:
+        return load_server_public_key()
+    except (OSError, AttributeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Bunq API context not configured"
+        ) from exc
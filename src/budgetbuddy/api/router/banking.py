@@ -0,0 +1,101 @@
+"""Banking API router."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from Cryptodome.PublicKey.RSA import RsaKey
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.budgetbuddy.api.deps import get_bunq_server_public_key, get_db, get_session_factory
+from src.budgetbuddy.banking.bunq import callback
+from src.budgetbuddy.banking.bunq.jobs import BUNQ_SYNC_JOB
+from src.budgetbuddy.banking.schemas.job import BunqSyncJobCreate, JobRead
+from src.budgetbuddy.banking.schemas.monetaryaccount import MonetaryAccountBalanceRead, MonetaryAccountRead
+from src.budgetbuddy.services import job_service
+from src.budgetbuddy.services import monetary_account_service as service
+from src.db.schema.job import Job
+from src.db.schema.monetary_account_balance import MonetaryAccountBalance
+from src.db.schema.monetaryaccount import MonetaryAccount
+
+router = APIRouter(prefix="/banking", tags=["banking"])
+
+
+@router.get("/accounts", response_model=list[MonetaryAccountRead])
+def list_accounts(external_source: str | None = None, db: Session = Depends(get_db)) -> Sequence[MonetaryAccount]:
+    """List synced monetary accounts with their latest balance."""
+    return service.list_monetary_accounts(db, external_source=external_source)
+
+
+@router.get("/accounts/{itemid}/balances", response_model=list[MonetaryAccountBalanceRead])
+def list_account_balances(
+    itemid: UUID,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int = 500,
+    db: Session = Depends(get_db),
+) -> Sequence[MonetaryAccountBalance]:
+    """List balance snapshots of an account, newest first."""
+    if not service.get_monetary_account(db, itemid):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Monetary account not found")
+    try:
+        return service.list_balance_snapshots(db, itemid, start=start, end=end, limit=limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+def _ingest_pushed_payment(session_factory: sessionmaker, payment: dict[str, Any]) -> None:
+    with session_factory() as db:
+        callback.ingest_payment(db, payment)
+
+
+@router.post("/bunq/callback", status_code=status.HTTP_202_ACCEPTED)
+async def bunq_callback(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    public_key: RsaKey = Depends(get_bunq_server_public_key),
+    session_factory: sessionmaker = Depends(get_session_factory),
+) -> dict[str, Any]:
+    """Receive a Bunq notification callback and ingest its payment.
+
+    The signature is checked against the raw body before anything is
+    parsed. The payment is upserted after the response is sent, so Bunq
+    gets its acknowledgement immediately.
+    """
+    body = await request.body()
+    if not callback.verify_signature(public_key, body, request.headers.get(callback.SIGNATURE_HEADER)):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Bunq signature")
+
+    try:
+        notification = json.loads(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Body is not valid JSON") from exc
+
+    payment = callback.extract_payment(notification)
+    if payment is None:
+        return {"status": "ignored"}
+
+    background_tasks.add_task(_ingest_pushed_payment, session_factory, payment)
+    return {"status": "accepted", "payment_id": payment["id"]}
+
+
+@router.post("/bunq/sync", response_model=JobRead, status_code=status.HTTP_202_ACCEPTED)
+def enqueue_bunq_sync(request: BunqSyncJobCreate, db: Session = Depends(get_db)) -> Job:
+    """Queue a Bunq sync for the job workers; poll its status via /banking/jobs/{itemid}."""
+    return job_service.enqueue_job(
+        db, BUNQ_SYNC_JOB, request.model_dump(exclude={"priority"}), priority=request.priority
+    )
+
+
+@router.get("/jobs/{itemid}", response_model=JobRead)
+def get_job(itemid: UUID, db: Session = Depends(get_db)) -> Job:
+    """Get the status and result of a background job."""
+    job = job_service.get_job(db, itemid)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
@@ -4,21 +4,39 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from datetime import datetime
+from typing import Any, BinaryIO
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
 
-from src.budgetbuddy.api.deps import get_db
+from src.budgetbuddy.api.body_stream import consume_request_body, produce_response_body
+from src.budgetbuddy.api.deps import get_db, get_session_factory
 from src.budgetbuddy.banking.schemas.transaction import (
+    TransactionBulkResult,
+    TransactionBulkUpdate,
     TransactionCreate,
+    TransactionFilters,
     TransactionRead,
     TransactionUpdate,
 )
+from src.budgetbuddy.banking.statements.base import StatementParseError
+from src.budgetbuddy.banking.statements.importer import StatementFormat, import_statement
+from src.budgetbuddy.services import transaction_export_service as export_service
 from src.budgetbuddy.services import transaction_service as service
+from src.budgetbuddy.services.transaction_export_service import ArrowExportFormat
+from src.budgetbuddy.services.transaction_service import TransactionOrder
 from src.db.schema.transaction import Transaction
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
+# Imports, exports and bulk writes, served on the sync engine by both stacks.
+# Include before ``router``, whose /{itemid} routes would match /export.csv and /bulk.
+bulk_router = APIRouter(prefix="/transactions", tags=["transactions"])
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Most items accepted by one bulk request
+MAX_BULK_ITEMS = 1000
 
 
 @router.post("/", response_model=TransactionRead, status_code=status.HTTP_201_CREATED)
@@ -30,20 +48,232 @@ def create_transaction(payload: TransactionCreate, db: Session = Depends(get_db)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
+@bulk_router.post("/bulk", response_model=list[TransactionBulkResult])
+def create_transactions_bulk(
+    payload: list[TransactionCreate] = Body(..., max_length=MAX_BULK_ITEMS), db: Session = Depends(get_db)
+) -> list[TransactionBulkResult]:
+    """Create many transactions at once, reporting the outcome of each.
+
+    Items with an existing external_id are skipped and items that fail
+    validation are reported as invalid; the rest are created.
+    """
+    return service.create_transactions_bulk_results(db, payload)
+
+
+@bulk_router.patch("/bulk", response_model=list[TransactionBulkResult])
+def update_transactions_bulk(
+    payload: list[TransactionBulkUpdate] = Body(..., max_length=MAX_BULK_ITEMS), db: Session = Depends(get_db)
+) -> list[TransactionBulkResult]:
+    """Update many transactions at once; each item names its transaction by ``itemid``."""
+    return service.update_transactions_bulk(db, payload)
+
+
+@bulk_router.delete("/bulk", response_model=list[TransactionBulkResult])
+def delete_transactions_bulk(
+    payload: list[UUID] = Body(..., max_length=MAX_BULK_ITEMS), db: Session = Depends(get_db)
+) -> list[TransactionBulkResult]:
+    """Delete many transactions at once, given a list of their IDs."""
+    return service.delete_transactions_bulk(db, payload)
+
+
+@bulk_router.post("/import", status_code=status.HTTP_201_CREATED)
+async def import_statement_file(
+    request: Request,
+    statement_format: StatementFormat | None = Query(None, alias="format"),
+    account: str | None = None,
+    db: Session = Depends(get_db),
+) -> dict[str, Any]:
+    """Import a CAMT.053, MT940 or CSV statement sent as the raw request body.
+
+    The body is parsed while it is uploaded and upserted in batches, so
+    large statements are never held in memory. Re-importing a statement
+    is idempotent. The format is guessed when not given; ``account`` names
+    the account for statements that do not (such as CSV exports).
+    """
+
+    def run(stream: BinaryIO) -> dict[str, Any]:
+        return import_statement(db, stream, statement_format, account=account)
+
+    try:
+        return await consume_request_body(request, run)
+    except StatementParseError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+def uses_offset(offset: int, cursor: str | None) -> bool:
+    """Whether a listing request pages by offset rather than by cursor.
+
+    Raises:
+        ValueError: If both are given.
+    """
+    if offset and cursor is not None:
+        raise ValueError("offset cannot be combined with cursor")
+    return bool(offset)
+
+
 @router.get("/", response_model=list[TransactionRead])
 def list_transactions(
+    response: Response,
     offset: int = 0,
     limit: int = 100,
     start: datetime | None = None,
     end: datetime | None = None,
+    cursor: str | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters = Depends(),
     db: Session = Depends(get_db),
 ) -> Sequence[Transaction]:
-    """List transactions with optional date filtering."""
+    """List transactions, optionally filtered by date and TransactionFilters.
+
+    Pages are keyset-paginated: when more rows follow, the
+    ``X-Next-Cursor`` header holds the cursor of the next page, which
+    stays fast at any depth. ``offset`` is still accepted for existing
+    clients but cannot be combined with ``cursor``.
+    """
+    try:
+        if uses_offset(offset, cursor):
+            return service.list_transactions(
+                db,
+                offset=offset,
+                limit=limit,
+                start=start,
+                end=end,
+                order_by=order_by,
+                descending=descending,
+                filters=filters,
+            )
+        items, next_cursor = service.list_transactions_page(
+            db,
+            limit=limit,
+            cursor=cursor,
+            start=start,
+            end=end,
+            order_by=order_by,
+            descending=descending,
+            filters=filters,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return items
+
+
+@bulk_router.get("/export.csv", response_class=StreamingResponse)
+def export_transactions(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters = Depends(),
+    session_factory: sessionmaker = Depends(get_session_factory),
+) -> StreamingResponse:
+    """Stream transactions as CSV, with the filters of the listing.
+
+    PostgreSQL renders the CSV with ``COPY ... TO STDOUT`` and its output
+    is sent while it is produced, so exports of any size use flat memory.
+    """
+    try:
+        query = service.transaction_export_query(
+            start=start, end=end, order_by=order_by, descending=descending, filters=filters
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    def produce(destination: BinaryIO) -> None:
+        # The response outlives the request's dependencies, so it gets its own session
+        with session_factory() as db:
+            service.export_transactions_csv(db, destination, query)
+
+    return StreamingResponse(
+        produce_response_body(produce),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="transactions.csv"'},
+    )
+
+
+ARROW_MEDIA_TYPES = {"parquet": "application/vnd.apache.parquet", "arrow": "application/vnd.apache.arrow.stream"}
+
+
+def _arrow_export(
+    file_format: ArrowExportFormat,
+    start: datetime | None,
+    end: datetime | None,
+    order_by: TransactionOrder,
+    descending: bool,
+    filters: TransactionFilters,
+    session_factory: sessionmaker,
+) -> StreamingResponse:
+    """Stream transactions as a Parquet file or Arrow IPC stream.
+
+    The query is built and checked before the response starts, so errors
+    still get a proper status code instead of a truncated body.
+
+    Args:
+        file_format (ArrowExportFormat): "parquet" or "arrow".
+        start (datetime | None): Filter by created >= start.
+        end (datetime | None): Filter by created <= end.
+        order_by (TransactionOrder): Column to order the rows by.
+        descending (bool): Whether to order in descending order.
+        filters (TransactionFilters): Listing filters.
+        session_factory (sessionmaker): Creates the session the export
+            streams from, opened once the body is produced.
+
+    Returns:
+        StreamingResponse: The file as an attachment.
+
+    Raises:
+        HTTPException: 501 if pyarrow is not installed, 400 if the filters
+            are invalid.
+    """
     try:
-        return service.list_transactions(db, offset=offset, limit=limit, start=start, end=end)
+        export_service.require_pyarrow()
+        query = export_service.arrow_export_query(
+            start=start, end=end, order_by=order_by, descending=descending, filters=filters
+        )
+    except RuntimeError as exc:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
+    def produce(destination: BinaryIO) -> None:
+        with session_factory() as db:
+            export_service.export_transactions_arrow(db, destination, file_format, query)
+
+    return StreamingResponse(
+        produce_response_body(produce),
+        media_type=ARROW_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="transactions.{file_format}"'},
+    )
+
+
+@bulk_router.get("/export.parquet", response_class=StreamingResponse)
+def export_transactions_parquet(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters = Depends(),
+    session_factory: sessionmaker = Depends(get_session_factory),
+) -> StreamingResponse:
+    """Stream transactions as a typed Parquet file, one row group per batch."""
+    return _arrow_export("parquet", start, end, order_by, descending, filters, session_factory)
+
+
+@bulk_router.get("/export.arrow", response_class=StreamingResponse)
+def export_transactions_arrow(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters = Depends(),
+    session_factory: sessionmaker = Depends(get_session_factory),
+) -> StreamingResponse:
+    """Stream transactions as an Arrow IPC stream, e.g. for ``pyarrow.ipc.open_stream``."""
+    return _arrow_export("arrow", start, end, order_by, descending, filters, session_factory)
+
 
 @router.get("/{itemid}", response_model=TransactionRead)
 def get_transaction(itemid: UUID, db: Session = Depends(get_db)) -> Transaction:
@@ -0,0 +1,112 @@
+"""Transaction CRUD routes on the async database engine.
+
+Same paths and behavior as the routes in ``transaction.router``, but the
+handlers are coroutines that await an ``AsyncSession``, so a slow query
+does not hold one of the threadpool's slots. Served instead of the sync
+routes when ``BB_ASYNC_API`` is set.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.budgetbuddy.api.deps import get_async_db
+from src.budgetbuddy.api.router.transaction import NEXT_CURSOR_HEADER, uses_offset
+from src.budgetbuddy.banking.schemas.transaction import (
+    TransactionCreate,
+    TransactionFilters,
+    TransactionRead,
+    TransactionUpdate,
+)
+from src.budgetbuddy.services import async_transaction_service as service
+from src.budgetbuddy.services.transaction_service import TransactionOrder
+from src.db.schema.transaction import Transaction
+
+router = APIRouter(prefix="/transactions", tags=["transactions"])
+
+
+@router.post("/", response_model=TransactionRead, status_code=status.HTTP_201_CREATED)
+async def create_transaction(payload: TransactionCreate, db: AsyncSession = Depends(get_async_db)) -> Transaction:
+    """Create a new transaction."""
+    try:
+        return await service.create_transaction(db, payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get("/", response_model=list[TransactionRead])
+async def list_transactions(
+    response: Response,
+    offset: int = 0,
+    limit: int = 100,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    cursor: str | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+) -> Sequence[Transaction]:
+    """List transactions; the next page's cursor is in the ``X-Next-Cursor`` header."""
+    try:
+        if uses_offset(offset, cursor):
+            return await service.list_transactions(
+                db,
+                offset=offset,
+                limit=limit,
+                start=start,
+                end=end,
+                order_by=order_by,
+                descending=descending,
+                filters=filters,
+            )
+        items, next_cursor = await service.list_transactions_page(
+            db,
+            limit=limit,
+            cursor=cursor,
+            start=start,
+            end=end,
+            order_by=order_by,
+            descending=descending,
+            filters=filters,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return items
+
+
+@router.get("/{itemid}", response_model=TransactionRead)
+async def get_transaction(itemid: UUID, db: AsyncSession = Depends(get_async_db)) -> Transaction:
+    """Get a single transaction by ID."""
+    tx = await service.get_transaction(db, itemid)
+    if not tx:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
+    return tx
+
+
+@router.patch("/{itemid}", response_model=TransactionRead)
+async def update_transaction(
+    itemid: UUID, payload: TransactionUpdate, db: AsyncSession = Depends(get_async_db)
+) -> Transaction:
+    """Update a transaction."""
+    tx = await service.update_transaction(db, itemid, payload)
+    if not tx:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
+    return tx
+
+
+@router.delete("/{itemid}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_transaction(itemid: UUID, db: AsyncSession = Depends(get_async_db)) -> None:
+    """Delete a transaction."""
+    deleted = await service.delete_transaction(db, itemid)
+    if not deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
+    return None
@@ -1,9 +1,93 @@
 """Adapter for converting Bunq SDK objects to domain models."""
 
-from bunq.sdk.model.generated.endpoint import PaymentApiObject
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from typing import Any
+
+from bunq.sdk.model.generated.endpoint import (
+    MonetaryAccountBankApiObject,
+    MonetaryAccountSavingsApiObject,
+    PaymentApiObject,
+)
 from pydantic import BaseModel
 
+from src.budgetbuddy.banking.schemas.monetaryaccount import MonetaryAccountCreate
 from src.budgetbuddy.banking.schemas.transaction import TransactionCreate
+from src.budgetbuddy.services.transaction_service import (
+    COPY_COLUMNS,
+    SOURCE_COLUMNS,
+    hash_source_values,
+    validate_transaction_rows,
+)
+
+BUNQ_BIC = "BUNQNL2A"
+
+
+def payment_values(payment: Mapping[str, Any]) -> dict[str, Any]:
+    """Map one Bunq payment, in its API JSON shape, to transaction fields.
+
+    The single source of truth for how a Bunq payment becomes a
+    transaction: both the SDK adapter and the raw fast path go through it,
+    so live syncs and archive replays store identical rows.
+
+    Args:
+        payment (Mapping[str, Any]): Decoded ``Payment`` object as found in
+            a payment listing response.
+
+    Returns:
+        dict[str, Any]: Values for every ``TransactionCreate`` field.
+    """
+    amount = payment.get("amount")
+    alias = payment.get("counterparty_alias") or {}
+
+    return {
+        "amount": abs(float(amount["value"])) if amount else 0.0,
+        "currency": amount["currency"] if amount else "EUR",
+        "description": payment.get("description") or None,
+        "transaction_type": payment.get("type"),
+        "counterparty_name": alias.get("display_name"),
+        "counterparty_iban": alias.get("iban"),
+        "category": None,
+        "tags": None,
+        "notes": None,
+        "external_source": "bunq",
+        "external_id": f"bunq_{payment['id']}",
+        "external_created_at": _timestamp(payment.get("created")),
+        "external_updated_at": _timestamp(payment.get("updated")),
+    }
+
+
+def _timestamp(value: str | datetime | None) -> datetime | None:
+    """Parse a Bunq timestamp, passing through values that are already parsed."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value) if value else None
+    return value
+
+
+def _payment_json(payment: PaymentApiObject) -> dict[str, Any]:
+    """Read the fields ``payment_values`` maps back into the API JSON shape.
+
+    ``converter.serialize`` is not used because it writes the counterparty
+    as a pointer (name/type/value) rather than the label the API sends.
+    """
+    amount = payment.amount
+    alias = getattr(payment, "counterparty_alias", None)
+    # The SDK wraps the counterparty label as label_monetary_account; raw, it is the label itself
+    label = (getattr(alias, "label_monetary_account", None) or alias) if alias else None
+
+    return {
+        "id": payment.id_,
+        "amount": {"value": amount.value, "currency": amount.currency} if amount else None,
+        "description": payment.description,
+        "type": getattr(payment, "type_", None),
+        "counterparty_alias": (
+            {"display_name": getattr(label, "display_name", None), "iban": getattr(label, "iban", None)}
+            if label
+            else None
+        ),
+        "created": getattr(payment, "created", None),
+        "updated": getattr(payment, "updated", None),
+    }
 
 
 class BunqPaymentAdapter(BaseModel):
@@ -23,33 +107,7 @@ class BunqPaymentAdapter(BaseModel):
         Returns:
             TransactionCreate: Domain model ready for database insertion.
         """
-        amount = float(payment.amount.value) if payment.amount else 0.0
-        currency = payment.amount.currency if payment.amount else "EUR"
-        alias = getattr(payment, "counterparty_alias", None)
-        label = getattr(alias, "label_monetary_account", None) if alias else None
-
-        if label:
-            counterparty_name = getattr(label, "display_name", None)
-            counterparty_iban = getattr(label, "iban", None)
-        else:
-            counterparty_name = getattr(alias, "display_name", None) if alias else None
-            counterparty_iban = getattr(alias, "iban", None) if alias else None
-
-        return TransactionCreate(
-            amount=abs(amount),
-            currency=currency,
-            description=payment.description if payment.description else None,
-            transaction_type=payment.type_ if hasattr(payment, "type_") else None,
-            counterparty_name=counterparty_name,
-            counterparty_iban=counterparty_iban,
-            external_source="bunq",
-            external_id=f"bunq_{payment.id_}",
-            external_created_at=payment.created if hasattr(payment, "created") else None,
-            external_updated_at=payment.updated if hasattr(payment, "updated") else None,
-            category=None,
-            tags=None,
-            notes=None,
-        )
+        return TransactionCreate(**payment_values(_payment_json(payment)))
 
     @staticmethod
     def to_transaction_creates(payments: list[PaymentApiObject]) -> list[TransactionCreate]:
@@ -62,3 +120,86 @@ class BunqPaymentAdapter(BaseModel):
             list[TransactionCreate]: List of domain models.
         """
         return [BunqPaymentAdapter.to_transaction_create(p) for p in payments]
+
+
+class BunqRawPaymentAdapter:
+    """Bulk fast path from raw Bunq payment JSON to bulk transaction rows.
+
+    Maps each payment with the same ``payment_values`` as
+    ``BunqPaymentAdapter``, but reads the decoded JSON directly instead of
+    SDK objects and validates once per batch instead of once per row. Use
+    it where raw payloads are at hand (archive replay, backfills).
+    """
+
+    @staticmethod
+    def to_transaction_rows(payments: Iterable[Mapping[str, Any]]) -> list[tuple]:
+        """Convert raw payment objects to rows for the bulk loaders.
+
+        Args:
+            payments (Iterable[Mapping[str, Any]]): Decoded ``Payment``
+                objects as found in a payment listing response.
+
+        Returns:
+            list[tuple]: Validated rows in COPY_COLUMNS order, ready for
+                ``create_transaction_rows_bulk``/``upsert_transaction_rows_bulk``.
+
+        Raises:
+            pydantic.ValidationError: If any payment maps to an invalid row.
+        """
+        rows = []
+
+        for payment in payments:
+            values = payment_values(payment)
+            values["content_hash"] = hash_source_values(values[column] for column in SOURCE_COLUMNS)
+            rows.append(tuple(values[column] for column in COPY_COLUMNS))
+
+        return validate_transaction_rows(rows)
+
+
+class BunqMonetaryAccountAdapter(BaseModel):
+    """Adapter to map Bunq monetary account objects to MonetaryAccountCreate schemas."""
+
+    @staticmethod
+    def to_monetary_account_create(
+        account: MonetaryAccountBankApiObject | MonetaryAccountSavingsApiObject,
+    ) -> MonetaryAccountCreate:
+        """
+        Convert a Bunq monetary account to a MonetaryAccountCreate schema.
+
+        Args:
+            account (MonetaryAccountBankApiObject | MonetaryAccountSavingsApiObject):
+                The Bunq account object from SDK.
+
+        Returns:
+            MonetaryAccountCreate: Domain model ready for database upsert.
+        """
+        balance = getattr(account, "balance", None)
+        iban_alias = next((alias for alias in account.alias or [] if alias.type_ == "IBAN"), None)
+
+        return MonetaryAccountCreate(
+            account_name=account.description or (iban_alias.name if iban_alias else None) or f"Bunq {account.id_}",
+            account_type="savings" if isinstance(account, MonetaryAccountSavingsApiObject) else "checking",
+            currency=balance.currency if balance else account.currency,
+            balance=float(balance.value) if balance else 0.0,
+            iban=iban_alias.value if iban_alias else None,
+            bic=BUNQ_BIC if iban_alias else None,
+            account_status=account.status,
+            external_source="bunq",
+            external_id=f"bunq_{account.id_}",
+            external_created_at=account.created,
+            external_updated_at=account.updated,
+        )
+
+    @staticmethod
+    def to_monetary_account_creates(
+        accounts: list[MonetaryAccountBankApiObject | MonetaryAccountSavingsApiObject],
+    ) -> list[MonetaryAccountCreate]:
+        """Convert multiple Bunq accounts to MonetaryAccountCreate schemas.
+
+        Args:
+            accounts (list): List of Bunq monetary account objects.
+
+        Returns:
+            list[MonetaryAccountCreate]: List of domain models.
+        """
+        return [BunqMonetaryAccountAdapter.to_monetary_account_create(a) for a in accounts]
@@ -0,0 +1,146 @@
+"""Append-only archive of raw Bunq payment pages.
+
+Every page fetched from the payment listing can be written to a gzip file
+per monetary account, exactly as Bunq returned it. Replaying the archive
+rebuilds the payments without any API calls, so mapping changes can be
+applied to the full history at disk speed.
+
+Each record is two lines: a JSON header with the account and the payment
+ID range of the page, followed by the raw response body. Records are
+appended as separate gzip members, which ``gzip`` reads back as a single
+stream, so appending never rewrites earlier data.
+"""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import json
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from bunq.sdk.json import converter
+from bunq.sdk.model.generated.endpoint import PaymentApiObject
+
+from src.common.log.logger import get_logger
+
+logger = get_logger(__name__)
+
+ARCHIVE_SUFFIX = ".jsonl.gz"
+
+
+@dataclass
+class ArchivedPage:
+    """One archived payment page."""
+
+    monetary_account_id: int
+    min_payment_id: int
+    max_payment_id: int
+    fetched_at: str
+    body: bytes
+
+    def raw_payments(self) -> list[dict[str, Any]]:
+        """Decode the raw body into plain payment dicts, newest first.
+
+        Returns:
+            list[dict[str, Any]]: The ``Payment`` objects of the page.
+        """
+        return [item[PaymentApiObject._OBJECT_TYPE_GET] for item in json.loads(self.body)["Response"]]
+
+    def payments(self) -> list[PaymentApiObject]:
+        """Parse the raw body into SDK payment objects, as the listing endpoint does.
+
+        Returns:
+            list[PaymentApiObject]: Payments of the page, newest first.
+        """
+        return [converter.deserialize(PaymentApiObject, payment) for payment in self.raw_payments()]
+
+
+class PaymentArchive:
+    """Directory of per-account gzip archives of raw payment pages.
+
+    Safe to share between the fetch worker threads of a client.
+    """
+
+    def __init__(self, root: str | Path):
+        """Initialize the archive, creating its directory if needed.
+
+        Args:
+            root (str | Path): Directory holding one file per account.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def path_for(self, monetary_account_id: int) -> Path:
+        return self.root / f"{monetary_account_id}{ARCHIVE_SUFFIX}"
+
+    def append(self, monetary_account_id: int, body: bytes, payment_ids: Iterable[int]) -> bool:
+        """Archive the raw body of one payment page.
+
+        Args:
+            monetary_account_id (int): Account the page belongs to.
+            body (bytes): Response body as returned by Bunq.
+            payment_ids (Iterable[int]): IDs of the payments on the page.
+
+        Returns:
+            bool: True if the page was archived, False for an empty page.
+        """
+        payment_ids = list(payment_ids)
+        if not payment_ids:
+            return False
+
+        header = {
+            "monetary_account_id": monetary_account_id,
+            "min_payment_id": min(payment_ids),
+            "max_payment_id": max(payment_ids),
+            "fetched_at": datetime.datetime.now(datetime.UTC).isoformat(),
+        }
+        # Newlines in a JSON document can only be whitespace between tokens,
+        # so flattening them keeps the body intact and on a single line
+        flat_body = body.replace(b"\r", b" ").replace(b"\n", b" ")
+        member = gzip.compress(json.dumps(header).encode() + b"\n" + flat_body + b"\n")
+
+        with self._lock, open(self.path_for(monetary_account_id), "ab") as archive_file:
+            archive_file.write(member)
+        return True
+
+    def account_ids(self) -> list[int]:
+        """IDs of all accounts with an archive file."""
+        return sorted(int(path.name.removesuffix(ARCHIVE_SUFFIX)) for path in self.root.glob(f"*{ARCHIVE_SUFFIX}"))
+
+    def iter_pages(
+        self,
+        account_ids: Iterable[int] | None = None,
+        min_payment_id: int | None = None,
+    ) -> Iterator[ArchivedPage]:
+        """Read archived pages in the order they were fetched, per account.
+
+        Pages fetched more than once (e.g. the overlap of incremental runs)
+        are all yielded; later records reflect the later state on Bunq.
+
+        Args:
+            account_ids (Iterable[int] | None): Only these accounts.
+                Defaults to every archived account.
+            min_payment_id (int | None): Skip pages without any payment at
+                or above this ID, without parsing their bodies.
+
+        Yields:
+            ArchivedPage: Archived pages.
+        """
+        for account_id in self.account_ids() if account_ids is None else account_ids:
+            path = self.path_for(account_id)
+            if not path.exists():
+                logger.warning("No archive for account %s at %s", account_id, path)
+                continue
+
+            with gzip.open(path, "rb") as archive_file:
+                for header_line in archive_file:
+                    body = archive_file.readline().rstrip(b"\n")
+                    header = json.loads(header_line)
+                    if min_payment_id is not None and header["max_payment_id"] < min_payment_id:
+                        continue
+                    yield ArchivedPage(body=body, **header)
@@ -0,0 +1,105 @@
+"""Push ingestion of Bunq payments through notification filter callbacks.
+
+Bunq POSTs a ``NotificationUrl`` to the registered URL whenever a payment
+is made on an account. The body is signed with Bunq's server key, the same
+key that signs API responses, so callbacks are verified against the server
+public key stored in the API context. A verified notification carries the
+full payment, which is upserted on its own without any API call.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from bunq.sdk.context.api_context import ApiContext
+from Cryptodome.Hash import SHA256
+from Cryptodome.PublicKey.RSA import RsaKey
+from Cryptodome.Signature import pkcs1_15
+from sqlalchemy.orm import Session
+
+from src.budgetbuddy.banking.bunq.adapter import BunqRawPaymentAdapter
+from src.budgetbuddy.services.transaction_service import upsert_transaction_rows_bulk
+from src.common.log.logger import get_logger
+
+logger = get_logger(__name__)
+
+SIGNATURE_HEADER = "X-Bunq-Server-Signature"
+# Notification categories that carry payments
+PAYMENT_CATEGORIES = ("MUTATION", "PAYMENT")
+
+
+def verify_signature(public_key: RsaKey, body: bytes, signature: str | None) -> bool:
+    """Check a callback body against Bunq's server signature.
+
+    Args:
+        public_key (RsaKey): Bunq server public key.
+        body (bytes): Raw request body.
+        signature (str | None): Base64 value of the X-Bunq-Server-Signature header.
+
+    Returns:
+        bool: True if the signature is present and valid.
+    """
+    if not signature:
+        return False
+    try:
+        pkcs1_15.new(public_key).verify(SHA256.new(body), base64.b64decode(signature, validate=True))
+    except (ValueError, binascii.Error):
+        return False
+    return True
+
+
+def extract_payment(notification: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the raw payment of a payment notification.
+
+    Args:
+        notification (dict[str, Any]): Decoded callback body.
+
+    Returns:
+        dict[str, Any] | None: The ``Payment`` object, or None if the
+            notification is not about a payment.
+    """
+    notification_url = notification.get("NotificationUrl") or {}
+    if notification_url.get("category") not in PAYMENT_CATEGORIES:
+        return None
+
+    anchor = notification_url.get("object") or {}
+    payment = anchor.get("Payment") or (anchor.get("Mutation") or {}).get("Payment")
+    return payment if payment and payment.get("id") is not None else None
+
+
+def ingest_payment(db: Session, payment: dict[str, Any]) -> tuple[int, int, int]:
+    """Upsert a single pushed payment.
+
+    Safe to repeat: Bunq retries callbacks, and the upsert only rewrites
+    the row when the payment changed.
+
+    Args:
+        db (Session): Database session.
+        payment (dict[str, Any]): Raw Bunq payment.
+
+    Returns:
+        tuple[int, int, int]: (inserted, updated, unchanged).
+    """
+    counts = upsert_transaction_rows_bulk(db, BunqRawPaymentAdapter.to_transaction_rows([payment]))
+    logger.info("Ingested pushed Bunq payment %s (inserted, updated, unchanged: %s)", payment["id"], counts)
+    return counts
+
+
+@lru_cache(maxsize=1)
+def load_server_public_key(config_path: str | None = None) -> RsaKey:
+    """Load Bunq's server public key from the API context file.
+
+    Args:
+        config_path (str | None): Path to bunq_api_context.conf. Defaults to
+            BUNQ_CONFIG_PATH or ~/.bunq/bunq_api_context.conf.
+
+    Returns:
+        RsaKey: The key Bunq signs responses and callbacks with.
+    """
+    path = config_path or os.getenv("BUNQ_CONFIG_PATH", str(Path.home() / ".bunq" / "bunq_api_context.conf"))
+    return ApiContext.restore(path).installation_context.public_key_server
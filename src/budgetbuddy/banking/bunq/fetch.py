@@ -1,42 +1,101 @@
 """Bunq API client for fetching monetary accounts and payments."""
 
+import json
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from bunq import Pagination
-from bunq.sdk.context.api_context import ApiContext
 from bunq.sdk.context.bunq_context import BunqContext
+from bunq.sdk.http.api_client import ApiClient
 from bunq.sdk.model.generated.endpoint import (
     MonetaryAccountBankApiObject,
     MonetaryAccountSavingsApiObject,
+    NotificationFilterUrlMonetaryAccountApiObject,
     PaymentApiObject,
 )
+from bunq.sdk.model.generated.object_ import NotificationFilterUrlObject
+from src.budgetbuddy.banking.bunq.archive import PaymentArchive
+from src.budgetbuddy.banking.bunq.rate_limit import BunqRateLimiter
+from src.budgetbuddy.banking.bunq.session import BunqSessionManager
 from src.common.log.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class AccountPayments:
+    """Payments fetched for a single monetary account."""
+
+    monetary_account_id: int
+    payments: list[PaymentApiObject] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+
+@dataclass
+class PaymentPage:
+    """A single page of payments for one monetary account."""
+
+    monetary_account_id: int
+    payments: list[PaymentApiObject]
+    is_last: bool
+    elapsed_seconds: float = 0.0
+    # Cursor of the next (older) page, None on the last page
+    older_id: int | None = None
+
+
 class BunqClient:
     """Client for interacting with Bunq API.
 
     Encapsulates API context management and provides methods for
-    fetching accounts and payments.
+    fetching accounts and payments. All API calls go through a shared
+    rate limiter, so several accounts can be paged concurrently without
+    exceeding Bunq's per-endpoint request limits.
     """
 
-    def __init__(self, config_path: str | Path):
+    def __init__(
+        self,
+        config_path: str | Path,
+        rate_limiter: BunqRateLimiter | None = None,
+        session: BunqSessionManager | None = None,
+        archive: PaymentArchive | None = None,
+    ):
         """Initialize Bunq client with API context.
 
         Args:
             config_path (str | Path): Path to bunq_api_context.conf file.
+            rate_limiter (BunqRateLimiter | None): Limiter shared by all
+                requests of this client. Defaults to Bunq's published limits.
+            session (BunqSessionManager | None): Manager of the persisted
+                context. Pass a shared one to reuse its live session across
+                clients. Defaults to a new manager for ``config_path``.
+            archive (PaymentArchive | None): When set, the raw body of every
+                fetched payment page is appended to this archive.
         """
         self.config_path = Path(config_path)
+        self.rate_limiter = rate_limiter or BunqRateLimiter()
+        self.session = session or BunqSessionManager(self.config_path)
+        self.archive = archive
         self._load_context()
 
     def _load_context(self) -> None:
         """Load and set the Bunq API context."""
-        api_context = ApiContext.restore(str(self.config_path))
+        api_context = self.session.load()
         BunqContext.load_api_context(api_context)
         logger.info("Bunq API context loaded from %s", self.config_path)
 
+    def save_context(self) -> bool:
+        """Persist the API context if the SDK refreshed its session.
+
+        Returns:
+            bool: True if the context file was rewritten.
+        """
+        return self.session.save_if_changed()
+
     def list_all_monetary_accounts(
         self, status: str | None = None
     ) -> list[MonetaryAccountBankApiObject | MonetaryAccountSavingsApiObject]:
@@ -51,11 +110,11 @@ class BunqClient:
         accounts = []
         logger.info("Fetching all Monetary Accounts with status filter: %s", status)
 
-        resp = MonetaryAccountBankApiObject.list()
+        resp = self.rate_limiter.call("monetary-account-bank", MonetaryAccountBankApiObject.list)
         if resp is not None and getattr(resp, "value", None):
             accounts.extend(resp.value)
 
-        resp = MonetaryAccountSavingsApiObject.list()
+        resp = self.rate_limiter.call("monetary-account-savings", MonetaryAccountSavingsApiObject.list)
         if resp is not None and getattr(resp, "value", None):
             accounts.extend(resp.value)
 
@@ -65,66 +124,386 @@ class BunqClient:
         logger.info("Found %d monetary accounts", len(accounts))
         return accounts
 
-    def fetch_payments_for_account(self, monetary_account_id: int, page_size: int = 50) -> list[PaymentApiObject]:
-        """Fetch all payments for a specific monetary account.
+    def iter_payment_pages(
+        self,
+        monetary_account_id: int,
+        page_size: int = 50,
+        since_id: int | None = None,
+        older_id: int | None = None,
+    ) -> Iterator[PaymentPage]:
+        """Lazily page through the payments of a monetary account.
+
+        Pages run from newest to oldest and the next page is only requested
+        once the caller asks for it, so at most one page is held in memory.
+        When ``since_id`` is given, paging stops as soon as a payment at or
+        below that ID is reached and only newer payments are yielded. Pass
+        the ``older_id`` of a previously yielded page to resume from there.
 
         Args:
             monetary_account_id (int): ID of the monetary account.
             page_size (int): Number of payments per page. Defaults to 50.
+            since_id (int | None): Newest payment ID already synced.
+                Defaults to None (page through the full history).
+            older_id (int | None): Start at the page older than this payment
+                ID instead of the newest page. Defaults to None.
 
-        Returns:
-            list[PaymentApiObject]: List of payment objects.
+        Yields:
+            PaymentPage: One page of payments. The final page has
+                ``is_last`` set, even if it holds no new payments.
         """
-        payments = []
-        logger.info("Fetching payments for account %s", monetary_account_id)
+        logger.info(
+            "Fetching payments for account %s (since payment %s, older than %s)",
+            monetary_account_id,
+            since_id,
+            older_id,
+        )
 
         pagination = Pagination()
         pagination.count = page_size
+        if older_id is None:
+            params = pagination.url_params_count_only
+        else:
+            pagination.older_id = older_id
+            params = pagination.url_params_previous_page
+
+        while True:
+            started = time.perf_counter()
+            response = self.rate_limiter.call("payment", self._list_payments, monetary_account_id, params)
+            elapsed = time.perf_counter() - started
+
+            if response is None:
+                logger.error("Failed to fetch payments for account %s", monetary_account_id)
+                return
+
+            page = response.value or []
+            new_payments = page if since_id is None else [p for p in page if p.id_ > since_id]
+            reached_watermark = len(new_payments) < len(page)
+            page_info = response.pagination
+            is_last = reached_watermark or not (page_info and page_info.has_previous_page())
 
-        response = PaymentApiObject.list(
-            monetary_account_id=monetary_account_id,
-            params=pagination.url_params_count_only,
+            yield PaymentPage(
+                monetary_account_id,
+                new_payments,
+                is_last,
+                elapsed,
+                older_id=None if is_last else page_info.older_id,
+            )
+
+            if is_last:
+                return
+            params = page_info.url_params_previous_page
+
+    def _list_payments(self, monetary_account_id: int, params: dict[str, str]):
+        """Request one payment page, archiving its raw body if enabled."""
+        if self.archive is None:
+            return PaymentApiObject.list(monetary_account_id=monetary_account_id, params=params)
+
+        # PaymentApiObject.list does not expose the response body, so issue
+        # the same request and parse it the same way
+        endpoint_url = PaymentApiObject._ENDPOINT_URL_LISTING.format(
+            BunqContext.user_context().user_id, monetary_account_id
         )
+        response_raw = ApiClient(BunqContext.api_context()).get(endpoint_url, params, {})
+        response = PaymentApiObject._from_json_list(response_raw, PaymentApiObject._OBJECT_TYPE_GET)
+        self.archive.append(monetary_account_id, response_raw.body_bytes, (p.id_ for p in response.value))
+        return response
 
-        if response is None:
-            logger.error("Failed to fetch payments for account %s", monetary_account_id)
-            return payments
+    def list_notification_filters(self, monetary_account_id: int) -> list[dict[str, str]]:
+        """List the URL notification filters of a monetary account.
 
-        payments.extend(response.value or [])
-        page_info = response.pagination
+        Args:
+            monetary_account_id (int): ID of the monetary account.
 
-        while page_info and page_info.has_previous_page():
-            response = PaymentApiObject.list(
-                monetary_account_id=monetary_account_id,
-                params=page_info.url_params_previous_page,
+        Returns:
+            list[dict[str, str]]: Filters with ``category`` and
+                ``notification_target`` keys.
+        """
+
+        def request() -> list[dict[str, str]]:
+            # The SDK's listing model has no fields for single filters, so
+            # read them from the raw response
+            endpoint_url = NotificationFilterUrlMonetaryAccountApiObject._ENDPOINT_URL_LISTING.format(
+                BunqContext.user_context().user_id, monetary_account_id
             )
-            payments.extend(response.value or [])
-            page_info = response.pagination
+            response_raw = ApiClient(BunqContext.api_context()).get(endpoint_url, {}, {})
+            items = json.loads(response_raw.body_bytes)["Response"]
+            return [
+                {"category": item["category"], "notification_target": item["notification_target"]}
+                for item in (item[NotificationFilterUrlMonetaryAccountApiObject._OBJECT_TYPE_GET] for item in items)
+            ]
+
+        return self.rate_limiter.call("notification-filter-url", request)
+
+    def register_payment_callbacks(
+        self,
+        callback_url: str,
+        ma_status_filter: str | None = "ACTIVE",
+        category: str = "MUTATION",
+    ) -> dict[int, bool]:
+        """Ask Bunq to POST payment notifications of every account to a URL.
+
+        Bunq replaces the full filter set of an account on every create, so
+        existing filters are kept and accounts that already notify the URL
+        are left alone. Safe to run repeatedly.
+
+        Args:
+            callback_url (str): HTTPS URL of the callback endpoint.
+            ma_status_filter (str | None): Filter accounts by status.
+                Defaults to 'ACTIVE'.
+            category (str): Notification category. Defaults to 'MUTATION',
+                which covers incoming and outgoing payments.
+
+        Returns:
+            dict[int, bool]: Per account ID, True if a filter was added and
+                False if it was already registered.
+        """
+        registered = {}
+
+        for acct_id in self._list_account_ids(ma_status_filter):
+            filters = self.list_notification_filters(acct_id)
+            if {"category": category, "notification_target": callback_url} in filters:
+                registered[acct_id] = False
+                continue
+
+            notification_filters = [
+                NotificationFilterUrlObject(f["category"], f["notification_target"]) for f in filters
+            ]
+            notification_filters.append(NotificationFilterUrlObject(category, callback_url))
+            self.rate_limiter.call(
+                "notification-filter-url",
+                NotificationFilterUrlMonetaryAccountApiObject.create,
+                monetary_account_id=acct_id,
+                notification_filters=notification_filters,
+                method="POST",
+            )
+            logger.info("Registered %s callback for account %s at %s", category, acct_id, callback_url)
+            registered[acct_id] = True
+
+        return registered
+
+    def fetch_payments_for_account(
+        self,
+        monetary_account_id: int,
+        page_size: int = 50,
+        since_id: int | None = None,
+    ) -> list[PaymentApiObject]:
+        """Fetch payments for a specific monetary account.
+
+        Pages run from newest to oldest. When ``since_id`` is given, paging
+        stops as soon as a payment at or below that ID is reached, so only
+        payments newer than the watermark are returned.
+
+        Args:
+            monetary_account_id (int): ID of the monetary account.
+            page_size (int): Number of payments per page. Defaults to 50.
+            since_id (int | None): Newest payment ID already synced.
+                Defaults to None (fetch the full history).
+
+        Returns:
+            list[PaymentApiObject]: List of payment objects.
+        """
+        payments = []
+
+        for page in self.iter_payment_pages(monetary_account_id, page_size=page_size, since_id=since_id):
+            payments.extend(page.payments)
 
         logger.info("Found %d payments for account %s", len(payments), monetary_account_id)
         return payments
 
-    def fetch_all_payments(self, ma_status_filter: str | None = None, page_size: int = 100) -> list[PaymentApiObject]:
+    def _list_account_ids(self, ma_status_filter: str | None) -> list[int]:
+        """List the IDs of all monetary accounts matching the status filter."""
+        account_ids = []
+
+        for account in self.list_all_monetary_accounts(ma_status_filter):
+            acct_id = getattr(account, "id_", None) or getattr(account, "id", None)
+            if not acct_id:
+                logger.warning("Account has no ID, skipping: %s", account)
+                continue
+            account_ids.append(acct_id)
+
+        return account_ids
+
+    def _fetch_account(self, monetary_account_id: int, page_size: int, since_id: int | None) -> AccountPayments:
+        """Fetch one account's payments and time the fetch."""
+        started = time.perf_counter()
+        payments = self.fetch_payments_for_account(monetary_account_id, page_size=page_size, since_id=since_id)
+        return AccountPayments(monetary_account_id, payments, time.perf_counter() - started)
+
+    def fetch_payments_by_account(
+        self,
+        ma_status_filter: str | None = None,
+        page_size: int = 100,
+        watermarks: Mapping[int, int] | None = None,
+        max_workers: int = 1,
+    ) -> dict[int, AccountPayments]:
+        """Fetch payments from all monetary accounts, grouped per account.
+
+        With ``max_workers`` > 1 the accounts are paged concurrently on a
+        bounded thread pool. Pages of a single account are still fetched in
+        order, and all workers share this client's rate limiter.
+
+        Args:
+            ma_status_filter (str | None): Filter accounts by status.
+            page_size (int): Number of payments per page. Defaults to 100.
+            watermarks (Mapping[int, int] | None): Newest synced payment ID
+                per monetary account ID. Accounts without a watermark are
+                fetched in full.
+            max_workers (int): Number of accounts fetched at once.
+                Defaults to 1 (sequential).
+
+        Returns:
+            dict[int, AccountPayments]: Payments and fetch time keyed by
+                account ID.
+        """
+        watermarks = watermarks or {}
+        account_ids = self._list_account_ids(ma_status_filter)
+
+        if max_workers <= 1 or len(account_ids) <= 1:
+            results = [self._fetch_account(acct_id, page_size, watermarks.get(acct_id)) for acct_id in account_ids]
+        else:
+            logger.info("Fetching %d accounts with %d workers", len(account_ids), max_workers)
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bunq-fetch") as pool:
+                results = list(
+                    pool.map(
+                        lambda acct_id: self._fetch_account(acct_id, page_size, watermarks.get(acct_id)),
+                        account_ids,
+                    )
+                )
+
+        return {result.monetary_account_id: result for result in results}
+
+    def fetch_all_payments(
+        self,
+        ma_status_filter: str | None = None,
+        page_size: int = 100,
+        watermarks: Mapping[int, int] | None = None,
+        max_workers: int = 1,
+    ) -> list[PaymentApiObject]:
         """Fetch all payments from all monetary accounts.
 
         Args:
             ma_status_filter (str | None): Filter accounts by status.
             page_size (int): Number of payments per page. Defaults to 100.
+            watermarks (Mapping[int, int] | None): Newest synced payment ID
+                per monetary account ID. Defaults to None.
+            max_workers (int): Number of accounts fetched at once.
+                Defaults to 1 (sequential).
 
         Returns:
             list[PaymentApiObject]: All payments from all accounts.
         """
         all_payments = []
-        accounts = self.list_all_monetary_accounts(ma_status_filter)
+        payments_by_account = self.fetch_payments_by_account(ma_status_filter, page_size, watermarks, max_workers)
 
-        for account in accounts:
-            acct_id = getattr(account, "id_", None) or getattr(account, "id", None)
-            if not acct_id:
-                logger.warning("Account has no ID, skipping: %s", account)
-                continue
-
-            account_payments = self.fetch_payments_for_account(acct_id, page_size=page_size)
-            all_payments.extend(account_payments)
+        for account_payments in payments_by_account.values():
+            all_payments.extend(account_payments.payments)
 
         logger.info("Total payments fetched: %d", len(all_payments))
         return all_payments
+
+    def iter_all_payment_pages(
+        self,
+        ma_status_filter: str | None = None,
+        page_size: int = 100,
+        watermarks: Mapping[int, int] | None = None,
+        max_workers: int = 1,
+        resume_from: Mapping[int, int] | None = None,
+        account_ids: Iterable[int] | None = None,
+    ) -> Iterator[PaymentPage]:
+        """Stream payment pages of all monetary accounts.
+
+        This is the streaming counterpart of ``fetch_all_payments``: pages
+        are yielded as soon as they are fetched instead of being collected
+        into one list. With ``max_workers`` > 1 the accounts are paged
+        concurrently and their pages are interleaved through a bounded
+        queue, so no more than ``2 * max_workers`` pages are held at once.
+
+        Args:
+            ma_status_filter (str | None): Filter accounts by status.
+            page_size (int): Number of payments per page. Defaults to 100.
+            watermarks (Mapping[int, int] | None): Newest synced payment ID
+                per monetary account ID. Defaults to None.
+            max_workers (int): Number of accounts fetched at once.
+                Defaults to 1 (sequential).
+            resume_from (Mapping[int, int] | None): ``older_id`` cursor per
+                monetary account ID of an interrupted pass. Those accounts
+                continue from that page. Defaults to None.
+            account_ids (Iterable[int] | None): Page only these accounts,
+                without listing them first (``ma_status_filter`` is then
+                not applied). Defaults to None (all matching accounts).
+
+        Yields:
+            PaymentPage: Pages in order per account; accounts interleave
+                when fetched concurrently.
+        """
+        watermarks = watermarks or {}
+        resume_from = resume_from or {}
+        account_ids = self._list_account_ids(ma_status_filter) if account_ids is None else list(account_ids)
+
+        def account_pages(acct_id: int) -> Iterator[PaymentPage]:
+            return self.iter_payment_pages(
+                acct_id,
+                page_size=page_size,
+                since_id=watermarks.get(acct_id),
+                older_id=resume_from.get(acct_id),
+            )
+
+        if max_workers <= 1 or len(account_ids) <= 1:
+            for acct_id in account_ids:
+                yield from account_pages(acct_id)
+            return
+
+        logger.info("Streaming %d accounts with %d workers", len(account_ids), max_workers)
+        yield from self._iter_pages_concurrently(account_ids, account_pages, max_workers)
+
+    def _iter_pages_concurrently(
+        self,
+        account_ids: list[int],
+        account_pages: Callable[[int], Iterator[PaymentPage]],
+        max_workers: int,
+    ) -> Iterator[PaymentPage]:
+        """Page accounts on a thread pool and hand pages over a bounded queue.
+
+        Workers block while the queue is full, which applies backpressure
+        when the consumer (e.g. the database load) is slower than the API.
+        If the consumer stops early, the workers are told to stop as well.
+        """
+        pages: queue.Queue[PaymentPage | BaseException | None] = queue.Queue(maxsize=max_workers)
+        stop = threading.Event()
+
+        def put(item: PaymentPage | BaseException | None) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(acct_id: int) -> None:
+            try:
+                for page in account_pages(acct_id):
+                    if not put(page):
+                        return
+            except Exception as exc:  # surfaced to the consumer below
+                put(exc)
+            finally:
+                put(None)
+
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bunq-fetch")
+        try:
+            for acct_id in account_ids:
+                pool.submit(produce, acct_id)
+
+            remaining = len(account_ids)
+            while remaining:
+                item = pages.get()
+                if item is None:
+                    remaining -= 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
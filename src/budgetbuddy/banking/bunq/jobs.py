@@ -0,0 +1,65 @@
+"""Background job handlers for Bunq work."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from src.budgetbuddy.banking.bunq.scheduler import LOCK_PREFIX
+from src.budgetbuddy.banking.bunq.sync_service import BunqSyncService
+from src.budgetbuddy.services.job_worker import JobHandler
+from src.common.log.logger import get_logger
+from src.db.locks import try_advisory_lock
+
+logger = get_logger(__name__)
+
+BUNQ_SYNC_JOB = "bunq.sync"
+
+
+def run_sync_job(db: Session, payload: dict[str, Any]) -> dict[str, Any]:
+    """Sync accounts and payments of the configured Bunq context.
+
+    The context is taken from BUNQ_CONFIG_PATH on the worker, never from
+    the payload, so API clients cannot point the worker at other files.
+    The sync holds the context's advisory lock, the same one the scheduler
+    takes; if another worker or replica is already syncing the context,
+    the job is skipped, since that run stores the same payments.
+
+    Args:
+        db (Session): Database session.
+        payload (dict[str, Any]): Optional ``full_resync``, ``load_mode``
+            and ``max_workers`` arguments of ``sync_all_payments``.
+
+    Returns:
+        dict[str, Any]: Number of accounts and the payment sync totals, or
+            ``{"locked": True}`` if the context was being synced elsewhere.
+    """
+    config_path = os.getenv("BUNQ_CONFIG_PATH", Path.home() / ".bunq" / "bunq_api_context.conf")
+
+    with (
+        db.get_bind().engine.connect() as lock_conn,
+        try_advisory_lock(lock_conn, f"{LOCK_PREFIX}{config_path}") as acquired,
+    ):
+        if not acquired:
+            logger.info("Context %s is being synced elsewhere, skipping job", config_path)
+            return {"locked": True}
+
+        service = BunqSyncService(config_path)
+        account_stats = service.sync_monetary_accounts(db)
+        stats = service.sync_all_payments(
+            db,
+            full_resync=payload.get("full_resync", False),
+            max_workers=payload.get("max_workers", int(os.getenv("BUNQ_SYNC_WORKERS", "4"))),
+            load_mode=payload.get("load_mode", "insert"),
+        )
+
+    return {
+        "accounts": account_stats["accounts"],
+        **{key: stats[key] for key in ("fetched", "inserted", "updated", "skipped", "elapsed_seconds")},
+    }
+
+
+JOB_HANDLERS: dict[str, JobHandler] = {BUNQ_SYNC_JOB: run_sync_job}
@@ -0,0 +1,169 @@
+"""Parallel sync of many Bunq API contexts.
+
+The Bunq SDK keeps the loaded API context in process-global state, so one
+process can only talk to Bunq as one user at a time. The orchestrator runs
+every context in its own worker process; each worker owns a SQLAlchemy
+engine that is created after the process starts, so no connection is ever
+shared across processes.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.budgetbuddy.banking.bunq.scheduler import LOCK_PREFIX
+from src.budgetbuddy.banking.bunq.sync_service import BunqSyncService
+from src.common.log.logger import get_logger
+from src.db.config import DATABASE_URL
+from src.db.locks import try_advisory_lock
+
+logger = get_logger(__name__)
+
+STAT_KEYS = ("fetched", "inserted", "updated", "skipped")
+
+# Session factory of the current worker process, set by _init_worker
+_worker_sessionmaker: sessionmaker | None = None
+
+
+@dataclass
+class ContextSyncResult:
+    """Outcome of syncing a single Bunq API context."""
+
+    config_path: str
+    stats: dict[str, Any] = field(default_factory=dict)
+    accounts: int = 0
+    elapsed_seconds: float = 0.0
+    error: str | None = None
+
+
+def _init_worker(database_url: str) -> None:
+    """Create the per-process engine and session factory."""
+    global _worker_sessionmaker
+    engine = create_engine(database_url, pool_pre_ping=True, pool_size=1, max_overflow=1)
+    _worker_sessionmaker = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
+
+
+def _sync_context(config_path: str, sync_options: dict[str, Any]) -> ContextSyncResult:
+    """Sync accounts and payments of one context inside a worker process.
+
+    Errors are captured in the result so one failing context does not abort
+    the others. The context's advisory lock is held for the whole sync; a
+    context that the scheduler or a sync job is already syncing is skipped
+    and reported as failed.
+
+    Raises:
+        RuntimeError: If the process was not set up by ``_init_worker``.
+    """
+    if _worker_sessionmaker is None:
+        raise RuntimeError("worker not initialized")
+
+    started = time.perf_counter()
+    result = ContextSyncResult(config_path)
+
+    try:
+        with (
+            _worker_sessionmaker() as session,
+            session.get_bind().engine.connect() as lock_conn,
+            try_advisory_lock(lock_conn, f"{LOCK_PREFIX}{config_path}") as acquired,
+        ):
+            if acquired:
+                service = BunqSyncService(config_path)
+                result.accounts = service.sync_monetary_accounts(session)["accounts"]
+                result.stats = service.sync_all_payments(session, **sync_options)
+            else:
+                logger.warning("Context %s is being synced elsewhere, skipping it", config_path)
+                result.error = "locked: context is being synced elsewhere"
+    except Exception as exc:
+        logger.exception("Sync failed for context %s", config_path)
+        result.error = f"{type(exc).__name__}: {exc}"
+
+    result.elapsed_seconds = round(time.perf_counter() - started, 3)
+    return result
+
+
+def aggregate_results(results: list[ContextSyncResult]) -> dict[str, Any]:
+    """Combine per-context results into overall statistics.
+
+    Args:
+        results (list[ContextSyncResult]): Results of the individual contexts.
+
+    Returns:
+        dict[str, Any]: Totals for fetched/inserted/updated/skipped and
+            accounts, the failed config paths and the per-context results.
+    """
+    totals: dict[str, Any] = {key: 0 for key in STAT_KEYS}
+    totals["accounts"] = 0
+
+    for result in results:
+        totals["accounts"] += result.accounts
+        for key in STAT_KEYS:
+            totals[key] += result.stats.get(key, 0)
+
+    totals["failed"] = [result.config_path for result in results if result.error]
+    totals["contexts"] = {result.config_path: result for result in results}
+    return totals
+
+
+def sync_contexts(
+    config_paths: Iterable[str | Path],
+    max_processes: int | None = None,
+    database_url: str = DATABASE_URL,
+    **sync_options: Any,
+) -> dict[str, Any]:
+    """Sync several Bunq API contexts in parallel, one context per process.
+
+    Args:
+        config_paths (Iterable[str | Path]): Paths to bunq_api_context.conf files.
+        max_processes (int | None): Size of the process pool. Defaults to
+            the number of CPUs, capped at the number of contexts.
+        database_url (str): Database each worker connects to. Defaults to
+            the configured DATABASE_URL.
+        **sync_options: Passed on to ``BunqSyncService.sync_all_payments``
+            (e.g. max_workers, load_mode, full_resync).
+
+    Returns:
+        dict[str, Any]: Aggregated statistics, see ``aggregate_results``,
+            plus elapsed_seconds for the whole run.
+    """
+    paths = [str(path) for path in config_paths]
+    if not paths:
+        return {**aggregate_results([]), "elapsed_seconds": 0.0}
+
+    processes = min(max_processes or os.cpu_count() or 1, len(paths))
+    logger.info("Syncing %d Bunq contexts with %d processes", len(paths), processes)
+    started = time.perf_counter()
+
+    # spawn gives every worker a clean interpreter: no inherited SDK context,
+    # connection pool or background threads from the parent
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(database_url,),
+    ) as pool:
+        results = list(pool.map(_sync_context, paths, [sync_options] * len(paths)))
+
+    totals = aggregate_results(results)
+    totals["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+
+    logger.info(
+        "Synced %d contexts in %.2fs: %d fetched, %d inserted, %d updated, %d skipped, %d failed",
+        len(paths),
+        totals["elapsed_seconds"],
+        totals["fetched"],
+        totals["inserted"],
+        totals["updated"],
+        totals["skipped"],
+        len(totals["failed"]),
+    )
+    return totals
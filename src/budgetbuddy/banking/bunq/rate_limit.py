@@ -0,0 +1,175 @@
+"""Client-side rate limiting for the Bunq API."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from bunq.sdk.exception.too_many_requests_exception import TooManyRequestsException
+
+from src.common.log.logger import get_logger
+
+logger = get_logger(__name__)
+
+R = TypeVar("R")
+
+# Bunq allows this many requests per endpoint within any window of
+# BUNQ_RATE_WINDOW_SECONDS, counted separately for each HTTP method.
+BUNQ_RATE_LIMITS = {"GET": 3, "POST": 5, "PUT": 2}
+BUNQ_RATE_WINDOW_SECONDS = 3.0
+
+
+class SlidingWindowLimiter:
+    """Thread-safe limit of ``limit`` acquisitions within any ``window_seconds``.
+
+    Remembers the times of the last ``limit`` acquisitions; a new one has
+    to wait until the oldest of them left the window. Unlike a token
+    bucket, a full window never allows refills on top of a burst, which
+    matches how Bunq counts requests. ``acquire`` blocks until allowed.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize an empty window.
+
+        Args:
+            limit (int): Acquisitions allowed per window.
+            window_seconds (float): Length of the window.
+            clock (Callable[[], float]): Monotonic clock. Defaults to time.monotonic.
+            sleep (Callable[[float], None]): Sleep function. Defaults to time.sleep.
+        """
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._acquired: deque[float] = deque(maxlen=limit)
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Record one acquisition, blocking until the window allows it."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                wait = self._blocked_until - now
+                if wait <= 0 and len(self._acquired) == self.limit:
+                    wait = self._acquired[0] + self.window_seconds - now
+                if wait <= 0:
+                    # Pushes out the oldest time once the deque is full
+                    self._acquired.append(now)
+                    return
+            self._sleep(wait)
+
+    def penalize(self, seconds: float) -> None:
+        """Block all callers for ``seconds``, then start with an empty window.
+
+        Args:
+            seconds (float): How long nothing may be acquired.
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+            self._acquired.clear()
+
+
+class BunqRateLimiter:
+    """Per-endpoint sliding windows shared by all workers of a client.
+
+    Every API call is routed through ``call``, which waits until the
+    endpoint's window allows another request and retries with exponential backoff when Bunq
+    answers with HTTP 429.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, int] | None = None,
+        window_seconds: float = BUNQ_RATE_WINDOW_SECONDS,
+        max_retries: int = 5,
+        backoff_seconds: float = BUNQ_RATE_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            limits (dict[str, int] | None): Requests per window by HTTP
+                method. Defaults to BUNQ_RATE_LIMITS.
+            window_seconds (float): Length of the rate limit window.
+            max_retries (int): Retries after a 429 before giving up.
+            backoff_seconds (float): Base delay of the exponential backoff.
+            clock (Callable[[], float]): Monotonic clock. Defaults to time.monotonic.
+            sleep (Callable[[float], None]): Sleep function. Defaults to time.sleep.
+        """
+        self.limits = limits or BUNQ_RATE_LIMITS
+        self.window_seconds = window_seconds
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._windows: dict[tuple[str, str], SlidingWindowLimiter] = {}
+        self._lock = threading.Lock()
+
+    def window(self, endpoint: str, method: str = "GET") -> SlidingWindowLimiter:
+        """Get (or create) the window for an endpoint and method.
+
+        Args:
+            endpoint (str): Endpoint name, e.g. 'payment'.
+            method (str): HTTP method. Defaults to "GET".
+
+        Returns:
+            SlidingWindowLimiter: Window shared by all callers of that endpoint.
+        """
+        key = (method, endpoint)
+        with self._lock:
+            if key not in self._windows:
+                limit = self.limits.get(method, min(self.limits.values()))
+                self._windows[key] = SlidingWindowLimiter(
+                    limit, self.window_seconds, clock=self._clock, sleep=self._sleep
+                )
+            return self._windows[key]
+
+    def call(self, endpoint: str, func: Callable[..., R], *args: Any, method: str = "GET", **kwargs: Any) -> R:
+        """Call ``func`` once the endpoint's window allows it, retrying on 429.
+
+        Args:
+            endpoint (str): Endpoint name used to select the window.
+            func (Callable[..., R]): SDK function performing the request.
+            *args: Positional arguments for ``func``.
+            method (str): HTTP method of the request. Defaults to "GET".
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            R: The return value of ``func``.
+
+        Raises:
+            TooManyRequestsException: If Bunq keeps answering 429 after
+                ``max_retries`` retries.
+        """
+        window = self.window(endpoint, method)
+        attempt = 0
+        while True:
+            window.acquire()
+            try:
+                return func(*args, **kwargs)
+            except TooManyRequestsException:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_seconds * 2**attempt + random.uniform(0, self.backoff_seconds)
+                attempt += 1
+                logger.warning(
+                    "Rate limited on %s %s, backing off %.1fs (retry %d/%d)",
+                    method,
+                    endpoint,
+                    delay,
+                    attempt,
+                    self.max_retries,
+                )
+                window.penalize(delay)
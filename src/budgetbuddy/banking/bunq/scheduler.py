@@ -0,0 +1,233 @@
+"""Long-running scheduler for Bunq account and payment syncs.
+
+Every configured API context is synced on its own schedule instead of
+from cron. Before syncing a context the scheduler takes a PostgreSQL
+advisory lock for it, so when several replicas run the scheduler only one
+of them syncs a given context at a time; the others skip it and retry.
+
+Payments are polled per account according to recent activity: an account
+whose newest payment falls within ``hot_window`` is polled every
+``hot_interval``, any other account every ``dormant_interval``. All
+intervals are jittered so replicas and contexts drift apart.
+
+The SDK keeps the loaded API context in process-global state, so one
+scheduler process syncs its contexts one at a time on a worker thread.
+Run more replicas to sync more contexts at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime
+import random
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.budgetbuddy.banking.bunq.rate_limit import BunqRateLimiter
+from src.budgetbuddy.banking.bunq.sync_service import EXTERNAL_SOURCE, BunqSyncService, LoadMode
+from src.budgetbuddy.services.sync_watermark_service import get_watermarks
+from src.common.log.logger import get_logger
+from src.db.locks import try_advisory_lock
+from src.db.session import SessionLocal
+from src.db.session import engine as default_engine
+
+logger = get_logger(__name__)
+
+LOCK_PREFIX = "bunq-sync:"
+
+
+@dataclass
+class ScheduleConfig:
+    """Intervals of the sync scheduler, in seconds."""
+
+    account_interval: float = 3600.0
+    hot_interval: float = 300.0
+    dormant_interval: float = 6 * 3600.0
+    hot_window: datetime.timedelta = datetime.timedelta(days=7)
+    # Fraction by which every interval is randomly stretched or shrunk
+    jitter: float = 0.1
+    # Delay before retrying a context that failed or is locked by another replica
+    retry_interval: float = 60.0
+
+
+def poll_interval(last_payment_at: datetime.datetime | None, now: datetime.datetime, config: ScheduleConfig) -> float:
+    """Pick the payment polling interval of an account from its activity.
+
+    Args:
+        last_payment_at (datetime | None): Creation time of the newest synced
+            payment, None if the account has none.
+        now (datetime): Current time, timezone-aware.
+        config (ScheduleConfig): Scheduler intervals.
+
+    Returns:
+        float: Seconds until the account should be polled again.
+    """
+    if last_payment_at is not None and now - last_payment_at <= config.hot_window:
+        return config.hot_interval
+    return config.dormant_interval
+
+
+@dataclass
+class ContextSchedule:
+    """Due times of one API context, on the scheduler's monotonic clock."""
+
+    config_path: str
+    next_accounts_at: float = 0.0
+    # Next payment poll per Bunq account ID, filled once accounts are listed
+    next_poll_at: dict[int, float] = field(default_factory=dict)
+
+    @property
+    def lock_name(self) -> str:
+        return f"{LOCK_PREFIX}{self.config_path}"
+
+    def next_due(self) -> float:
+        return min([self.next_accounts_at, *self.next_poll_at.values()])
+
+    def due_account_ids(self, now: float) -> list[int]:
+        return [acct_id for acct_id, due in self.next_poll_at.items() if due <= now]
+
+    def set_accounts(self, account_ids: Iterable[int], now: float) -> None:
+        """Track the listed accounts: new ones are due now, closed ones are dropped."""
+        self.next_poll_at = {acct_id: self.next_poll_at.get(acct_id, now) for acct_id in account_ids}
+
+    def postpone(self, until: float) -> None:
+        """Move everything that is due before ``until`` to ``until``."""
+        self.next_accounts_at = max(self.next_accounts_at, until)
+        self.next_poll_at = {acct_id: max(due, until) for acct_id, due in self.next_poll_at.items()}
+
+
+class BunqSyncScheduler:
+    """Sync Bunq contexts on activity-based intervals, one replica per context."""
+
+    def __init__(
+        self,
+        config_paths: Iterable[str | Path],
+        engine: Engine | None = None,
+        session_factory: Callable[[], contextlib.AbstractContextManager[Session]] | None = None,
+        config: ScheduleConfig | None = None,
+        rate_limiter: BunqRateLimiter | None = None,
+        max_workers: int = 4,
+        load_mode: LoadMode = "insert",
+        clock: Callable[[], float] = time.monotonic,
+        seed: int | None = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            config_paths (Iterable[str | Path]): API context files to sync.
+                Replicas must use the same paths, as they name the locks.
+            engine (Engine | None): Engine for the advisory lock connections.
+                Defaults to the application engine.
+            session_factory (Callable | None): Creates the session a sync
+                writes through. Defaults to SessionLocal.
+            config (ScheduleConfig | None): Intervals. Defaults to
+                ScheduleConfig().
+            rate_limiter (BunqRateLimiter | None): Limiter shared by all
+                syncs. Defaults to Bunq's published limits.
+            max_workers (int): Accounts of a context fetched concurrently.
+            load_mode (LoadMode): How payment pages are written.
+            clock (Callable[[], float]): Monotonic clock, in seconds.
+            seed (int | None): Seed for the jitter.
+        """
+        self.schedules = [ContextSchedule(str(path)) for path in config_paths]
+        self.engine = engine or default_engine
+        self.session_factory = session_factory or SessionLocal
+        self.config = config or ScheduleConfig()
+        self.rate_limiter = rate_limiter or BunqRateLimiter()
+        self.max_workers = max_workers
+        self.load_mode = load_mode
+        self.clock = clock
+        self._random = random.Random(seed)
+
+    def jittered(self, seconds: float) -> float:
+        return seconds * (1 + self._random.uniform(-self.config.jitter, self.config.jitter))
+
+    def run_once(self, schedule: ContextSchedule, now: float | None = None) -> dict[str, Any] | None:
+        """Run whatever is due for one context, unless another replica holds it.
+
+        Args:
+            schedule (ContextSchedule): The context to sync.
+            now (float | None): Current time on the scheduler clock.
+                Defaults to ``clock()``.
+
+        Returns:
+            dict[str, Any] | None: Stats with keys ``accounts`` and
+                ``payments`` (None for the parts that were not due), or
+                None if the context is locked by another replica.
+        """
+        now = self.clock() if now is None else now
+
+        with self.engine.connect() as lock_conn, try_advisory_lock(lock_conn, schedule.lock_name) as acquired:
+            if not acquired:
+                logger.info("Context %s is being synced by another replica, retrying later", schedule.config_path)
+                schedule.postpone(now + self.jittered(self.config.retry_interval))
+                return None
+            return self._sync(schedule, now)
+
+    def _sync(self, schedule: ContextSchedule, now: float) -> dict[str, Any]:
+        stats: dict[str, Any] = {"accounts": None, "payments": None}
+        if schedule.next_accounts_at > now and not schedule.due_account_ids(now):
+            return stats
+
+        # Loads the context into the SDK's global state (one API call), so
+        # build it per run and only when something is due
+        service = BunqSyncService(schedule.config_path, rate_limiter=self.rate_limiter)
+
+        with self.session_factory() as db:
+            if schedule.next_accounts_at <= now:
+                stats["accounts"] = service.sync_monetary_accounts(db, account_status_filter="ACTIVE")
+                schedule.set_accounts(stats["accounts"]["account_ids"], now)
+                schedule.next_accounts_at = now + self.jittered(self.config.account_interval)
+
+            due_ids = schedule.due_account_ids(now)
+            if due_ids:
+                stats["payments"] = service.sync_all_payments(
+                    db, max_workers=self.max_workers, load_mode=self.load_mode, account_ids=due_ids
+                )
+                watermarks = get_watermarks(db, EXTERNAL_SOURCE)
+                wall_now = datetime.datetime.now(datetime.UTC)
+                for acct_id in due_ids:
+                    last_payment_at = watermarks[acct_id].last_payment_created_at if acct_id in watermarks else None
+                    interval = poll_interval(last_payment_at, wall_now, self.config)
+                    schedule.next_poll_at[acct_id] = now + self.jittered(interval)
+
+        logger.info(
+            "Scheduled sync of %s: accounts %s, %d accounts polled",
+            schedule.config_path,
+            "listed" if stats["accounts"] else "not due",
+            len(due_ids),
+        )
+        return stats
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        """Sync contexts as they fall due until ``stop`` is set.
+
+        Args:
+            stop (asyncio.Event | None): Set to shut down after the current
+                sync. Defaults to running forever.
+        """
+        stop = stop or asyncio.Event()
+        logger.info("Bunq sync scheduler started for %d contexts", len(self.schedules))
+
+        while self.schedules and not stop.is_set():
+            schedule = min(self.schedules, key=ContextSchedule.next_due)
+            delay = schedule.next_due() - self.clock()
+            if delay > 0:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(stop.wait(), timeout=delay)
+                continue
+
+            try:
+                await asyncio.to_thread(self.run_once, schedule)
+            except Exception:
+                logger.exception("Scheduled sync of %s failed", schedule.config_path)
+                schedule.postpone(self.clock() + self.jittered(self.config.retry_interval))
+
+        logger.info("Bunq sync scheduler stopped")
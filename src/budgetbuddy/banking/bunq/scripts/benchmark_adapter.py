@@ -0,0 +1,80 @@
+"""Microbenchmark the payment transform: SDK adapter versus raw JSON fast path.
+
+Both paths start from the same raw payment listing bodies and end with rows
+ready for the bulk loaders:
+
+- sdk: SDK object graph -> BunqPaymentAdapter -> TransactionCreate -> bulk row
+- raw: decoded JSON -> BunqRawPaymentAdapter (one validation per page)
+
+No database or network is involved.
+
+Usage:
+    python -m src.budgetbuddy.banking.bunq.scripts.benchmark_adapter --payments 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+
+from bunq.sdk.json import converter
+from bunq.sdk.model.generated.endpoint import PaymentApiObject
+from src.budgetbuddy.banking.bunq.adapter import BunqPaymentAdapter, BunqRawPaymentAdapter
+from src.budgetbuddy.banking.bunq.stand_in import SyntheticHistory
+from src.budgetbuddy.services.transaction_service import _bulk_row
+
+
+def make_pages(payments: int, page_size: int) -> list[bytes]:
+    history = SyntheticHistory(accounts=1, payments_per_account=payments)
+    account_id = history.account_ids()[0]
+    ids = history.payment_ids(account_id)
+    return [
+        json.dumps(
+            {"Response": [{"Payment": history.payment(account_id, i)} for i in ids[offset : offset + page_size]]}
+        ).encode()
+        for offset in range(0, len(ids), page_size)
+    ]
+
+
+def transform_sdk(body: bytes) -> list[tuple]:
+    payments = [converter.deserialize(PaymentApiObject, item["Payment"]) for item in json.loads(body)["Response"]]
+    return [_bulk_row(t) for t in BunqPaymentAdapter.to_transaction_creates(payments)]
+
+
+def transform_raw(body: bytes) -> list[tuple]:
+    return BunqRawPaymentAdapter.to_transaction_rows(item["Payment"] for item in json.loads(body)["Response"])
+
+
+def best_time(transform: Callable[[bytes], list[tuple]], pages: list[bytes], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for body in pages:
+            transform(body)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run_benchmark(payments: int, page_size: int, repeat: int) -> None:
+    pages = make_pages(payments, page_size)
+
+    assert transform_sdk(pages[0]) == transform_raw(pages[0]), "fast path rows differ from the SDK adapter"
+
+    print(f"{'path':>6} {'payments':>9} {'seconds':>9} {'payments/sec':>13}")
+    baseline = None
+    for name, transform in (("sdk", transform_sdk), ("raw", transform_raw)):
+        elapsed = best_time(transform, pages, repeat)
+        baseline = baseline or elapsed
+        print(f"{name:>6} {payments:>9} {elapsed:>9.3f} {payments / elapsed:>13.0f}  ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payments", type=int, default=20_000)
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmark(args.payments, args.page_size, args.repeat)
@@ -0,0 +1,150 @@
+"""Benchmark a full Bunq sync end to end against the local API stand-in.
+
+Starts the stand-in in its own process (so serving and signing responses do
+not compete with the sync for the GIL), runs the account and payment sync
+of BunqSyncService against it and reports payments/sec, API calls, 429s,
+peak RSS and database rows/sec. Stand-in rows use IDs far above real Bunq
+IDs and are removed from the configured database afterwards.
+
+Usage:
+    python -m src.budgetbuddy.banking.bunq.scripts.benchmark_sync --accounts 5 --payments 20000
+    python -m src.budgetbuddy.banking.bunq.scripts.benchmark_sync --latency-ms 80 --throttle-rate 0.05 --bunq-limits
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import resource
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from urllib.request import urlopen
+
+from sqlalchemy import BigInteger, cast, delete, func
+from src.budgetbuddy.banking.bunq.rate_limit import BunqRateLimiter
+from src.budgetbuddy.banking.bunq.stand_in import STATS_PATH, BunqStandIn, SyntheticHistory, sdk_base_url
+from src.budgetbuddy.banking.bunq.sync_service import EXTERNAL_SOURCE, BunqSyncService
+from src.db.schema.monetaryaccount import MonetaryAccount
+from src.db.schema.sync_watermark import SyncWatermark
+from src.db.schema.transaction import Transaction
+from src.db.session import SessionLocal
+
+
+def _serve(history: SyntheticHistory, options: dict[str, Any], context_path: str, ready, stop) -> None:
+    """Run the stand-in until ``stop`` is set (child process entry point)."""
+    with BunqStandIn(history, **options) as stand_in:
+        stand_in.write_api_context(context_path)
+        ready.put(stand_in.url)
+        stop.wait()
+
+
+def cleanup(history: SyntheticHistory) -> None:
+    """Remove everything the benchmark wrote to the database."""
+    account_ids = list(history.account_ids())
+    first_payment = history.payment_ids(account_ids[0]).start
+    last_payment = history.payment_ids(account_ids[-1]).stop - 1
+
+    with SessionLocal() as db:
+        payment_id = cast(func.substr(Transaction.external_id, len("bunq_") + 1), BigInteger)
+        db.execute(
+            delete(Transaction).where(
+                Transaction.external_source == EXTERNAL_SOURCE,
+                payment_id.between(first_payment, last_payment),
+            )
+        )
+        db.execute(delete(MonetaryAccount).where(MonetaryAccount.external_id.in_([f"bunq_{i}" for i in account_ids])))
+        db.execute(
+            delete(SyncWatermark).where(
+                SyncWatermark.external_source == EXTERNAL_SOURCE,
+                SyncWatermark.monetary_account_id.in_(account_ids),
+            )
+        )
+        db.commit()
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    history = SyntheticHistory(accounts=args.accounts, payments_per_account=args.payments)
+    options = {"latency_seconds": args.latency_ms / 1000, "throttle_rate": args.throttle_rate, "seed": args.seed}
+
+    if args.bunq_limits:
+        rate_limiter = BunqRateLimiter(backoff_seconds=args.backoff)
+    else:
+        # Effectively unlimited, so the numbers show the sync itself
+        rate_limiter = BunqRateLimiter(limits={"GET": 10_000}, window_seconds=1.0, backoff_seconds=args.backoff)
+
+    ctx = multiprocessing.get_context("spawn")
+    ready, stop = ctx.Queue(), ctx.Event()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        context_path = str(Path(tmp) / "stand_in_api_context.conf")
+        server = ctx.Process(target=_serve, args=(history, options, context_path, ready, stop), daemon=True)
+        server.start()
+        url = ready.get(timeout=60)
+
+        try:
+            rss_before_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            with sdk_base_url(url), SessionLocal() as db:
+                started = time.perf_counter()
+                service = BunqSyncService(context_path, rate_limiter=rate_limiter)
+                service.sync_monetary_accounts(db)
+                stats = service.sync_all_payments(
+                    db,
+                    full_resync=True,
+                    max_workers=args.max_workers,
+                    load_mode=args.load_mode,
+                )
+                elapsed = time.perf_counter() - started
+            peak_rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+            with urlopen(url.removesuffix("/v1/") + STATS_PATH) as response:
+                api_stats = json.load(response)
+        finally:
+            stop.set()
+            server.join()
+            if not args.keep:
+                cleanup(history)
+
+    rows_written = stats["inserted"] + stats["updated"]
+    return {
+        "payments": stats["fetched"],
+        "seconds": elapsed,
+        "payments_per_sec": stats["fetched"] / elapsed,
+        "api_calls": api_stats["api_calls"],
+        "throttled": api_stats["throttled"],
+        "db_rows": rows_written,
+        "db_rows_per_sec": rows_written / elapsed,
+        "peak_rss_mib": peak_rss_kib / 1024,
+        "rss_growth_mib": (peak_rss_kib - rss_before_kib) / 1024,
+    }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    print(f"{'payments':>16} {report['payments']:>12}")
+    print(f"{'seconds':>16} {report['seconds']:>12.3f}")
+    print(f"{'payments/sec':>16} {report['payments_per_sec']:>12.0f}")
+    print(f"{'api calls':>16} {report['api_calls']:>12}")
+    print(f"{'429 responses':>16} {report['throttled']:>12}")
+    print(f"{'db rows':>16} {report['db_rows']:>12}")
+    print(f"{'db rows/sec':>16} {report['db_rows_per_sec']:>12.0f}")
+    print(f"{'peak rss MiB':>16} {report['peak_rss_mib']:>12.1f}")
+    print(f"{'rss growth MiB':>16} {report['rss_growth_mib']:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=3)
+    parser.add_argument("--payments", type=int, default=5_000, help="payments per account")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="latency added to every API response")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-workers", type=int, default=4)
+    parser.add_argument("--load-mode", choices=["insert", "copy", "upsert"], default="insert")
+    parser.add_argument("--bunq-limits", action="store_true", help="apply Bunq's real client-side rate limits")
+    parser.add_argument("--backoff", type=float, default=0.05, help="base backoff in seconds after a 429")
+    parser.add_argument("--keep", action="store_true", help="keep the synced rows instead of deleting them")
+    args = parser.parse_args()
+
+    print_report(run_benchmark(args))
@@ -0,0 +1,42 @@
+"""Register the payment callback URL on every active Bunq account.
+
+Bunq then POSTs each new payment to the callback endpoint
+(``POST /banking/bunq/callback``), so payments arrive without polling.
+Existing notification filters are kept, and accounts that already notify
+the URL are left alone, so the script can be rerun safely.
+
+Usage:
+    python -m src.budgetbuddy.banking.bunq.scripts.register_bunq_callbacks --url https://example.com/banking/bunq/callback
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+from src.budgetbuddy.banking.bunq.fetch import BunqClient
+from src.common.log.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    """Register the callback URL on all active Bunq accounts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=os.getenv("BUNQ_CALLBACK_URL"), help="Defaults to BUNQ_CALLBACK_URL")
+    parser.add_argument("--category", default="MUTATION")
+    args = parser.parse_args()
+    if not args.url:
+        parser.error("--url or BUNQ_CALLBACK_URL is required")
+
+    config_path = os.getenv("BUNQ_CONFIG_PATH", Path.home() / ".bunq" / "bunq_api_context.conf")
+    client = BunqClient(config_path)
+    registered = client.register_payment_callbacks(args.url, category=args.category)
+    client.save_context()
+
+    for account_id, created in registered.items():
+        logger.info("  account %s: %s", account_id, "registered" if created else "already registered")
+    logger.info("Callback %s registered on %d of %d accounts", args.url, sum(registered.values()), len(registered))
+
+
+if __name__ == "__main__":
+    main()
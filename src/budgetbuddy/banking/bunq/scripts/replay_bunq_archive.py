@@ -0,0 +1,59 @@
+"""Script to rebuild Bunq transactions from the raw payment archive.
+
+Reprocesses archived payment pages with the current payment mapping,
+without any Bunq API calls. Live syncs and replays share ``payment_values``
+in the Bunq adapter, so use this after changing it to bring stored
+transactions in line.
+
+Usage:
+    python -m src.budgetbuddy.banking.bunq.scripts.replay_bunq_archive
+    python -m src.budgetbuddy.banking.bunq.scripts.replay_bunq_archive --accounts 12345 --load-mode insert
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+from src.budgetbuddy.banking.bunq.archive import PaymentArchive
+from src.budgetbuddy.banking.bunq.sync_service import BunqSyncService
+from src.common.log.logger import get_logger
+from src.db.session import SessionLocal
+
+logger = get_logger(__name__)
+
+
+def main():
+    """Replay the archive into the database."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--archive-dir",
+        default=os.getenv("BUNQ_ARCHIVE_DIR", Path.home() / ".bunq" / "archive"),
+        help="archive directory (defaults to BUNQ_ARCHIVE_DIR)",
+    )
+    parser.add_argument("--accounts", type=int, nargs="+", help="only replay these monetary account IDs")
+    parser.add_argument("--load-mode", choices=["insert", "copy", "upsert"], default="upsert")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    archive = PaymentArchive(args.archive_dir)
+    logger.info("Replaying Bunq archive at %s", archive.root)
+
+    with SessionLocal() as session:
+        stats = BunqSyncService.replay_archive(
+            session,
+            archive,
+            account_ids=args.accounts,
+            load_mode=args.load_mode,
+            batch_size=args.batch_size,
+        )
+
+    logger.info("Pages replayed:        %d", stats["pages"])
+    logger.info("Payments replayed:     %d", stats["payments"])
+    logger.info("Inserted:              %d", stats["inserted"])
+    logger.info("Updated:               %d", stats["updated"])
+    logger.info("Unchanged / skipped:   %d", stats["skipped"])
+    logger.info("Elapsed seconds:       %.2f", stats["elapsed_seconds"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Run the Bunq sync scheduler until interrupted.
+
+Replaces cron-driven runs of sync_bunq_payments. Several replicas may run
+at once; an advisory lock per context keeps them from syncing the same
+context concurrently.
+
+Usage:
+    BUNQ_CONFIG_PATHS=/path/household.conf:/path/business.conf \
+        python -m src.budgetbuddy.banking.bunq.scripts.run_bunq_scheduler
+"""
+
+import asyncio
+import datetime
+import os
+import signal
+from pathlib import Path
+
+from src.budgetbuddy.banking.bunq.scheduler import BunqSyncScheduler, ScheduleConfig
+from src.common.log.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def schedule_config_from_env() -> ScheduleConfig:
+    """Build the scheduler intervals from BUNQ_SCHEDULE_* variables."""
+    defaults = ScheduleConfig()
+    return ScheduleConfig(
+        account_interval=float(os.getenv("BUNQ_SCHEDULE_ACCOUNT_SECONDS", defaults.account_interval)),
+        hot_interval=float(os.getenv("BUNQ_SCHEDULE_HOT_SECONDS", defaults.hot_interval)),
+        dormant_interval=float(os.getenv("BUNQ_SCHEDULE_DORMANT_SECONDS", defaults.dormant_interval)),
+        hot_window=datetime.timedelta(days=float(os.getenv("BUNQ_SCHEDULE_HOT_DAYS", defaults.hot_window.days))),
+        jitter=float(os.getenv("BUNQ_SCHEDULE_JITTER", defaults.jitter)),
+        retry_interval=float(os.getenv("BUNQ_SCHEDULE_RETRY_SECONDS", defaults.retry_interval)),
+    )
+
+
+async def main():
+    """Run the scheduler, stopping cleanly on SIGINT or SIGTERM."""
+    config_paths = [path for path in os.getenv("BUNQ_CONFIG_PATHS", "").split(os.pathsep) if path]
+    if not config_paths:
+        config_paths = [os.getenv("BUNQ_CONFIG_PATH", str(Path.home() / ".bunq" / "bunq_api_context.conf"))]
+
+    scheduler = BunqSyncScheduler(
+        config_paths,
+        config=schedule_config_from_env(),
+        max_workers=int(os.getenv("BUNQ_SYNC_WORKERS", "4")),
+        load_mode=os.getenv("BUNQ_SYNC_LOAD_MODE", "insert"),
+    )
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    await scheduler.run(stop)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""Run background job workers until interrupted.
+
+Each worker process claims queued jobs (e.g. Bunq syncs enqueued through
+``POST /banking/bunq/sync``) one at a time. Start more processes, here or
+on other hosts, to work through the queue faster.
+
+Usage:
+    python -m src.budgetbuddy.banking.bunq.scripts.run_job_worker --processes 2
+"""
+
+import argparse
+import multiprocessing
+import signal
+import threading
+
+from src.budgetbuddy.banking.bunq.jobs import JOB_HANDLERS
+from src.budgetbuddy.services.job_worker import JobWorker
+from src.common.log.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def run_worker(lease_seconds: float, poll_seconds: float) -> None:
+    """Run one worker in this process, stopping cleanly on SIGINT or SIGTERM."""
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    JobWorker(JOB_HANDLERS, lease_seconds=lease_seconds, poll_seconds=poll_seconds).run(stop)
+
+
+def main():
+    """Start the worker processes and wait for them."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--lease-seconds", type=float, default=300.0)
+    parser.add_argument("--poll-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    if args.processes <= 1:
+        run_worker(args.lease_seconds, args.poll_seconds)
+        return
+
+    # The Bunq SDK keeps process-global state, so every worker gets its own process
+    ctx = multiprocessing.get_context("spawn")
+    workers = [
+        ctx.Process(target=run_worker, args=(args.lease_seconds, args.poll_seconds), name=f"job-worker-{i}")
+        for i in range(args.processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    signal.signal(signal.SIGTERM, lambda *_: [worker.terminate() for worker in workers])
+    for worker in workers:
+        worker.join()
+    logger.info("All %d job workers stopped", len(workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Script to sync several Bunq API contexts to the database in parallel.
+
+Usage:
+    BUNQ_CONFIG_PATHS=/path/household.conf:/path/business.conf \
+        python -m src.budgetbuddy.banking.bunq.scripts.sync_bunq_contexts
+"""
+
+import os
+
+from src.budgetbuddy.banking.bunq.orchestrator import sync_contexts
+from src.common.log.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    """Sync all configured Bunq contexts, one process per context."""
+    config_paths = [path for path in os.getenv("BUNQ_CONFIG_PATHS", "").split(os.pathsep) if path]
+    if not config_paths:
+        logger.error("BUNQ_CONFIG_PATHS is empty; nothing to sync")
+        return
+
+    max_processes = int(os.getenv("BUNQ_SYNC_PROCESSES", "0")) or None
+    max_workers = int(os.getenv("BUNQ_SYNC_WORKERS", "4"))
+    load_mode = os.getenv("BUNQ_SYNC_LOAD_MODE", "insert")
+
+    stats = sync_contexts(config_paths, max_processes=max_processes, max_workers=max_workers, load_mode=load_mode)
+
+    # Report results
+    logger.info("=" * 50)
+    logger.info("MULTI-CONTEXT SYNC SUMMARY")
+    logger.info("=" * 50)
+    logger.info("Contexts synced:            %d", len(stats["contexts"]) - len(stats["failed"]))
+    logger.info("Accounts synced:            %d", stats["accounts"])
+    logger.info("Payments fetched from Bunq: %d", stats["fetched"])
+    logger.info("New transactions inserted:  %d", stats["inserted"])
+    logger.info("Changed transactions:       %d", stats["updated"])
+    logger.info("Duplicates skipped:         %d", stats["skipped"])
+    logger.info("Elapsed seconds:            %.2f", stats["elapsed_seconds"])
+    for config_path, result in stats["contexts"].items():
+        if result.error:
+            logger.error("  %s: FAILED (%s)", config_path, result.error)
+        else:
+            logger.info("  %s: %d fetched in %.2fs", config_path, result.stats["fetched"], result.elapsed_seconds)
+    logger.info("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 """Script to sync Bunq payments to database.
 
+Set BUNQ_ARCHIVE_DIR to keep the raw payment pages for offline replay
+(see replay_bunq_archive).
+
 Usage:
     python -m src.budgetbuddy.banking.bunq.scripts.sync_bunq_payments
 """
@@ -7,6 +10,7 @@ Usage:
 import os
 from pathlib import Path
 
+from src.budgetbuddy.banking.bunq.archive import PaymentArchive
 from src.budgetbuddy.banking.bunq.sync_service import BunqSyncService
 from src.common.log.logger import get_logger
 from src.db.session import SessionLocal
@@ -18,21 +22,38 @@ def main():
     """Sync all Bunq payments to the database."""
     # Get config path from environment or use default
     config_path = os.getenv("BUNQ_CONFIG_PATH", Path.home() / ".bunq" / "bunq_api_context.conf")
+    max_workers = int(os.getenv("BUNQ_SYNC_WORKERS", "4"))
+    load_mode = os.getenv("BUNQ_SYNC_LOAD_MODE", "insert")
+    archive_dir = os.getenv("BUNQ_ARCHIVE_DIR")
 
     logger.info("Starting Bunq payment sync with config: %s", config_path)
 
-    sync_service = BunqSyncService(config_path)
+    archive = PaymentArchive(archive_dir) if archive_dir else None
+    sync_service = BunqSyncService(config_path, archive=archive)
 
     with SessionLocal() as session:
-        stats = sync_service.sync_all_payments(db=session, account_status_filter="ACTIVE")
+        account_stats = sync_service.sync_monetary_accounts(db=session)
+        stats = sync_service.sync_all_payments(
+            db=session, account_status_filter="ACTIVE", max_workers=max_workers, load_mode=load_mode
+        )
 
     # Report results
     logger.info("=" * 50)
     logger.info("SYNC SUMMARY")
     logger.info("=" * 50)
+    logger.info("Accounts synced:            %d", account_stats["accounts"])
     logger.info("Payments fetched from Bunq: %d", stats["fetched"])
     logger.info("New transactions inserted:  %d", stats["inserted"])
+    logger.info("Changed transactions:       %d", stats["updated"])
     logger.info("Duplicates skipped:         %d", stats["skipped"])
+    logger.info("Elapsed seconds:            %.2f", stats["elapsed_seconds"])
+    for account_id, per_account in stats["accounts"].items():
+        logger.info(
+            "  account %s: %d fetched in %.2fs",
+            account_id,
+            per_account["fetched"],
+            per_account["fetch_seconds"],
+        )
     logger.info("=" * 50)
 
 
@@ -0,0 +1,143 @@
+"""Reuse and refresh of persisted Bunq API sessions."""
+
+from __future__ import annotations
+
+import datetime
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+from bunq.sdk.context.api_context import ApiContext
+
+from src.common.log.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Renegotiate the session when it expires within this many seconds, so a
+# sync never has to handshake halfway through paging
+DEFAULT_REFRESH_AHEAD_SECONDS = 300
+
+
+def atomic_write_text(path: Path, data: str) -> None:
+    """Replace ``path`` with ``data`` without ever exposing a partial file.
+
+    The data is written to a temporary file in the same directory, flushed
+    to disk and then renamed over the target. The file keeps its
+    permissions, or gets 0600 if it is new, since API contexts hold keys.
+
+    Args:
+        path (Path): File to replace.
+        data (str): New file contents.
+    """
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o600
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+class BunqSessionManager:
+    """Keeps a Bunq API context alive across clients and runs.
+
+    The context is restored from disk once and reused. If its session is
+    missing or about to expire it is renegotiated up front, and whenever the
+    context changed (a refresh here or a reset by the SDK during requests)
+    it is written back atomically, so the next run starts with a live
+    session instead of a fresh handshake.
+
+    Can be used as a context manager, which loads on entry and persists any
+    change on exit.
+    """
+
+    def __init__(
+        self,
+        config_path: str | Path,
+        refresh_ahead_seconds: float = DEFAULT_REFRESH_AHEAD_SECONDS,
+        clock: Callable[[], datetime.datetime] = datetime.datetime.now,
+    ):
+        """Initialize the manager.
+
+        Args:
+            config_path (str | Path): Path to bunq_api_context.conf file.
+            refresh_ahead_seconds (float): Refresh sessions expiring within
+                this many seconds. Defaults to DEFAULT_REFRESH_AHEAD_SECONDS.
+            clock (Callable[[], datetime.datetime]): Local time source, as
+                the SDK stores naive local expiry times. Defaults to
+                datetime.now.
+        """
+        self.config_path = Path(config_path)
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self._clock = clock
+        self.api_context: ApiContext | None = None
+        self._saved_json: str | None = None
+
+    def __enter__(self) -> ApiContext:
+        return self.load()
+
+    def __exit__(self, *exc_info) -> None:
+        self.save_if_changed()
+
+    def load(self) -> ApiContext:
+        """Return a context with a live session, refreshing it if needed.
+
+        Returns:
+            ApiContext: The (possibly refreshed) API context.
+        """
+        if self.api_context is None:
+            self.api_context = ApiContext.restore(str(self.config_path))
+            self._saved_json = self.api_context.to_json()
+            logger.info("Bunq API context restored from %s", self.config_path)
+
+        if self.needs_refresh():
+            logger.info("Refreshing Bunq session (expires in %s seconds)", self.seconds_until_expiry())
+            self.api_context.reset_session()
+
+        self.save_if_changed()
+        return self.api_context
+
+    def seconds_until_expiry(self) -> float | None:
+        """Seconds until the current session expires, None if unknown.
+
+        Returns:
+            float | None: Remaining session lifetime in seconds.
+        """
+        session_context = self.api_context.session_context if self.api_context else None
+        expiry_time = getattr(session_context, "expiry_time", None)
+        if not isinstance(expiry_time, datetime.datetime):
+            return None
+        return (expiry_time - self._clock()).total_seconds()
+
+    def needs_refresh(self) -> bool:
+        """Whether the session is missing or expires within the refresh window.
+
+        Returns:
+            bool: True if the session should be renegotiated now.
+        """
+        remaining = self.seconds_until_expiry()
+        return remaining is None or remaining <= self.refresh_ahead_seconds
+
+    def save_if_changed(self) -> bool:
+        """Persist the context if it differs from what is on disk.
+
+        Returns:
+            bool: True if the file was written.
+        """
+        if self.api_context is None:
+            return False
+
+        current = self.api_context.to_json()
+        if current == self._saved_json:
+            return False
+
+        atomic_write_text(self.config_path, current)
+        self._saved_json = current
+        logger.info("Bunq API context saved to %s", self.config_path)
+        return True
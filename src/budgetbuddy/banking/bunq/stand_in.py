@@ -0,0 +1,389 @@
+"""Local stand-in for the Bunq API, for benchmarks and end-to-end tests.
+
+Serves the endpoints a sync touches (bank and savings account listings and
+the payment listing) with synthetic data, paginated and signed like the
+real API, so the unmodified SDK and ``BunqSyncService`` can run against it.
+URL notification filters can be registered as well, and ``notification``
+builds signed payment callbacks as Bunq would push them.
+Latency and HTTP 429 responses can be injected to exercise the rate
+limiter.
+
+Histories are generated on demand from the payment index, so serving an
+account with a million payments costs no memory.
+"""
+
+from __future__ import annotations
+
+import base64
+import datetime
+import json
+import random
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from decimal import Decimal
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, cast
+from urllib.parse import parse_qs, urlparse
+
+from bunq.sdk.context.api_context import ApiContext
+from bunq.sdk.context.api_environment_type import ApiEnvironmentType
+from bunq.sdk.context.installation_context import InstallationContext
+from bunq.sdk.context.session_context import SessionContext
+from bunq.sdk.model.core.session_token import SessionToken
+from bunq.sdk.model.generated.endpoint import UserPersonApiObject
+from bunq.sdk.security import security
+from Cryptodome.Hash import SHA256
+from Cryptodome.Signature import pkcs1_15
+
+from src.budgetbuddy.banking.bunq.session import atomic_write_text
+from src.common.log.logger import get_logger
+
+logger = get_logger(__name__)
+
+STAND_IN_USER_ID = 4242
+# IDs far above real Bunq IDs, so benchmark rows never collide with synced data
+FIRST_ACCOUNT_ID = 9_000_000_000
+FIRST_PAYMENT_ID = 9_000_000_000_000
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 200
+STATS_PATH = "/_stand_in/stats"
+
+_HISTORY_END = datetime.datetime(2025, 1, 1)
+_PAYMENT_INTERVAL = datetime.timedelta(minutes=47)
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+@dataclass(frozen=True)
+class SyntheticHistory:
+    """Deterministic accounts and payments served by the stand-in.
+
+    Account ``n`` (0-based) has ID ``FIRST_ACCOUNT_ID + n`` and owns a
+    contiguous block of ``payments_per_account`` payment IDs, newest last.
+    Every ``savings_every``-th account is a savings account.
+    """
+
+    accounts: int = 3
+    payments_per_account: int = 1000
+    savings_every: int = 3
+
+    def account_ids(self) -> range:
+        return range(FIRST_ACCOUNT_ID, FIRST_ACCOUNT_ID + self.accounts)
+
+    def payment_ids(self, account_id: int) -> range:
+        """All payment IDs of an account, oldest first."""
+        first = FIRST_PAYMENT_ID + (account_id - FIRST_ACCOUNT_ID) * self.payments_per_account
+        return range(first, first + self.payments_per_account)
+
+    @property
+    def total_payments(self) -> int:
+        return self.accounts * self.payments_per_account
+
+    def is_savings(self, account_id: int) -> bool:
+        return (account_id - FIRST_ACCOUNT_ID) % self.savings_every == self.savings_every - 1
+
+    def account(self, account_id: int) -> dict:
+        """Render an account in Bunq's JSON shape."""
+        index = account_id - FIRST_ACCOUNT_ID
+        timestamp = _HISTORY_END.strftime(_TIMESTAMP_FORMAT)
+        iban = f"NL{index % 100:02d}BUNQ{index:010d}"
+        return {
+            "id": account_id,
+            "created": timestamp,
+            "updated": timestamp,
+            "description": f"Stand-in {'savings' if self.is_savings(account_id) else 'account'} {index}",
+            "currency": "EUR",
+            "status": "ACTIVE",
+            "balance": {"value": f"{1000 + index * 10}.00", "currency": "EUR"},
+            "alias": [{"type": "IBAN", "value": iban, "name": "Stand-in User"}],
+        }
+
+    def payment(self, account_id: int, payment_id: int) -> dict:
+        """Render a payment in Bunq's JSON shape."""
+        index = payment_id - FIRST_PAYMENT_ID
+        age = self.payment_ids(account_id).stop - payment_id
+        timestamp = (_HISTORY_END - age * _PAYMENT_INTERVAL).strftime(_TIMESTAMP_FORMAT)
+        amount = Decimal(index % 25_000) / 100 + Decimal("0.01")
+        return {
+            "id": payment_id,
+            "created": timestamp,
+            "updated": timestamp,
+            "monetary_account_id": account_id,
+            "amount": {"value": str(-amount if index % 4 else amount), "currency": "EUR"},
+            "description": f"Stand-in payment {index}",
+            "type": "BUNQ" if index % 3 else "IDEAL",
+            "counterparty_alias": {
+                "iban": f"NL{index % 97:02d}BUNQ{index % 10_000_000_000:010d}",
+                "display_name": f"Merchant {index % 250}",
+                "country": "NL",
+            },
+        }
+
+    def payment_page(self, account_id: int, count: int, older_id: int | None) -> tuple[list[int], int | None]:
+        """IDs of one page, newest first, and the older_id of the next page.
+
+        Args:
+            account_id (int): Monetary account ID.
+            count (int): Page size.
+            older_id (int | None): Only payments older than this ID.
+
+        Returns:
+            tuple[list[int], int | None]: Payment IDs and the cursor of the
+                next page, None if this is the oldest page.
+        """
+        ids = self.payment_ids(account_id)
+        newest = ids.stop - 1 if older_id is None else min(older_id - 1, ids.stop - 1)
+        page = list(range(newest, max(newest - count, ids.start - 1), -1))
+        has_older = bool(page) and page[-1] > ids.start
+        return page, page[-1] if has_older else None
+
+
+class BunqStandIn:
+    """Threaded HTTP server speaking enough of the Bunq API for a sync.
+
+    Responses are signed with the stand-in's own server key; the API
+    context written by ``write_api_context`` trusts that key, so the SDK's
+    response validation runs as it does against Bunq.
+    """
+
+    def __init__(
+        self,
+        history: SyntheticHistory | None = None,
+        latency_seconds: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialize the stand-in (call ``start`` to serve).
+
+        Args:
+            history (SyntheticHistory | None): Data to serve. Defaults to
+                SyntheticHistory().
+            latency_seconds (float): Delay added to every response.
+            throttle_rate (float): Fraction of requests answered with 429.
+            seed (int): Seed for the throttling decisions.
+            host (str): Interface to bind. Defaults to localhost.
+            port (int): Port to bind, 0 picks a free one.
+        """
+        self.history = history or SyntheticHistory()
+        self.latency_seconds = latency_seconds
+        self.throttle_rate = throttle_rate
+        self.server_key = security.generate_rsa_private_key()
+        self.api_calls = 0
+        self.throttled = 0
+        # Registered URL notification filters per account
+        self.notification_filters: dict[int, list[dict]] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URI to use in place of Bunq's, e.g. http://127.0.0.1:8080/v1/."""
+        # An AF_INET server, so the address is a (host, port) pair
+        host, port = cast("tuple[str, int]", self._server.server_address)
+        return f"http://{host}:{port}/v1/"
+
+    def start(self) -> BunqStandIn:
+        self._thread = threading.Thread(target=self._server.serve_forever, name="bunq-stand-in", daemon=True)
+        self._thread.start()
+        logger.info("Bunq stand-in serving %s at %s", self.history, self.url)
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> BunqStandIn:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"api_calls": self.api_calls, "throttled": self.throttled}
+
+    def write_api_context(self, path: str | Path) -> Path:
+        """Write an API context file with a live session for the stand-in.
+
+        Args:
+            path (str | Path): Where to write the context.
+
+        Returns:
+            Path: The written path, to pass to ``BunqClient``.
+        """
+        api_context = ApiContext(ApiEnvironmentType.SANDBOX)
+        api_context._api_key = "stand-in"
+        api_context._installation_context = InstallationContext(
+            "stand-in-installation", security.generate_rsa_private_key(), self.server_key.publickey()
+        )
+
+        token = SessionToken()
+        token._token = "stand-in-session"
+        user = UserPersonApiObject.from_json(json.dumps({"id": STAND_IN_USER_ID, "display_name": "Stand-in User"}))
+        expiry = datetime.datetime.now() + datetime.timedelta(days=1)
+        api_context._session_context = SessionContext(token, expiry, user)
+
+        path = Path(path)
+        atomic_write_text(path, api_context.to_json())
+        return path
+
+    def should_throttle(self) -> bool:
+        with self._lock:
+            self.api_calls += 1
+            throttle = self.throttle_rate > 0 and self._random.random() < self.throttle_rate
+            self.throttled += throttle
+            return throttle
+
+    def sign(self, body: bytes) -> str:
+        return base64.b64encode(pkcs1_15.new(self.server_key).sign(SHA256.new(body))).decode()
+
+    def set_notification_filters(self, account_id: int, filters: list[dict]) -> int:
+        """Replace an account's filters, as Bunq does on create, and return the filter count."""
+        with self._lock:
+            self.notification_filters[account_id] = [
+                {"category": f["category"], "notification_target": f["notification_target"]} for f in filters
+            ]
+            return len(self.notification_filters[account_id])
+
+    def notification(self, account_id: int, payment_id: int, category: str = "MUTATION") -> tuple[bytes, dict]:
+        """Build a signed payment callback as Bunq would POST it.
+
+        Args:
+            account_id (int): Account of the payment.
+            payment_id (int): Payment to notify about.
+            category (str): Notification category. Defaults to 'MUTATION'.
+
+        Returns:
+            tuple[bytes, dict]: Request body and headers.
+        """
+        payload = {
+            "NotificationUrl": {
+                "target_url": "stand-in",
+                "category": category,
+                "event_type": "MUTATION_CREATED",
+                "object": {"Payment": self.history.payment(account_id, payment_id)},
+            }
+        }
+        body = json.dumps(payload).encode()
+        return body, {"Content-Type": "application/json", "X-Bunq-Server-Signature": self.sign(body)}
+
+
+def _make_handler(stand_in: BunqStandIn) -> type[BaseHTTPRequestHandler]:
+    history = stand_in.history
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # noqa: A002 - silence per-request stderr logging
+            pass
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == STATS_PATH:
+                return self._send(HTTPStatus.OK, stand_in.stats())
+            if not self._admit():
+                return
+
+            parts = url.path.strip("/").split("/")
+            query = parse_qs(url.query)
+            match parts:
+                case ["v1", "user", _, "monetary-account-bank"]:
+                    ids = [i for i in history.account_ids() if not history.is_savings(i)]
+                    return self._send_list("MonetaryAccountBank", [history.account(i) for i in ids])
+                case ["v1", "user", _, "monetary-account-savings"]:
+                    ids = [i for i in history.account_ids() if history.is_savings(i)]
+                    return self._send_list("MonetaryAccountSavings", [history.account(i) for i in ids])
+                case ["v1", "user", _, "monetary-account", account_id, "payment"] if (
+                    int(account_id) in history.account_ids()
+                ):
+                    return self._send_payments(url.path, int(account_id), query)
+                case ["v1", "user", _, "monetary-account", account_id, "notification-filter-url"] if (
+                    int(account_id) in history.account_ids()
+                ):
+                    with stand_in._lock:
+                        filters = list(stand_in.notification_filters.get(int(account_id), []))
+                    return self._send_list("NotificationFilterUrl", filters)
+            return self._send_not_found(url.path)
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if not self._admit():
+                return
+
+            match url.path.strip("/").split("/"):
+                case ["v1", "user", _, "monetary-account", account_id, "notification-filter-url"] if (
+                    int(account_id) in history.account_ids()
+                ):
+                    filters = json.loads(body)["notification_filters"]
+                    count = stand_in.set_notification_filters(int(account_id), filters)
+                    return self._send_list("Id", [{"id": count}])
+            return self._send_not_found(url.path)
+
+        def _admit(self) -> bool:
+            """Apply injected latency and throttling; False if answered with 429."""
+            if stand_in.latency_seconds:
+                threading.Event().wait(stand_in.latency_seconds)
+            if stand_in.should_throttle():
+                self._send(HTTPStatus.TOO_MANY_REQUESTS, {"Error": [{"error_description": "Too many requests"}]})
+                return False
+            return True
+
+        def _send_not_found(self, path: str) -> None:
+            self._send(HTTPStatus.NOT_FOUND, {"Error": [{"error_description": f"Unknown route {path}"}]})
+
+        def _send_payments(self, path: str, account_id: int, query: dict[str, list[str]]) -> None:
+            count = min(int(query.get("count", [DEFAULT_PAGE_SIZE])[0]), MAX_PAGE_SIZE)
+            older_id = int(query["older_id"][0]) if "older_id" in query else None
+            ids, next_older_id = history.payment_page(account_id, count, older_id)
+            pagination = {
+                "future_url": None,
+                "newer_url": f"{path}?count={count}&newer_id={ids[0]}" if ids else None,
+                "older_url": f"{path}?count={count}&older_id={next_older_id}" if next_older_id else None,
+            }
+            self._send_list("Payment", [history.payment(account_id, i) for i in ids], pagination)
+
+        def _send_list(self, object_type: str, items: list[dict], pagination: dict | None = None) -> None:
+            body: dict[str, Any] = {"Response": [{object_type: item} for item in items]}
+            if pagination is not None:
+                body["Pagination"] = pagination
+            self._send(HTTPStatus.OK, body)
+
+        def _send(self, status: HTTPStatus, payload: dict) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("X-Bunq-Client-Response-Id", "stand-in")
+            self.send_header("X-Bunq-Server-Signature", stand_in.sign(body))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+@contextmanager
+def sdk_base_url(url: str) -> Iterator[None]:
+    """Point the SDK's sandbox environment at ``url`` for the duration.
+
+    API contexts written by ``BunqStandIn.write_api_context`` use the
+    sandbox environment, whose base URI is process-global in the SDK.
+
+    Args:
+        url (str): Base URI, usually ``BunqStandIn.url``.
+    """
+    environment = ApiEnvironmentType.SANDBOX
+    original = environment._uri_base
+    environment._uri_base = url
+    try:
+        yield
+    finally:
+        environment._uri_base = original
@@ -1,77 +1,315 @@
 """Service for syncing Bunq transactions to the database."""
 
+import time
+from collections.abc import Iterable
+from datetime import datetime
 from pathlib import Path
+from typing import Any, Literal
 
 from sqlalchemy.orm import Session
-from src.budgetbuddy.banking.bunq.adapter import BunqPaymentAdapter
+
+from src.budgetbuddy.banking.bunq.adapter import BunqMonetaryAccountAdapter, BunqPaymentAdapter, BunqRawPaymentAdapter
+from src.budgetbuddy.banking.bunq.archive import PaymentArchive
 from src.budgetbuddy.banking.bunq.fetch import BunqClient
-from src.budgetbuddy.services.transaction_service import create_transactions_bulk
+from src.budgetbuddy.banking.bunq.rate_limit import BunqRateLimiter
+from src.budgetbuddy.banking.schemas.transaction import TransactionCreate
+from src.budgetbuddy.services.monetary_account_service import upsert_monetary_accounts
+from src.budgetbuddy.services.sync_watermark_service import advance_watermark, get_watermarks, save_checkpoint
+from src.budgetbuddy.services.transaction_service import (
+    create_transaction_rows_bulk,
+    create_transactions_bulk,
+    upsert_transaction_rows_bulk,
+    upsert_transactions_bulk,
+)
 from src.common.log.logger import get_logger
 
 logger = get_logger(__name__)
 
+EXTERNAL_SOURCE = "bunq"
+
+# "insert" and "copy" skip payments that already exist, "upsert" updates
+# them when they changed on Bunq's side
+LoadMode = Literal["insert", "copy", "upsert"]
+
 
 class BunqSyncService:
     """High-level service for syncing Bunq payments to database.
 
-    Handles the full ETL pipeline:
-    - Extract: Fetch payments from Bunq API
+    Handles the full ETL pipeline, one page at a time:
+    - Extract: Stream payment pages from Bunq API
     - Transform: Convert to domain models via adapter
     - Load: Bulk insert with duplicate handling
+
+    Each page is loaded before the next one is held in memory, so peak
+    memory is bounded by the page size rather than the account history.
+
+    Syncs are incremental: a per-account watermark records the newest
+    synced payment so later runs only page through new payments.
     """
 
-    def __init__(self, bunq_config_path: str | Path):
+    def __init__(
+        self,
+        bunq_config_path: str | Path,
+        rate_limiter: BunqRateLimiter | None = None,
+        archive: PaymentArchive | None = None,
+    ):
         """Initialize sync service.
 
         Args:
             bunq_config_path (str | Path): Path to Bunq API config file.
+            rate_limiter (BunqRateLimiter | None): Limiter for the client's
+                API calls. Defaults to Bunq's published limits.
+            archive (PaymentArchive | None): Archive the raw payment pages
+                of every sync here, for later replay. Defaults to None.
+        """
+        self.client = BunqClient(bunq_config_path, rate_limiter=rate_limiter, archive=archive)
+
+    def sync_monetary_accounts(self, db: Session, account_status_filter: str | None = None) -> dict[str, Any]:
+        """Sync monetary accounts and snapshot their balances.
+
+        Accounts are upserted by external_id and every run appends one
+        balance snapshot per account, so balances can be served from the
+        database instead of the Bunq API.
+
+        Args:
+            db (Session): Database session.
+            account_status_filter (str | None): Filter accounts by status.
+                Defaults to None (all accounts).
+
+        Returns:
+            dict[str, Any]: Statistics with keys:
+                - accounts: Number of accounts upserted and snapshotted
+                - account_ids: Bunq IDs of those accounts
+                - elapsed_seconds: Wall-clock time of the account sync
         """
-        self.client = BunqClient(bunq_config_path)
+        started = time.perf_counter()
+
+        accounts = self.client.list_all_monetary_accounts(account_status_filter)
+        synced = upsert_monetary_accounts(db, BunqMonetaryAccountAdapter.to_monetary_account_creates(accounts))
+
+        stats = {
+            "accounts": synced,
+            "account_ids": [account.id_ for account in accounts],
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+        }
+        logger.info("Account sync complete: %d accounts in %.2fs", stats["accounts"], stats["elapsed_seconds"])
+        return stats
 
     def sync_all_payments(
         self,
         db: Session,
         account_status_filter: str = "ACTIVE",
-    ) -> dict[str, int]:
+        full_resync: bool = False,
+        max_workers: int = 1,
+        load_mode: LoadMode = "insert",
+        account_ids: Iterable[int] | None = None,
+    ) -> dict[str, Any]:
         """Sync all payments from Bunq to database.
 
+        Each account is fetched incrementally from its stored watermark, so
+        only payments newer than the last synced one are requested. Pages
+        are converted and inserted as they arrive; the watermark is advanced
+        once all pages of an account are committed. After every committed
+        page the pagination cursor is checkpointed, so an interrupted pass
+        resumes at the next page on the following run.
+
         Args:
             db (Session): Database session.
             account_status_filter (str): Filter accounts by status.
                 Defaults to "ACTIVE".
+            full_resync (bool): Ignore watermarks and checkpoints and walk
+                the full history. Defaults to False.
+            max_workers (int): Number of accounts fetched concurrently.
+                Defaults to 1 (sequential).
+            load_mode (LoadMode): How pages are written. "copy" suits large
+                backfills, "upsert" refreshes payments that changed since
+                they were synced (combine with full_resync to re-sync
+                history). Defaults to "insert".
+            account_ids (Iterable[int] | None): Sync only these Bunq account
+                IDs and skip listing the accounts. Defaults to None (every
+                account matching ``account_status_filter``).
 
         Returns:
-            dict[str, int]: Statistics with keys:
+            dict[str, Any]: Statistics with keys:
                 - fetched: Number of payments fetched from Bunq
                 - inserted: Number of new transactions inserted
-                - skipped: Number of duplicates skipped
+                - updated: Number of changed transactions updated (upsert)
+                - skipped: Number of duplicates or unchanged rows skipped
+                - elapsed_seconds: Wall-clock time of the whole sync
+                - accounts: Per account ID, its fetched/inserted/updated/
+                  skipped counts and fetch_seconds spent paging the Bunq API
         """
-        logger.info("Starting Bunq payment sync")
+        logger.info("Starting Bunq payment sync (full_resync=%s, max_workers=%d)", full_resync, max_workers)
+        started = time.perf_counter()
+
+        stats: dict[str, Any] = {"fetched": 0, "inserted": 0, "updated": 0, "skipped": 0, "accounts": {}}
+        since_ids: dict[int, int] = {}
+        resume_from: dict[int, int] = {}
+        # Newest payment (id, created_at) seen per account, persisted once the account's last page is loaded
+        pending_watermarks: dict[int, tuple[int, datetime | None]] = {}
 
-        # Extract: Fetch from Bunq API
-        bunq_payments = self.client.fetch_all_payments(ma_status_filter=account_status_filter)
+        if not full_resync:
+            for acct_id, wm in get_watermarks(db, EXTERNAL_SOURCE).items():
+                if wm.last_payment_id is not None:
+                    since_ids[acct_id] = wm.last_payment_id
+                if wm.resume_older_id is not None and wm.pending_payment_id is not None:
+                    resume_from[acct_id] = wm.resume_older_id
+                    pending_watermarks[acct_id] = (wm.pending_payment_id, wm.pending_payment_created_at)
 
-        if not bunq_payments:
-            logger.warning("No payments fetched from Bunq")
-            return {"fetched": 0, "inserted": 0, "skipped": 0}
+        if resume_from:
+            logger.info("Resuming interrupted sync for accounts %s", sorted(resume_from))
 
-        logger.info("Fetched %d payments from Bunq", len(bunq_payments))
+        # Extract: Stream pages from Bunq API, stopping at each account's watermark
+        pages = self.client.iter_all_payment_pages(
+            ma_status_filter=account_status_filter,
+            watermarks=since_ids,
+            max_workers=max_workers,
+            resume_from=resume_from,
+            account_ids=account_ids,
+        )
 
-        transaction_creates = BunqPaymentAdapter.to_transaction_creates(bunq_payments)
+        for page in pages:
+            account_id = page.monetary_account_id
+            account_stats = stats["accounts"].setdefault(
+                account_id, {"fetched": 0, "inserted": 0, "updated": 0, "skipped": 0, "fetch_seconds": 0.0}
+            )
+            account_stats["fetch_seconds"] = round(account_stats["fetch_seconds"] + page.elapsed_seconds, 3)
 
-        inserted, skipped = create_transactions_bulk(db, transaction_creates, skip_duplicates=True)
+            if page.payments:
+                # Transform + Load this page before the next one is processed
+                transaction_creates = BunqPaymentAdapter.to_transaction_creates(page.payments)
+                inserted, updated, skipped = self._load(db, transaction_creates, load_mode)
 
-        stats = {
-            "fetched": len(bunq_payments),
-            "inserted": inserted,
-            "skipped": skipped,
-        }
+                newest = max(range(len(page.payments)), key=lambda i: page.payments[i].id_)
+                if (
+                    account_id not in pending_watermarks
+                    or page.payments[newest].id_ > pending_watermarks[account_id][0]
+                ):
+                    pending_watermarks[account_id] = (
+                        page.payments[newest].id_,
+                        transaction_creates[newest].external_created_at,
+                    )
+
+                for counts in (account_stats, stats):
+                    counts["fetched"] += len(page.payments)
+                    counts["inserted"] += inserted
+                    counts["updated"] += updated
+                    counts["skipped"] += skipped
+
+            # Only move the watermark once every page of the account is stored;
+            # until then, checkpoint the cursor so a restart resumes from here
+            if page.is_last and account_id in pending_watermarks:
+                payment_id, created_at = pending_watermarks.pop(account_id)
+                advance_watermark(db, EXTERNAL_SOURCE, account_id, payment_id, created_at)
+            elif not page.is_last and page.older_id is not None and account_id in pending_watermarks:
+                payment_id, created_at = pending_watermarks[account_id]
+                save_checkpoint(db, EXTERNAL_SOURCE, account_id, page.older_id, payment_id, created_at)
+
+        # Keep a session the SDK renegotiated mid-run for the next run
+        self.client.save_context()
+
+        stats["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+
+        if not stats["fetched"]:
+            logger.warning("No new payments fetched from Bunq")
 
         logger.info(
-            "Sync complete: %d fetched, %d inserted, %d skipped",
+            "Sync complete: %d fetched, %d inserted, %d updated, %d skipped in %.2fs",
             stats["fetched"],
             stats["inserted"],
+            stats["updated"],
             stats["skipped"],
+            stats["elapsed_seconds"],
         )
 
         return stats
+
+    @classmethod
+    def replay_archive(
+        cls,
+        db: Session,
+        archive: PaymentArchive,
+        account_ids: list[int] | None = None,
+        load_mode: LoadMode = "upsert",
+        batch_size: int = 5000,
+    ) -> dict[str, Any]:
+        """Rebuild transactions from archived raw pages, without API calls.
+
+        Maps the archived JSON with ``BunqRawPaymentAdapter``, which shares
+        its field mapping with live syncs, so mapping changes can be applied
+        to the whole history offline without building SDK objects or
+        per-row models. Needs no Bunq context and
+        leaves watermarks untouched. Pages are loaded in the order they
+        were fetched, so the latest fetch of a payment wins.
+
+        Args:
+            db (Session): Database session.
+            archive (PaymentArchive): Archive written by earlier syncs.
+            account_ids (list[int] | None): Only replay these accounts.
+                Defaults to every archived account.
+            load_mode (LoadMode): How rows are written. The default
+                "upsert" rewrites transactions whose mapping changed.
+            batch_size (int): Transactions written per load. Defaults to 5000.
+
+        Returns:
+            dict[str, Any]: Statistics with keys pages, payments, inserted,
+                updated, skipped and elapsed_seconds.
+        """
+        started = time.perf_counter()
+        stats: dict[str, Any] = {"pages": 0, "payments": 0, "inserted": 0, "updated": 0, "skipped": 0}
+        batch: list[tuple] = []
+
+        def flush() -> None:
+            inserted, updated, skipped = cls._load_rows(db, batch, load_mode)
+            stats["inserted"] += inserted
+            stats["updated"] += updated
+            stats["skipped"] += skipped
+            batch.clear()
+
+        for page in archive.iter_pages(account_ids):
+            payments = page.raw_payments()
+            batch.extend(BunqRawPaymentAdapter.to_transaction_rows(payments))
+            stats["pages"] += 1
+            stats["payments"] += len(payments)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+
+        stats["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        logger.info(
+            "Replayed %d archived payments from %d pages: %d inserted, %d updated, %d skipped in %.2fs",
+            stats["payments"],
+            stats["pages"],
+            stats["inserted"],
+            stats["updated"],
+            stats["skipped"],
+            stats["elapsed_seconds"],
+        )
+        return stats
+
+    @staticmethod
+    def _load(db: Session, transaction_creates: list[TransactionCreate], load_mode: LoadMode) -> tuple[int, int, int]:
+        """Write one page of transactions.
+
+        Returns:
+            tuple[int, int, int]: (inserted, updated, skipped).
+        """
+        if load_mode == "upsert":
+            return upsert_transactions_bulk(db, transaction_creates)
+
+        inserted, skipped = create_transactions_bulk(db, transaction_creates, skip_duplicates=True, mode=load_mode)
+        return (inserted, 0, skipped)
+
+    @staticmethod
+    def _load_rows(db: Session, rows: list[tuple], load_mode: LoadMode) -> tuple[int, int, int]:
+        """Write prepared bulk rows, like ``_load``.
+
+        Returns:
+            tuple[int, int, int]: (inserted, updated, skipped).
+        """
+        if load_mode == "upsert":
+            return upsert_transaction_rows_bulk(db, rows)
+
+        inserted, skipped = create_transaction_rows_bulk(db, rows, skip_duplicates=True, mode=load_mode)
+        return (inserted, 0, skipped)
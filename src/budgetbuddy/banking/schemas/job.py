@@ -0,0 +1,38 @@
+"""Background job schemas for API requests and responses."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class BunqSyncJobCreate(BaseModel):
+    """Schema for enqueuing a Bunq sync."""
+
+    full_resync: bool = False
+    load_mode: Literal["insert", "copy", "upsert"] = "insert"
+    priority: int = 0
+
+
+class JobRead(BaseModel):
+    """Schema for reading a job's status from the API."""
+
+    itemid: UUID
+    kind: str
+    status: str
+    priority: int
+    attempts: int
+    max_attempts: int
+    payload: dict[str, Any]
+    result: dict[str, Any] | None = None
+    last_error: str | None = None
+    run_after: datetime
+    finished_at: datetime | None = None
+    createdtimestamp: datetime
+    updatedtimestamp: datetime
+
+    class Config:
+        from_attributes = True
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from uuid import UUID
 
 from pydantic import BaseModel
 
@@ -38,5 +39,20 @@ class MonetaryAccountUpdate(MonetaryAccountBase):
 class MonetaryAccountRead(MonetaryAccountBase):
     """Schema for reading a MonetaryAccount from the API."""
 
+    itemid: UUID
+    createdtimestamp: datetime
+    updatedtimestamp: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class MonetaryAccountBalanceRead(BaseModel):
+    """Schema for reading a balance snapshot from the API."""
+
+    balance: float
+    currency: str
+    captured_at: datetime
+
     class Config:
         from_attributes = True
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -37,6 +38,36 @@ class TransactionUpdate(TransactionBase):
     pass
 
 
+class TransactionBulkUpdate(TransactionUpdate):
+    """One item of a bulk update: the transaction and the fields to change."""
+
+    itemid: UUID
+
+
+class TransactionFilters(BaseModel):
+    """Filters of transaction listings and exports; unset fields do not filter."""
+
+    category: str | None = Field(None, description="Exact category")
+    currency: str | None = Field(None, min_length=3, max_length=3, description="Currency code (ISO 4217)")
+    min_amount: float | None = Field(None, description="Smallest amount, inclusive")
+    max_amount: float | None = Field(None, description="Largest amount, inclusive")
+    counterparty_iban: str | None = Field(None, description="Counterparty IBAN; spaces and case are ignored")
+    external_source: str | None = Field(None, description="External source system")
+    transaction_type: str | None = Field(None, description="Type of transaction")
+
+
+BulkItemStatus = Literal["created", "skipped", "invalid", "updated", "deleted", "not_found"]
+
+
+class TransactionBulkResult(BaseModel):
+    """Outcome of one item of a bulk request."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    itemid: UUID | None = Field(None, description="Transaction created or targeted by the item")
+    status: BulkItemStatus
+    detail: str | None = Field(None, description="Why the item was not applied")
+
+
 class TransactionRead(TransactionBase):
     """Schema for reading a transaction from the API."""
 
@@ -47,6 +78,7 @@ class TransactionRead(TransactionBase):
     external_id: str | None = None
     external_created_at: datetime | None = None
     external_updated_at: datetime | None = None
+    duplicate_of: UUID | None = Field(None, description="Transaction this one probably duplicates")
 
     class Config:
         from_attributes = True
@@ -0,0 +1,95 @@
+"""Shared helpers of the bank statement parsers."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import Counter
+from collections.abc import Callable, Iterator
+from datetime import UTC, date, datetime
+from decimal import Decimal, InvalidOperation
+
+from src.budgetbuddy.banking.schemas.transaction import TransactionCreate
+
+# Statements carry signed amounts, but transactions store the absolute
+# amount (as Bunq payments do) and the direction as transaction_type
+CREDIT = "CREDIT"
+DEBIT = "DEBIT"
+
+# A parser reads a binary stream and lazily yields its entries
+StatementParser = Callable[..., Iterator[TransactionCreate]]
+
+
+class StatementParseError(ValueError):
+    """Raised when a statement file is malformed."""
+
+
+def parse_amount(value: str, decimal_comma: bool = False) -> Decimal:
+    """Parse a statement amount such as '1234.56', '1.234,56' or '12,'.
+
+    Args:
+        value (str): Amount as written in the statement.
+        decimal_comma (bool): The decimal separator is a comma.
+
+    Returns:
+        Decimal: The amount.
+
+    Raises:
+        StatementParseError: If the value is not a number.
+    """
+    text = value.strip().replace(" ", "")
+    if decimal_comma:
+        text = text.replace(".", "").replace(",", ".")
+    try:
+        return Decimal(text)
+    except InvalidOperation as exc:
+        raise StatementParseError(f"Invalid amount {value!r}") from exc
+
+
+def to_datetime(day: date | None) -> datetime | None:
+    """Booking dates are stored as midnight UTC."""
+    return datetime(day.year, day.month, day.day, tzinfo=UTC) if day else None
+
+
+class EntryIds:
+    """Deterministic external_ids for statement entries.
+
+    An entry with a bank reference is identified by it. Without one, the
+    entry's own fields are hashed, plus a counter that tells identical
+    entries of the same day apart. Re-importing a statement therefore
+    yields the same IDs, which keeps imports idempotent.
+
+    The counters cover the whole stream, not just a run of one booking
+    date, so statements that are not in date order get the same IDs too.
+    """
+
+    def __init__(self, source: str, account: str | None):
+        """Initialize the generator.
+
+        Args:
+            source (str): Statement format, used as external_source.
+            account (str | None): Account the statement belongs to.
+        """
+        self.source = source
+        self.account = account or ""
+        self._seen: Counter[tuple] = Counter()
+
+    def for_entry(self, booked: date | None, reference: str | None, *fields: object) -> str:
+        """Build the external_id of one entry.
+
+        Args:
+            booked (date | None): Booking date.
+            reference (str | None): Unique bank reference, if any.
+            *fields (object): Entry fields identifying it without reference.
+
+        Returns:
+            str: external_id, e.g. 'camt053_3f5a...'.
+        """
+        if reference:
+            key: tuple = (self.account, "ref", reference)
+        else:
+            key = (self.account, booked, *fields)
+            self._seen[key] += 1
+            key = (*key, self._seen[key])
+
+        digest = hashlib.sha256("\x1f".join("" if part is None else str(part) for part in key).encode())
+        return f"{self.source}_{digest.hexdigest()[:40]}"
@@ -0,0 +1,166 @@
+"""Streaming parser for ISO 20022 CAMT.053 bank-to-customer statements.
+
+The XML is read with ``iterparse`` and every ``Ntry`` is removed from the
+tree once it has been mapped, so memory use does not grow with the size
+of the statement. Namespaces are ignored, which covers all camt.053
+versions (001.02 through 001.08).
+"""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from datetime import date, datetime
+from typing import BinaryIO
+
+from src.budgetbuddy.banking.schemas.transaction import TransactionCreate
+from src.budgetbuddy.banking.statements.base import (
+    CREDIT,
+    DEBIT,
+    EntryIds,
+    StatementParseError,
+    parse_amount,
+    to_datetime,
+)
+
+SOURCE = "camt053"
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _find(elem: ET.Element | None, path: str) -> ET.Element | None:
+    """Find a descendant by a '/'-separated path of local tag names."""
+    for name in path.split("/"):
+        if elem is None:
+            return None
+        elem = next((child for child in elem if _local(child.tag) == name), None)
+    return elem
+
+
+def _findall(elem: ET.Element | None, name: str) -> list[ET.Element]:
+    return [] if elem is None else [child for child in elem if _local(child.tag) == name]
+
+
+def _text(elem: ET.Element | None, path: str) -> str | None:
+    found = _find(elem, path)
+    text = found.text.strip() if found is not None and found.text else None
+    return text or None
+
+
+def _booking_date(entry: ET.Element) -> date | None:
+    value = _text(entry, "BookgDt/Dt") or _text(entry, "BookgDt/DtTm") or _text(entry, "ValDt/Dt")
+    if value is None:
+        return None
+    return datetime.fromisoformat(value).date() if "T" in value else date.fromisoformat(value)
+
+
+def _detail_amount(detail: ET.Element) -> ET.Element | None:
+    amount = _find(detail, "AmtDtls/TxAmt/Amt")
+    return amount if amount is not None else _find(detail, "Amt")
+
+
+def _map_entry(
+    entry: ET.Element,
+    detail: ET.Element | None,
+    amount_elem: ET.Element | None,
+    reference: str | None,
+    ids: EntryIds,
+) -> TransactionCreate:
+    if amount_elem is None or not amount_elem.text:
+        raise StatementParseError("Entry without amount")
+    amount = parse_amount(amount_elem.text)
+    currency = amount_elem.get("Ccy")
+    is_debit = (_text(detail, "CdtDbtInd") or _text(entry, "CdtDbtInd")) == "DBIT"
+    booked = _booking_date(entry)
+
+    # The counterparty is the creditor of a debit and the debtor of a credit
+    party = "Cdtr" if is_debit else "Dbtr"
+    parties = _find(detail, "RltdPties")
+    counterparty_name = _text(parties, f"{party}/Nm") or _text(parties, f"{party}/Pty/Nm")
+    counterparty_iban = _text(parties, f"{party}Acct/Id/IBAN")
+    remittance = [u.text.strip() for u in _findall(_find(detail, "RmtInf"), "Ustrd") if u.text and u.text.strip()]
+    description = " ".join(remittance) or _text(entry, "AddtlNtryInf")
+
+    return TransactionCreate(
+        amount=float(abs(amount)),
+        currency=currency,
+        description=description,
+        transaction_type=DEBIT if is_debit else CREDIT,
+        counterparty_name=counterparty_name,
+        counterparty_iban=counterparty_iban,
+        external_source=SOURCE,
+        external_id=ids.for_entry(
+            booked,
+            reference,
+            amount,
+            currency,
+            is_debit,
+            description,
+            counterparty_iban,
+            _text(detail, "Refs/EndToEndId"),
+        ),
+        external_created_at=to_datetime(booked),
+    )
+
+
+def _map_entries(entry: ET.Element, ids: EntryIds) -> Iterator[TransactionCreate]:
+    """Map one booked entry; batch bookings with per-detail amounts are split."""
+    details = _findall(_find(entry, "NtryDtls"), "TxDtls")
+    entry_reference = _text(entry, "AcctSvcrRef")
+
+    if len(details) > 1 and all(_detail_amount(detail) is not None for detail in details):
+        for index, detail in enumerate(details):
+            reference = _text(detail, "Refs/AcctSvcrRef") or (entry_reference and f"{entry_reference}/{index}")
+            yield _map_entry(entry, detail, _detail_amount(detail), reference, ids)
+    else:
+        detail = details[0] if details else None
+        yield _map_entry(entry, detail, _find(entry, "Amt"), entry_reference, ids)
+
+
+def parse_camt053(stream: BinaryIO, account: str | None = None) -> Iterator[TransactionCreate]:
+    """Yield the booked entries of a CAMT.053 statement file as transactions.
+
+    Args:
+        stream (BinaryIO): The XML file.
+        account (str | None): Account to assume when a statement does not
+            name its own.
+
+    Yields:
+        TransactionCreate: One transaction per booked entry (or per
+            transaction of a batch booking).
+
+    Raises:
+        StatementParseError: If the XML is malformed.
+    """
+    statement: ET.Element | None = None
+    ids = EntryIds(SOURCE, account)
+    has_account = False
+
+    try:
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            name = _local(elem.tag)
+            if event == "start":
+                if name == "Stmt":
+                    statement = elem
+                    ids = EntryIds(SOURCE, account)
+                    has_account = False
+                continue
+
+            if statement is None:
+                continue
+            if name == "Acct" and not has_account:
+                ids = EntryIds(SOURCE, _text(elem, "Id/IBAN") or _text(elem, "Id/Othr/Id") or account)
+                has_account = True
+            elif name == "Ntry":
+                # Pending and informational entries are not booked yet
+                if (_text(elem, "Sts/Cd") or _text(elem, "Sts")) in (None, "BOOK"):
+                    yield from _map_entries(elem, ids)
+                # Drop the mapped entry so the tree never holds more than one
+                statement.remove(elem)
+            elif name == "Stmt":
+                elem.clear()
+                statement = None
+    except ET.ParseError as exc:
+        raise StatementParseError(f"Invalid CAMT.053 XML: {exc}") from exc
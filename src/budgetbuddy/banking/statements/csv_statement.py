@@ -0,0 +1,116 @@
+"""Incremental parser for CSV bank statement exports.
+
+Banks lay out their CSV exports differently, so the columns are described
+by a ``CsvLayout``. Rows are read one at a time with ``csv.DictReader``.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import BinaryIO
+
+from src.budgetbuddy.banking.schemas.transaction import TransactionCreate
+from src.budgetbuddy.banking.statements.base import (
+    CREDIT,
+    DEBIT,
+    EntryIds,
+    StatementParseError,
+    parse_amount,
+    to_datetime,
+)
+
+SOURCE = "csv"
+
+
+@dataclass(frozen=True)
+class CsvLayout:
+    """Column names and formats of a CSV statement.
+
+    Amounts are signed unless ``direction`` names a column holding the
+    debit/credit marker (e.g. 'Af'/'Bij').
+    """
+
+    date: str = "date"
+    amount: str = "amount"
+    date_format: str = "%Y-%m-%d"
+    currency: str | None = "currency"
+    description: str | None = "description"
+    counterparty_name: str | None = "counterparty_name"
+    counterparty_iban: str | None = "counterparty_iban"
+    reference: str | None = "reference"
+    direction: str | None = None
+    debit_markers: tuple[str, ...] = ("D", "DEBIT", "Af")
+    delimiter: str = ","
+    decimal_comma: bool = False
+    default_currency: str = "EUR"
+
+
+def parse_csv(
+    stream: BinaryIO,
+    account: str | None = None,
+    layout: CsvLayout | None = None,
+    encoding: str = "utf-8-sig",
+) -> Iterator[TransactionCreate]:
+    """Yield the rows of a CSV statement as transactions.
+
+    Args:
+        stream (BinaryIO): The CSV file, with a header row.
+        account (str | None): Account the statement belongs to; part of
+            the external_ids, so statements of different accounts never
+            collide.
+        layout (CsvLayout | None): Columns and formats. Defaults to
+            CsvLayout() (date, amount, currency, description, ...).
+        encoding (str): Text encoding. Defaults to UTF-8 with optional BOM.
+
+    Yields:
+        TransactionCreate: One transaction per row.
+
+    Raises:
+        StatementParseError: If a required column is missing or a value
+            cannot be parsed.
+    """
+    layout = layout or CsvLayout()
+    rows = csv.DictReader(codecs.getreader(encoding)(stream), delimiter=layout.delimiter)
+    ids = EntryIds(SOURCE, account)
+
+    def column(row: dict[str, str], name: str | None) -> str | None:
+        value = row.get(name) if name else None
+        return value.strip() or None if value is not None else None
+
+    for line_number, row in enumerate(rows, start=2):
+        raw_date, raw_amount = column(row, layout.date), column(row, layout.amount)
+        if raw_date is None or raw_amount is None:
+            raise StatementParseError(f"Line {line_number}: missing {layout.date!r} or {layout.amount!r}")
+
+        try:
+            booked = datetime.strptime(raw_date, layout.date_format).date()
+        except ValueError as exc:
+            raise StatementParseError(f"Line {line_number}: invalid date {raw_date!r}") from exc
+        amount = parse_amount(raw_amount, decimal_comma=layout.decimal_comma)
+
+        if layout.direction:
+            is_debit = column(row, layout.direction) in layout.debit_markers
+        else:
+            is_debit = amount < 0
+
+        currency = column(row, layout.currency) or layout.default_currency
+        description = column(row, layout.description)
+        counterparty_iban = column(row, layout.counterparty_iban)
+
+        yield TransactionCreate(
+            amount=float(abs(amount)),
+            currency=currency,
+            description=description,
+            transaction_type=DEBIT if is_debit else CREDIT,
+            counterparty_name=column(row, layout.counterparty_name),
+            counterparty_iban=counterparty_iban,
+            external_source=SOURCE,
+            external_id=ids.for_entry(
+                booked, column(row, layout.reference), abs(amount), currency, is_debit, description, counterparty_iban
+            ),
+            external_created_at=to_datetime(booked),
+        )
@@ -0,0 +1,122 @@
+"""Import bank statement files in fixed-size batches.
+
+Parsers yield transactions lazily and the importer upserts them one batch
+at a time, so an import holds at most ``batch_size`` transactions in
+memory regardless of the file size. Entries get deterministic
+external_ids, so importing the same statement again only updates what
+changed.
+"""
+
+from __future__ import annotations
+
+import io
+import time
+from itertools import islice
+from typing import Any, BinaryIO, Literal
+
+from sqlalchemy.orm import Session
+
+from src.budgetbuddy.banking.statements.base import StatementParser
+from src.budgetbuddy.banking.statements.camt import parse_camt053
+from src.budgetbuddy.banking.statements.csv_statement import parse_csv
+from src.budgetbuddy.banking.statements.mt940 import parse_mt940
+from src.budgetbuddy.services.transaction_service import upsert_transactions_bulk
+from src.common.log.logger import get_logger
+
+logger = get_logger(__name__)
+
+StatementFormat = Literal["camt053", "mt940", "csv"]
+
+PARSERS: dict[str, StatementParser] = {"camt053": parse_camt053, "mt940": parse_mt940, "csv": parse_csv}
+DEFAULT_IMPORT_BATCH_SIZE = 1000
+
+
+def sniff_format(head: bytes) -> StatementFormat:
+    """Guess the statement format from the first bytes of a file.
+
+    Args:
+        head (bytes): Start of the file; a few hundred bytes suffice.
+
+    Returns:
+        StatementFormat: 'camt053' for XML, 'mt940' for SWIFT messages and
+            'csv' otherwise.
+    """
+    text = head.lstrip(b"\xef\xbb\xbf \r\n\t")
+    if text.startswith(b"<"):
+        return "camt053"
+    if text.startswith((b"{1:", b":20:")) or b"\n:20:" in text:
+        return "mt940"
+    return "csv"
+
+
+def import_statement(
+    db: Session,
+    stream: BinaryIO,
+    statement_format: StatementFormat | None = None,
+    account: str | None = None,
+    batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+    **parser_options: Any,
+) -> dict[str, Any]:
+    """Parse a statement file and upsert its transactions batch by batch.
+
+    Every batch is committed on its own, so a failure halfway leaves the
+    earlier batches imported; rerunning the import completes it.
+
+    Args:
+        db (Session): Database session.
+        stream (BinaryIO): The statement file.
+        statement_format (StatementFormat | None): Format of the file.
+            Defaults to guessing it from the first bytes.
+        account (str | None): Account of the statement, for formats whose
+            files do not name it (CSV); a fallback for the others.
+        batch_size (int): Transactions per upsert. Defaults to
+            DEFAULT_IMPORT_BATCH_SIZE.
+        **parser_options (Any): Extra arguments for the parser, e.g. the
+            ``layout`` of a CSV statement.
+
+    Returns:
+        dict[str, Any]: Statistics with keys format, entries, inserted,
+            updated, unchanged, batches and elapsed_seconds.
+
+    Raises:
+        StatementParseError: If the file is malformed. Batches before the
+            malformed entry stay imported.
+        ValueError: If batch_size is not positive.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than 0")
+
+    started = time.perf_counter()
+    if statement_format is None:
+        stream = stream if hasattr(stream, "peek") else io.BufferedReader(stream)
+        statement_format = sniff_format(stream.peek(512)[:512])
+
+    stats: dict[str, Any] = {
+        "format": statement_format,
+        "entries": 0,
+        "inserted": 0,
+        "updated": 0,
+        "unchanged": 0,
+        "batches": 0,
+    }
+    entries = PARSERS[statement_format](stream, account=account, **parser_options)
+
+    while batch := list(islice(entries, batch_size)):
+        inserted, updated, unchanged = upsert_transactions_bulk(db, batch, batch_size=batch_size)
+        stats["entries"] += len(batch)
+        stats["inserted"] += inserted
+        stats["updated"] += updated
+        stats["unchanged"] += unchanged
+        stats["batches"] += 1
+
+    stats["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    logger.info(
+        "Imported %s statement: %d entries, %d inserted, %d updated, %d unchanged in %.2fs",
+        statement_format,
+        stats["entries"],
+        stats["inserted"],
+        stats["updated"],
+        stats["unchanged"],
+        stats["elapsed_seconds"],
+    )
+    return stats
@@ -0,0 +1,177 @@
+"""Incremental parser for SWIFT MT940 customer statements.
+
+The file is read line by line and every ``:61:`` statement line is
+yielded as soon as its ``:86:`` information field is complete, so memory
+use does not grow with the size of the file.
+
+``:86:`` contents differ per bank. Structured fields in the Dutch style
+(``/NAME/.../REMI/...``, used by ING, Rabobank and ABN AMRO) are mapped
+to counterparty and description; any other ``:86:`` is kept as the
+description.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import date
+from typing import BinaryIO
+
+from src.budgetbuddy.banking.schemas.transaction import TransactionCreate
+from src.budgetbuddy.banking.statements.base import (
+    CREDIT,
+    DEBIT,
+    EntryIds,
+    StatementParseError,
+    parse_amount,
+    to_datetime,
+)
+
+SOURCE = "mt940"
+
+_TAG = re.compile(r"^:(?P<tag>\d{2}[A-Z]?):(?P<value>.*)$")
+_STATEMENT_LINE = re.compile(
+    r"^(?P<value_date>\d{6})(?P<entry_date>\d{4})?"
+    r"(?P<mark>R?[CD])[A-Z]?(?P<amount>\d+,\d*)"
+    r"(?P<type>[NSF][A-Z0-9]{3})(?P<reference>.*?)(?://(?P<bank_reference>.*))?$"
+)
+_BALANCE = re.compile(r"^[CD]\d{6}(?P<currency>[A-Z]{3})")
+# Keys of structured :86: fields, e.g. /NAME/Jane Doe/REMI/Invoice 12/
+_STRUCTURED_KEYS = ("TRTP", "IBAN", "BIC", "NAME", "REMI", "EREF", "CSID", "MARF", "ORDP", "BENM", "ADDR", "ID")
+_STRUCTURED = re.compile(r"/(" + "|".join(_STRUCTURED_KEYS) + r")/")
+
+
+@dataclass
+class _PendingLine:
+    """A :61: line waiting for its :86: information."""
+
+    tag_value: str
+    supplementary: list[str] = field(default_factory=list)
+    information: list[str] | None = None
+
+
+def parse_structured_information(text: str) -> dict[str, str]:
+    """Split a Dutch-style structured :86: field into its values.
+
+    Args:
+        text (str): The :86: content, continuation lines joined.
+
+    Returns:
+        dict[str, str]: Values by key (e.g. 'NAME', 'REMI'); empty if the
+            field is not structured.
+    """
+    parts = _STRUCTURED.split(text)
+    if len(parts) < 3:
+        return {}
+    # parts is [prefix, key, value, key, value, ...]; REMI values may have
+    # their own /USTD// sub-fields, which are kept as text
+    values = zip(parts[1::2], parts[2::2], strict=True)
+    return {key: value.strip("/ ").removeprefix("USTD//").strip() for key, value in values}
+
+
+def _parse_date(yymmdd: str) -> date:
+    year, month, day = int(yymmdd[:2]), int(yymmdd[2:4]), int(yymmdd[4:6])
+    return date(2000 + year if year < 80 else 1900 + year, month, day)
+
+
+def _map_line(pending: _PendingLine, currency: str | None, ids: EntryIds) -> TransactionCreate:
+    match = _STATEMENT_LINE.match(pending.tag_value)
+    if match is None:
+        raise StatementParseError(f"Invalid :61: statement line {pending.tag_value!r}")
+    if currency is None:
+        raise StatementParseError("Statement line before an opening balance with a currency")
+
+    value_date = _parse_date(match["value_date"])
+    booked = value_date
+    if match["entry_date"]:
+        month, day = int(match["entry_date"][:2]), int(match["entry_date"][2:])
+        # The entry date has no year; it can fall just before or after a year boundary
+        candidates = [date(value_date.year + offset, month, day) for offset in (-1, 0, 1)]
+        booked = min(candidates, key=lambda d: abs((d - value_date).days))
+
+    amount = parse_amount(match["amount"], decimal_comma=True)
+    # RC (reversal of credit) is a debit and RD (reversal of debit) a credit
+    is_debit = match["mark"] in ("D", "RC")
+    information = " ".join(pending.information or []).strip()
+    structured = parse_structured_information(information)
+    description = structured.get("REMI") if structured else information or " ".join(pending.supplementary) or None
+
+    bank_reference = (match["bank_reference"] or "").strip()
+    reference = bank_reference if bank_reference and bank_reference != "NONREF" else None
+
+    return TransactionCreate(
+        amount=float(amount),
+        currency=currency,
+        description=description or None,
+        transaction_type=DEBIT if is_debit else CREDIT,
+        counterparty_name=structured.get("NAME"),
+        counterparty_iban=structured.get("IBAN"),
+        external_source=SOURCE,
+        external_id=ids.for_entry(
+            booked, reference, amount, currency, is_debit, match["type"], match["reference"], information
+        ),
+        external_created_at=to_datetime(booked),
+    )
+
+
+def parse_mt940(stream: BinaryIO, account: str | None = None, encoding: str = "latin-1") -> Iterator[TransactionCreate]:
+    """Yield the statement lines of an MT940 file as transactions.
+
+    Args:
+        stream (BinaryIO): The MT940 file; several statements may follow
+            each other.
+        account (str | None): Account to assume when a statement has no
+            :25: field.
+        encoding (str): Text encoding. Defaults to latin-1, which decodes
+            any byte.
+
+    Yields:
+        TransactionCreate: One transaction per :61: statement line.
+
+    Raises:
+        StatementParseError: If a statement line is malformed.
+    """
+    reader = codecs.getreader(encoding)(stream)
+    ids = EntryIds(SOURCE, account)
+    currency: str | None = None
+    pending: _PendingLine | None = None
+    # Field that continuation lines (lines without a tag) belong to
+    current_tag: str | None = None
+
+    for raw_line in reader:
+        line = raw_line.rstrip("\r\n")
+        tag_match = _TAG.match(line)
+
+        if tag_match is None:
+            if line.startswith(("-", "{", "}")) or not line.strip():
+                # End of a message or SWIFT block headers
+                current_tag = None
+            elif pending is not None and current_tag == "86" and pending.information is not None:
+                pending.information.append(line.strip())
+            elif pending is not None and current_tag == "61":
+                pending.supplementary.append(line.strip())
+            continue
+
+        tag, value = tag_match["tag"], tag_match["value"]
+        current_tag = tag[:2]
+        if tag == "86" and pending is not None and pending.information is None:
+            pending.information = [value.strip()]
+            continue
+
+        # Any other tag completes the pending statement line
+        if pending is not None:
+            yield _map_line(pending, currency, ids)
+            pending = None
+
+        if tag == "25":
+            ids = EntryIds(SOURCE, value.strip() or account)
+        elif tag in ("60F", "60M"):
+            balance = _BALANCE.match(value.strip())
+            currency = balance["currency"] if balance else currency
+        elif tag == "61":
+            pending = _PendingLine(value.strip())
+
+    if pending is not None:
+        yield _map_line(pending, currency, ids)
@@ -0,0 +1,57 @@
+"""Script to import CAMT.053, MT940 or CSV bank statement files.
+
+Files are streamed and upserted in batches, so statements of any size can
+be imported. Importing the same file again only updates what changed.
+
+Usage:
+    python -m src.budgetbuddy.banking.statements.scripts.import_statement statement.xml
+    python -m src.budgetbuddy.banking.statements.scripts.import_statement export.csv --format csv \
+        --account NL91ABNA0417164300 --delimiter ";" --decimal-comma --date-format %d-%m-%Y
+"""
+
+import argparse
+from pathlib import Path
+
+from src.budgetbuddy.banking.statements.csv_statement import CsvLayout
+from src.budgetbuddy.banking.statements.importer import DEFAULT_IMPORT_BATCH_SIZE, PARSERS, import_statement
+from src.common.log.logger import get_logger
+from src.db.session import SessionLocal
+
+logger = get_logger(__name__)
+
+
+def main():
+    """Import the given statement files."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", type=Path, nargs="+", help="statement files")
+    parser.add_argument("--format", choices=sorted(PARSERS), help="file format (guessed when omitted)")
+    parser.add_argument("--account", help="account of the statements, required for CSV exports")
+    parser.add_argument("--delimiter", default=",", help="CSV field delimiter")
+    parser.add_argument("--decimal-comma", action="store_true", help="CSV amounts use a decimal comma")
+    parser.add_argument("--date-format", default="%Y-%m-%d", help="CSV date format")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    options = {}
+    if args.format == "csv":
+        options["layout"] = CsvLayout(
+            delimiter=args.delimiter, decimal_comma=args.decimal_comma, date_format=args.date_format
+        )
+
+    with SessionLocal() as session:
+        for path in args.paths:
+            with path.open("rb") as stream:
+                stats = import_statement(
+                    session, stream, args.format, account=args.account, batch_size=args.batch_size, **options
+                )
+
+            logger.info("File:                  %s (%s)", path, stats["format"])
+            logger.info("Entries:               %d", stats["entries"])
+            logger.info("Inserted:              %d", stats["inserted"])
+            logger.info("Updated:               %d", stats["updated"])
+            logger.info("Unchanged:             %d", stats["unchanged"])
+            logger.info("Elapsed seconds:       %.2f", stats["elapsed_seconds"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Async versions of the transaction service functions used by the API.
+
+They run on an ``AsyncSession`` so request handlers can wait for the
+database on the event loop instead of holding a threadpool slot each.
+Queries and business rules are shared with ``transaction_service``; only
+the I/O differs. Bulk loads, COPY and exports stay synchronous.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.budgetbuddy.banking.schemas.transaction import TransactionCreate, TransactionFilters, TransactionUpdate
+from src.budgetbuddy.services import transaction_service
+from src.budgetbuddy.services.transaction_service import TransactionOrder
+from src.db.schema.transaction import Transaction
+
+
+async def create_transaction(db: AsyncSession, data: TransactionCreate) -> Transaction:
+    """Create a single transaction; see ``transaction_service.create_transaction``.
+
+    Args:
+        db (AsyncSession): Database session.
+        data (TransactionCreate): Transaction data.
+
+    Returns:
+        Transaction: Created transaction.
+
+    Raises:
+        ValueError: If validation fails.
+    """
+    transaction_service.validate_new_transaction(data)
+    tx = Transaction(**data.model_dump())
+    db.add(tx)
+    await db.flush()
+    await db.execute(transaction_service.duplicate_flag_statement([tx.itemid]))
+    await db.commit()
+    # Loads server-side values: timestamps, fingerprint and duplicate_of
+    await db.refresh(tx)
+    return tx
+
+
+async def list_transactions(
+    db: AsyncSession,
+    offset: int = 0,
+    limit: int = 100,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters | None = None,
+) -> Sequence[Transaction]:
+    """List transactions; see ``transaction_service.list_transactions``.
+
+    Raises:
+        ValueError: If start > end, min_amount > max_amount or the order
+            is unknown.
+    """
+    stmt = transaction_service.transactions_query(offset, limit, start, end, order_by, descending, filters)
+    return list((await db.scalars(stmt)).all())
+
+
+async def list_transactions_page(
+    db: AsyncSession,
+    limit: int = 100,
+    cursor: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters | None = None,
+) -> tuple[list[Transaction], str | None]:
+    """List one keyset page; see ``transaction_service.list_transactions_page``.
+
+    Raises:
+        ValueError: If limit is not positive, start > end, min_amount >
+            max_amount, the order is unknown or the cursor is invalid.
+    """
+    stmt = transaction_service.transactions_page_query(limit, cursor, start, end, order_by, descending, filters)
+    rows = list((await db.scalars(stmt)).all())
+    return transaction_service.split_page(rows, limit, order_by, descending)
+
+
+async def get_transaction(db: AsyncSession, itemid: UUID) -> Transaction | None:
+    """Get a transaction by ID.
+
+    Args:
+        db (AsyncSession): Database session.
+        itemid (UUID): Transaction UUID.
+
+    Returns:
+        Transaction | None: The transaction or None if not found.
+    """
+    return await db.get(Transaction, itemid)
+
+
+async def update_transaction(db: AsyncSession, itemid: UUID, data: TransactionUpdate) -> Transaction | None:
+    """Update the non-None fields of a transaction with one ``UPDATE ... RETURNING``.
+
+    Args:
+        db (AsyncSession): Database session.
+        itemid (UUID): Transaction UUID.
+        data (TransactionUpdate): Update data.
+
+    Returns:
+        Transaction | None: Updated transaction or None if not found.
+    """
+    update_dict = {k: v for k, v in data.model_dump().items() if v is not None}
+    if not update_dict:
+        return await db.get(Transaction, itemid)
+    tx = (await db.scalars(transaction_service.repo.update_by_id_statement(itemid, update_dict))).one_or_none()
+    await db.commit()
+    return tx
+
+
+async def delete_transaction(db: AsyncSession, itemid: UUID) -> bool:
+    """Delete a transaction with one ``DELETE ... RETURNING``.
+
+    Args:
+        db (AsyncSession): Database session.
+        itemid (UUID): Transaction UUID.
+
+    Returns:
+        bool: True if deleted, False if not found.
+    """
+    deleted = (await db.execute(transaction_service.repo.delete_by_id_statement(itemid))).first() is not None
+    await db.commit()
+    return deleted
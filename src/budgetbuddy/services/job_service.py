@@ -0,0 +1,224 @@
+"""Job queue service: enqueue, claim and settle background jobs."""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, case, func, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from src.common.log.logger import get_logger
+from src.db.schema.job import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, Job
+
+logger = get_logger(__name__)
+
+
+def enqueue_job(
+    db: Session,
+    kind: str,
+    payload: dict[str, Any] | None = None,
+    priority: int = 0,
+    max_attempts: int = 3,
+    delay_seconds: float = 0.0,
+) -> Job:
+    """Add a job to the queue.
+
+    Args:
+        db (Session): Database session.
+        kind (str): Job type, used to pick the handler (e.g. 'bunq.sync').
+        payload (dict[str, Any] | None): JSON arguments for the handler.
+        priority (int): Higher priorities are claimed first. Defaults to 0.
+        max_attempts (int): Runs before the job is marked failed. Defaults to 3.
+        delay_seconds (float): Do not run before this many seconds from now.
+
+    Returns:
+        Job: The queued job.
+    """
+    stmt = (
+        insert(Job)
+        .values(
+            kind=kind,
+            payload=payload or {},
+            priority=priority,
+            max_attempts=max_attempts,
+            run_after=func.now() + datetime.timedelta(seconds=delay_seconds),
+        )
+        .returning(Job)
+    )
+    job = db.scalars(stmt).one()
+    db.commit()
+
+    logger.info("Enqueued %s job %s (priority %d)", kind, job.itemid, priority)
+    return job
+
+
+def get_job(db: Session, itemid: UUID) -> Job | None:
+    """Get a job by ID.
+
+    Args:
+        db (Session): Database session.
+        itemid (UUID): Job UUID.
+
+    Returns:
+        Job | None: The job or None if not found.
+    """
+    return db.get(Job, itemid)
+
+
+def claim_job(db: Session, worker_id: str, lease_seconds: float, kinds: Iterable[str] | None = None) -> Job | None:
+    """Claim the next runnable job for a worker.
+
+    Runnable jobs are queued jobs that are due, and running jobs whose
+    lease ran out (their worker died or stalled). The candidate is picked
+    with ``FOR UPDATE SKIP LOCKED``, so concurrent workers never wait on
+    each other or claim the same job. Jobs whose lease ran out on their
+    final attempt are marked failed.
+
+    Args:
+        db (Session): Database session.
+        worker_id (str): Name of the claiming worker.
+        lease_seconds (float): Visibility timeout of the claim.
+        kinds (Iterable[str] | None): Only claim these job kinds.
+            Defaults to any kind.
+
+    Returns:
+        Job | None: The claimed job, or None if nothing is runnable.
+    """
+    now = func.now()
+    lease_expired = and_(Job.status == JOB_RUNNING, Job.locked_until < now)
+
+    db.execute(
+        update(Job)
+        .where(lease_expired, Job.attempts >= Job.max_attempts)
+        .values(
+            status=JOB_FAILED,
+            last_error=func.coalesce(Job.last_error, "Lease expired on the final attempt"),
+            locked_by=None,
+            locked_until=None,
+            finished_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    candidate = (
+        select(Job.itemid)
+        .where(or_(and_(Job.status == JOB_QUEUED, Job.run_after <= now), lease_expired))
+        .order_by(Job.priority.desc(), Job.run_after)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    if kinds is not None:
+        candidate = candidate.where(Job.kind.in_(list(kinds)))
+
+    stmt = (
+        update(Job)
+        .where(Job.itemid == candidate.scalar_subquery())
+        .values(
+            status=JOB_RUNNING,
+            attempts=Job.attempts + 1,
+            locked_by=worker_id,
+            locked_until=now + datetime.timedelta(seconds=lease_seconds),
+        )
+        .returning(Job)
+        # Refresh the job if the session already holds it
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    job = db.scalars(stmt).one_or_none()
+    db.commit()
+
+    if job is not None:
+        logger.info("Worker %s claimed %s job %s (attempt %d)", worker_id, job.kind, job.itemid, job.attempts)
+    return job
+
+
+def extend_lease(db: Session, itemid: UUID, worker_id: str, lease_seconds: float) -> bool:
+    """Push back the lease of a job the worker is still running.
+
+    Args:
+        db (Session): Database session.
+        itemid (UUID): Job UUID.
+        worker_id (str): Worker holding the lease.
+        lease_seconds (float): New visibility timeout, from now.
+
+    Returns:
+        bool: False if the worker no longer holds the job.
+    """
+    stmt = (
+        update(Job)
+        .where(Job.itemid == itemid, Job.status == JOB_RUNNING, Job.locked_by == worker_id)
+        .values(locked_until=func.now() + datetime.timedelta(seconds=lease_seconds))
+        .execution_options(synchronize_session=False)
+    )
+    extended = db.execute(stmt).rowcount == 1
+    db.commit()
+    return extended
+
+
+def complete_job(db: Session, itemid: UUID, worker_id: str, result: dict[str, Any] | None = None) -> bool:
+    """Mark a job the worker holds as succeeded.
+
+    Args:
+        db (Session): Database session.
+        itemid (UUID): Job UUID.
+        worker_id (str): Worker holding the lease.
+        result (dict[str, Any] | None): JSON result to store.
+
+    Returns:
+        bool: False if the lease was lost and another worker took the job.
+    """
+    stmt = (
+        update(Job)
+        .where(Job.itemid == itemid, Job.status == JOB_RUNNING, Job.locked_by == worker_id)
+        .values(
+            status=JOB_SUCCEEDED,
+            result=result,
+            last_error=None,
+            locked_by=None,
+            locked_until=None,
+            finished_at=func.now(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    completed = db.execute(stmt).rowcount == 1
+    db.commit()
+
+    if not completed:
+        logger.warning("Worker %s lost job %s before it completed", worker_id, itemid)
+    return completed
+
+
+def fail_job(db: Session, itemid: UUID, worker_id: str, error: str, retry_delay_seconds: float) -> bool:
+    """Record a failed attempt; requeue the job unless its attempts are used up.
+
+    Args:
+        db (Session): Database session.
+        itemid (UUID): Job UUID.
+        worker_id (str): Worker holding the lease.
+        error (str): Error description to store.
+        retry_delay_seconds (float): Delay before the retry becomes runnable.
+
+    Returns:
+        bool: False if the lease was lost and another worker took the job.
+    """
+    exhausted = Job.attempts >= Job.max_attempts
+    stmt = (
+        update(Job)
+        .where(Job.itemid == itemid, Job.status == JOB_RUNNING, Job.locked_by == worker_id)
+        .values(
+            status=case((exhausted, JOB_FAILED), else_=JOB_QUEUED),
+            run_after=case(
+                (exhausted, Job.run_after), else_=func.now() + datetime.timedelta(seconds=retry_delay_seconds)
+            ),
+            finished_at=case((exhausted, func.now()), else_=None),
+            last_error=error,
+            locked_by=None,
+            locked_until=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    recorded = db.execute(stmt).rowcount == 1
+    db.commit()
+    return recorded
@@ -0,0 +1,153 @@
+"""Worker that runs queued jobs.
+
+Workers poll the jobs table, claim one job at a time (see
+``job_service.claim_job``) and run the handler registered for its kind.
+Any number of workers, in any number of processes or hosts, can share the
+queue; ``FOR UPDATE SKIP LOCKED`` keeps them from claiming the same job.
+
+While a handler runs, a heartbeat thread keeps extending the job's lease,
+so only jobs of workers that died are picked up again by others.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import socket
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from src.budgetbuddy.services import job_service
+from src.common.log.logger import get_logger
+from src.db.schema.job import Job
+from src.db.session import SessionLocal
+
+logger = get_logger(__name__)
+
+# Handlers get a session and the job payload and return a JSON result
+JobHandler = Callable[[Session, dict[str, Any]], dict[str, Any] | None]
+
+
+class JobWorker:
+    """Claims and runs jobs of the kinds it has handlers for."""
+
+    def __init__(
+        self,
+        handlers: Mapping[str, JobHandler],
+        session_factory: Callable[[], contextlib.AbstractContextManager[Session]] = SessionLocal,
+        worker_id: str | None = None,
+        lease_seconds: float = 300.0,
+        poll_seconds: float = 1.0,
+        retry_base_seconds: float = 30.0,
+    ):
+        """Initialize the worker.
+
+        Args:
+            handlers (Mapping[str, JobHandler]): Handler per job kind. Only
+                these kinds are claimed.
+            session_factory (Callable): Creates database sessions. Defaults
+                to SessionLocal.
+            worker_id (str | None): Name stored on claimed jobs. Defaults to
+                host:pid:thread.
+            lease_seconds (float): Visibility timeout of a claim; the
+                heartbeat renews it every third of this.
+            poll_seconds (float): Sleep between polls of an empty queue.
+            retry_base_seconds (float): Delay before the first retry,
+                doubled on every further attempt.
+        """
+        self.handlers = dict(handlers)
+        self.session_factory = session_factory
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self.retry_base_seconds = retry_base_seconds
+
+    def run_next(self) -> Job | None:
+        """Claim and run a single job.
+
+        Returns:
+            Job | None: The job that was run, or None if the queue is empty.
+        """
+        with self.session_factory() as db:
+            job = job_service.claim_job(db, self.worker_id, self.lease_seconds, kinds=self.handlers)
+        if job is None:
+            return None
+
+        handler = self.handlers[job.kind]
+        try:
+            with self._heartbeat(job), self.session_factory() as db:
+                try:
+                    result = handler(db, job.payload)
+                except Exception:
+                    db.rollback()
+                    raise
+        except Exception as exc:
+            delay = self.retry_base_seconds * 2 ** (job.attempts - 1)
+            logger.warning("Job %s (%s) failed on attempt %d: %s", job.itemid, job.kind, job.attempts, exc)
+            with self.session_factory() as db:
+                job_service.fail_job(
+                    db, job.itemid, self.worker_id, f"{type(exc).__name__}: {exc}", retry_delay_seconds=delay
+                )
+            return job
+
+        with self.session_factory() as db:
+            job_service.complete_job(db, job.itemid, self.worker_id, result)
+        logger.info("Job %s (%s) succeeded", job.itemid, job.kind)
+        return job
+
+    def run(self, stop: threading.Event | None = None, max_jobs: int | None = None) -> int:
+        """Run jobs until ``stop`` is set, sleeping while the queue is empty.
+
+        Args:
+            stop (threading.Event | None): Set to stop after the current job.
+                Defaults to running forever.
+            max_jobs (int | None): Stop after this many jobs.
+
+        Returns:
+            int: Number of jobs run.
+        """
+        stop = stop or threading.Event()
+        ran = 0
+        logger.info("Job worker %s started for %s", self.worker_id, sorted(self.handlers))
+
+        while not stop.is_set() and (max_jobs is None or ran < max_jobs):
+            try:
+                job = self.run_next()
+            except Exception:
+                # e.g. the database is unreachable; keep the worker alive
+                logger.exception("Job worker %s could not poll the queue", self.worker_id)
+                job = None
+
+            if job is None:
+                stop.wait(self.poll_seconds)
+            else:
+                ran += 1
+
+        logger.info("Job worker %s stopped after %d jobs", self.worker_id, ran)
+        return ran
+
+    @contextlib.contextmanager
+    def _heartbeat(self, job: Job) -> Iterator[None]:
+        """Extend the job's lease in the background while the block runs."""
+        done = threading.Event()
+
+        def beat() -> None:
+            while not done.wait(self.lease_seconds / 3):
+                try:
+                    with self.session_factory() as db:
+                        if not job_service.extend_lease(db, job.itemid, self.worker_id, self.lease_seconds):
+                            logger.warning("Job %s was taken over by another worker", job.itemid)
+                            return
+                except Exception:
+                    logger.exception("Could not extend the lease of job %s", job.itemid)
+
+        thread = threading.Thread(target=beat, name=f"job-heartbeat-{job.itemid}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            done.set()
+            thread.join()
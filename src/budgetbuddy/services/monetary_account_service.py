@@ -0,0 +1,141 @@
+"""Monetary account service layer with business logic."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.budgetbuddy.banking.schemas.monetaryaccount import MonetaryAccountCreate
+from src.common.log.logger import get_logger
+from src.db.schema.monetary_account_balance import MonetaryAccountBalance
+from src.db.schema.monetaryaccount import MonetaryAccount
+
+logger = get_logger(__name__)
+
+# Columns owned by the external source. Upserts only overwrite these, so
+# user notes survive a re-sync.
+SOURCE_COLUMNS = (
+    "account_name",
+    "account_type",
+    "currency",
+    "balance",
+    "iban",
+    "bic",
+    "account_status",
+    "external_source",
+    "external_created_at",
+    "external_updated_at",
+)
+
+
+def upsert_monetary_accounts(db: Session, accounts: list[MonetaryAccountCreate]) -> int:
+    """Bulk upsert accounts by external_id and snapshot their balances.
+
+    Accounts and balance snapshots are written in a single statement: the
+    upsert runs as a data-modifying CTE whose RETURNING rows feed the
+    snapshot insert, so each run costs one round trip regardless of the
+    number of accounts.
+
+    Args:
+        db (Session): Database session.
+        accounts (list[MonetaryAccountCreate]): Accounts from the external source.
+
+    Returns:
+        int: Number of accounts upserted (one snapshot is stored per account).
+    """
+    if not accounts:
+        return 0
+
+    rows = list({a.external_id: a.model_dump(include={*SOURCE_COLUMNS, "external_id"}) for a in accounts}.values())
+
+    upsert = insert(MonetaryAccount).values(rows)
+    upsert = upsert.on_conflict_do_update(
+        index_elements=["external_id"],
+        set_={
+            **{column: upsert.excluded[column] for column in SOURCE_COLUMNS},
+            "updatedtimestamp": func.now(),
+        },
+    ).returning(MonetaryAccount.itemid, MonetaryAccount.balance, MonetaryAccount.currency)
+    upserted = upsert.cte("upserted")
+
+    stmt = insert(MonetaryAccountBalance).from_select(
+        ["monetary_account_id", "balance", "currency"],
+        select(upserted.c.itemid, upserted.c.balance, upserted.c.currency),
+    )
+
+    result = db.execute(stmt)
+    db.commit()
+
+    logger.info("Upserted %d monetary accounts with balance snapshots", result.rowcount)
+    return result.rowcount
+
+
+def list_monetary_accounts(db: Session, external_source: str | None = None) -> Sequence[MonetaryAccount]:
+    """List monetary accounts with their latest synced balance.
+
+    Args:
+        db (Session): Database session.
+        external_source (str | None): Only accounts from this source.
+
+    Returns:
+        Sequence[MonetaryAccount]: Accounts ordered by name.
+    """
+    stmt = select(MonetaryAccount)
+    if external_source is not None:
+        stmt = stmt.where(MonetaryAccount.external_source == external_source)
+
+    stmt = stmt.order_by(MonetaryAccount.account_name)
+    return list(db.execute(stmt).scalars().all())
+
+
+def get_monetary_account(db: Session, itemid: UUID) -> MonetaryAccount | None:
+    """Get a monetary account by ID.
+
+    Args:
+        db (Session): Database session.
+        itemid (UUID): Account UUID.
+
+    Returns:
+        MonetaryAccount | None: The account or None if not found.
+    """
+    return db.get(MonetaryAccount, itemid)
+
+
+def list_balance_snapshots(
+    db: Session,
+    monetary_account_id: UUID,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int = 500,
+) -> Sequence[MonetaryAccountBalance]:
+    """List balance snapshots of an account, newest first.
+
+    Args:
+        db (Session): Database session.
+        monetary_account_id (UUID): Account UUID.
+        start (datetime | None): Filter by captured_at >= start.
+        end (datetime | None): Filter by captured_at <= end.
+        limit (int): Maximum results. Defaults to 500.
+
+    Returns:
+        Sequence[MonetaryAccountBalance]: Balance snapshots.
+
+    Raises:
+        ValueError: If start > end.
+    """
+    if start is not None and end is not None and start > end:
+        raise ValueError("start must be <= end")
+
+    stmt = select(MonetaryAccountBalance).where(MonetaryAccountBalance.monetary_account_id == monetary_account_id)
+    if start is not None:
+        stmt = stmt.where(MonetaryAccountBalance.captured_at >= start)
+    if end is not None:
+        stmt = stmt.where(MonetaryAccountBalance.captured_at <= end)
+
+    stmt = stmt.order_by(MonetaryAccountBalance.captured_at.desc(), MonetaryAccountBalance.id.desc()).limit(limit)
+    return list(db.execute(stmt).scalars().all())
@@ -0,0 +1,130 @@
+"""Sync watermark service for incremental external syncs."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.common.log.logger import get_logger
+from src.db.schema.sync_watermark import SyncWatermark
+
+logger = get_logger(__name__)
+
+
+def get_watermarks(db: Session, external_source: str) -> dict[int, SyncWatermark]:
+    """Load all watermarks for an external source.
+
+    Args:
+        db (Session): Database session.
+        external_source (str): Source system (e.g., 'bunq').
+
+    Returns:
+        dict[int, SyncWatermark]: Watermarks keyed by monetary account ID.
+    """
+    stmt = select(SyncWatermark).where(SyncWatermark.external_source == external_source)
+    return {wm.monetary_account_id: wm for wm in db.execute(stmt).scalars().all()}
+
+
+def save_checkpoint(
+    db: Session,
+    external_source: str,
+    monetary_account_id: int,
+    resume_older_id: int,
+    pending_payment_id: int,
+    pending_payment_created_at: datetime | None = None,
+) -> None:
+    """Record how far an unfinished sync pass of an account has got.
+
+    Call after a page has been committed. The next run resumes paging at
+    ``resume_older_id`` and keeps the pending newest payment so the
+    watermark can be advanced once the pass completes.
+
+    Args:
+        db (Session): Database session.
+        external_source (str): Source system (e.g., 'bunq').
+        monetary_account_id (int): External monetary account ID.
+        resume_older_id (int): Pagination cursor of the next (older) page.
+        pending_payment_id (int): Newest payment seen in this pass.
+        pending_payment_created_at (datetime | None): Creation time of that payment.
+    """
+    stmt = insert(SyncWatermark).values(
+        external_source=external_source,
+        monetary_account_id=monetary_account_id,
+        resume_older_id=resume_older_id,
+        pending_payment_id=pending_payment_id,
+        pending_payment_created_at=pending_payment_created_at,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["external_source", "monetary_account_id"],
+        set_={
+            "resume_older_id": stmt.excluded.resume_older_id,
+            "pending_payment_id": stmt.excluded.pending_payment_id,
+            "pending_payment_created_at": stmt.excluded.pending_payment_created_at,
+            "updatedtimestamp": func.now(),
+        },
+    )
+
+    db.execute(stmt)
+    db.commit()
+
+    logger.debug(
+        "Checkpoint for %s account %s saved at older_id %s",
+        external_source,
+        monetary_account_id,
+        resume_older_id,
+    )
+
+
+def advance_watermark(
+    db: Session,
+    external_source: str,
+    monetary_account_id: int,
+    payment_id: int,
+    payment_created_at: datetime | None = None,
+) -> None:
+    """Move an account's watermark forward to the given payment.
+
+    The watermark never moves backwards: if a newer payment is already
+    recorded, the stored watermark is kept. Any checkpoint of the pass that
+    just completed is cleared.
+
+    Args:
+        db (Session): Database session.
+        external_source (str): Source system (e.g., 'bunq').
+        monetary_account_id (int): External monetary account ID.
+        payment_id (int): Newest synced payment ID.
+        payment_created_at (datetime | None): Creation time of that payment.
+    """
+    stmt = insert(SyncWatermark).values(
+        external_source=external_source,
+        monetary_account_id=monetary_account_id,
+        last_payment_id=payment_id,
+        last_payment_created_at=payment_created_at,
+    )
+    is_older = SyncWatermark.last_payment_id > stmt.excluded.last_payment_id
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["external_source", "monetary_account_id"],
+        set_={
+            "last_payment_id": case((is_older, SyncWatermark.last_payment_id), else_=stmt.excluded.last_payment_id),
+            "last_payment_created_at": case(
+                (is_older, SyncWatermark.last_payment_created_at), else_=stmt.excluded.last_payment_created_at
+            ),
+            "resume_older_id": None,
+            "pending_payment_id": None,
+            "pending_payment_created_at": None,
+            "updatedtimestamp": func.now(),
+        },
+    )
+
+    db.execute(stmt)
+    db.commit()
+
+    logger.debug(
+        "Watermark for %s account %s advanced to payment %s",
+        external_source,
+        monetary_account_id,
+        payment_id,
+    )
@@ -0,0 +1,207 @@
+"""Columnar exports of transactions as Parquet files or Arrow IPC streams.
+
+Rows are read through a server-side cursor, ``batch_size`` at a time, and
+every batch is written as soon as it is converted: one Parquet row group
+or one Arrow record batch. Memory use therefore depends on the batch size,
+not on the number of transactions.
+
+Columns keep their types: amounts are decimals, timestamps are UTC
+timestamps and low-cardinality strings (currency, counterparty, category,
+...) are dictionary-encoded, which pandas reads as categoricals.
+
+pyarrow is an optional dependency (the ``arrow`` extra).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal
+
+from sqlalchemy import Numeric, Text, cast
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from src.budgetbuddy.banking.schemas.transaction import TransactionFilters
+from src.budgetbuddy.services.transaction_service import (
+    EXPORT_COLUMNS,
+    TransactionOrder,
+    transaction_export_query,
+)
+from src.common.log.logger import get_logger
+from src.db.schema.transaction import Transaction
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = get_logger(__name__)
+
+ArrowExportFormat = Literal["parquet", "arrow"]
+
+DEFAULT_ARROW_BATCH_SIZE = 50_000
+# Amounts are stored as floats; exports carry them as exact cents
+AMOUNT_PRECISION, AMOUNT_SCALE = 18, 2
+# Repetitive columns, stored once per distinct value per batch
+DICTIONARY_COLUMNS = frozenset(
+    {"currency", "transaction_type", "counterparty_name", "counterparty_iban", "category", "external_source"}
+)
+UUID_COLUMNS = frozenset({"itemid", "duplicate_of"})
+TIMESTAMP_COLUMNS = frozenset({"createdtimestamp", "external_created_at"})
+
+
+def require_pyarrow() -> None:
+    """Check that pyarrow is installed.
+
+    Raises:
+        RuntimeError: If it is not.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise RuntimeError("Parquet and Arrow exports need pyarrow; install the 'arrow' extra") from exc
+
+
+@lru_cache(maxsize=1)
+def arrow_schema() -> pa.Schema:
+    """Arrow schema of exported transactions, in EXPORT_COLUMNS order.
+
+    Returns:
+        pa.Schema: The schema.
+    """
+    import pyarrow as pa
+
+    def field_type(column: str) -> pa.DataType:
+        if column == "amount":
+            return pa.decimal128(AMOUNT_PRECISION, AMOUNT_SCALE)
+        if column in TIMESTAMP_COLUMNS:
+            return pa.timestamp("us", tz="UTC")
+        if column in DICTIONARY_COLUMNS:
+            return pa.dictionary(pa.int32(), pa.string())
+        return pa.string()
+
+    return pa.schema([pa.field(column, field_type(column)) for column in EXPORT_COLUMNS])
+
+
+def arrow_export_query(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters | None = None,
+) -> Select:
+    """Build the export query, converting values in SQL to the Arrow types.
+
+    Amounts are cast to numeric and UUIDs to text by PostgreSQL, so rows
+    need no per-value conversion in Python.
+
+    Args:
+        start (datetime | None): Filter by created >= start.
+        end (datetime | None): Filter by created <= end.
+        order_by (TransactionOrder): 'created', 'booked' or 'amount'.
+            Defaults to 'created'.
+        descending (bool): Newest (or largest) first. Defaults to False.
+        filters (TransactionFilters | None): Filters of the listing.
+
+    Returns:
+        Select: Query selecting EXPORT_COLUMNS.
+
+    Raises:
+        ValueError: If start > end, min_amount > max_amount or the order
+            is unknown.
+    """
+
+    def column(name: str) -> Any:
+        col = Transaction.__table__.c[name]
+        if name == "amount":
+            return cast(col, Numeric(AMOUNT_PRECISION, AMOUNT_SCALE)).label(name)
+        if name in UUID_COLUMNS:
+            return cast(col, Text).label(name)
+        return col
+
+    query = transaction_export_query(start=start, end=end, order_by=order_by, descending=descending, filters=filters)
+    return query.with_only_columns(*(column(name) for name in EXPORT_COLUMNS), maintain_column_froms=True)
+
+
+def iter_record_batches(
+    db: Session, query: Select | None = None, batch_size: int = DEFAULT_ARROW_BATCH_SIZE
+) -> Iterator[pa.RecordBatch]:
+    """Read transactions through a server-side cursor as Arrow record batches.
+
+    Args:
+        db (Session): Database session.
+        query (Select | None): Query from ``arrow_export_query``. Defaults
+            to all transactions.
+        batch_size (int): Rows fetched and converted at a time.
+
+    Yields:
+        pa.RecordBatch: Up to ``batch_size`` transactions.
+
+    Raises:
+        ValueError: If batch_size is not positive.
+    """
+    import pyarrow as pa
+
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than 0")
+
+    schema = arrow_schema()
+    query = query if query is not None else arrow_export_query()
+    result = db.execute(query.execution_options(stream_results=True, yield_per=batch_size))
+
+    for rows in result.partitions():
+        arrays = []
+        for field, values in zip(schema, zip(*rows, strict=True), strict=True):
+            if pa.types.is_dictionary(field.type):
+                arrays.append(pa.array(values, pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(values, field.type))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def export_transactions_arrow(
+    db: Session,
+    destination: Any,
+    file_format: ArrowExportFormat = "parquet",
+    query: Select | None = None,
+    batch_size: int = DEFAULT_ARROW_BATCH_SIZE,
+) -> int:
+    """Write transactions as a Parquet file or an Arrow IPC stream.
+
+    Args:
+        db (Session): Database session.
+        destination (Any): Path or writable binary file; it does not need
+            to be seekable, so a streamed response body works.
+        file_format (ArrowExportFormat): 'parquet' (one zstd-compressed
+            row group per batch) or 'arrow' (IPC stream). Defaults to
+            'parquet'.
+        query (Select | None): Query from ``arrow_export_query``. Defaults
+            to all transactions.
+        batch_size (int): Rows per batch and row group.
+
+    Returns:
+        int: Number of transactions written.
+
+    Raises:
+        RuntimeError: If pyarrow is not installed.
+        ValueError: If batch_size is not positive or the format is unknown.
+    """
+    require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if file_format == "parquet":
+        writer = pq.ParquetWriter(destination, arrow_schema(), compression="zstd")
+    elif file_format == "arrow":
+        writer = pa.ipc.new_stream(destination, arrow_schema())
+    else:
+        raise ValueError(f"unknown export format: {file_format}")
+
+    rows = 0
+    with writer:
+        for batch in iter_record_batches(db, query, batch_size):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+
+    logger.info("Exported %d transactions as %s", rows, file_format)
+    return rows
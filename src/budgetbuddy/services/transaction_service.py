@@ -2,21 +2,109 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import base64
+import binascii
+import hashlib
+import json
+import math
+from collections.abc import Iterable, Sequence
 from datetime import datetime
+from typing import Annotated, Any, Literal
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from annotated_types import MaxLen, MinLen
+from pydantic import TypeAdapter
+from sqlalchemy import and_, cast, column, delete, func, literal_column, or_, select, tuple_, update, values
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql import Select, Update
 
-from src.budgetbuddy.banking.schemas.transaction import TransactionCreate, TransactionUpdate
+from src.budgetbuddy.banking.schemas.transaction import (
+    TransactionBulkResult,
+    TransactionBulkUpdate,
+    TransactionCreate,
+    TransactionFilters,
+    TransactionUpdate,
+)
 from src.common.log.logger import get_logger
+from src.db.copy import CsvRowStream, copy_query_to
 from src.db.repository.base import CRUDRepository
 from src.db.schema.transaction import Transaction
 
 logger = get_logger(__name__)
 repo = CRUDRepository[Transaction](Transaction)
 
+# PostgreSQL's wire protocol limits a statement to 65535 bind parameters
+POSTGRES_MAX_BIND_PARAMS = 65535
+DEFAULT_BULK_BATCH_SIZE = 1000
+
+BulkInsertMode = Literal["insert", "copy"]
+# Listing orders: 'created' is when the row was stored, 'booked' when the
+# payment happened (external_created_at, falling back to createdtimestamp)
+TransactionOrder = Literal["created", "booked", "amount"]
+
+# Columns owned by the external source. Upserts only overwrite these, so
+# user-maintained fields (category, tags, notes) survive a re-sync.
+SOURCE_COLUMNS = (
+    "amount",
+    "currency",
+    "description",
+    "transaction_type",
+    "counterparty_name",
+    "counterparty_iban",
+    "external_source",
+    "external_created_at",
+    "external_updated_at",
+)
+
+# Columns a (bulk) update may change
+UPDATE_COLUMNS = tuple(TransactionUpdate.model_fields)
+
+# Column order of bulk rows, which is also the column list of COPY loads
+COPY_COLUMNS = (*TransactionCreate.model_fields, "content_hash")
+
+# A bulk row: one value per COPY_COLUMNS entry, constrained like the
+# TransactionCreate field of the same name. Build rows by column name
+# (``tuple(values[c] for c in COPY_COLUMNS)``), never by position; the
+# unit tests check that this type stays in step with TransactionCreate.
+TransactionRow = tuple[
+    float,  # amount
+    Annotated[str, MinLen(3), MaxLen(3)],  # currency
+    str | None,  # description
+    str | None,  # transaction_type
+    str | None,  # counterparty_name
+    str | None,  # counterparty_iban
+    str | None,  # category
+    str | None,  # tags
+    str | None,  # notes
+    str | None,  # external_source
+    str | None,  # external_id
+    datetime | None,  # external_created_at
+    datetime | None,  # external_updated_at
+    str,  # content_hash
+]
+_ROWS_ADAPTER = TypeAdapter(list[TransactionRow])
+
+# Columns of CSV exports, in order
+EXPORT_COLUMNS = (
+    "itemid",
+    "createdtimestamp",
+    "external_created_at",
+    "amount",
+    "currency",
+    "transaction_type",
+    "description",
+    "counterparty_name",
+    "counterparty_iban",
+    "category",
+    "tags",
+    "notes",
+    "external_source",
+    "external_id",
+    "duplicate_of",
+)
+_EXTERNAL_ID_INDEX = COPY_COLUMNS.index("external_id")
+
 
 def create_transaction(db: Session, data: TransactionCreate) -> Transaction:
     """Create a single transaction entry in the database.
@@ -31,45 +119,505 @@ def create_transaction(db: Session, data: TransactionCreate) -> Transaction:
     Raises:
         ValueError: If validation fails.
     """
+    validate_new_transaction(data)
+    tx = repo.create(db, data.model_dump())
+    if flag_duplicates(db, [tx.itemid]):
+        db.commit()
+        db.refresh(tx)
+    return tx
+
+
+def validate_new_transaction(data: TransactionCreate) -> None:
+    """Check business rules of a new transaction.
+
+    Raises:
+        ValueError: If the amount is not positive.
+    """
     if data.amount <= 0:
         raise ValueError("amount must be greater than 0")
 
-    return repo.create(db, data.model_dump())
+
+def flag_duplicates(db: Session, itemids: Sequence[UUID]) -> int:
+    """Link new transactions to probable duplicates from other sources.
+
+    A transaction is a probable duplicate of another when both have the
+    same fingerprint (amount, currency, booking day and counterparty IBAN)
+    but come from different sources, e.g. a manual entry or statement
+    import of a payment that was also synced from Bunq. Transactions
+    without a counterparty IBAN have no fingerprint and are never flagged.
+    The given transactions get ``duplicate_of`` set to the oldest such match outside
+    the batch; nothing is merged or deleted.
+
+    All rows are matched with one statement through the fingerprint index,
+    so a batch costs a single query. The caller commits.
+
+    Args:
+        db (Session): Database session.
+        itemids (Sequence[UUID]): Transactions that were just written.
+
+    Returns:
+        int: Number of transactions flagged.
+    """
+    if not itemids:
+        return 0
+
+    flagged = db.execute(duplicate_flag_statement(itemids)).rowcount
+
+    if flagged:
+        logger.info("Flagged %d of %d transactions as probable duplicates", flagged, len(itemids))
+    return flagged
+
+
+def duplicate_flag_statement(itemids: Sequence[UUID]) -> Update:
+    """Build the UPDATE of ``flag_duplicates``; see there."""
+    new = aliased(Transaction)
+    original = aliased(Transaction)
+    matches = (
+        select(new.itemid, original.itemid.label("original_id"))
+        .join(
+            original,
+            and_(
+                original.fingerprint == new.fingerprint,
+                original.external_source.is_distinct_from(new.external_source),
+                original.duplicate_of.is_(None),
+                original.itemid.not_in(itemids),
+            ),
+        )
+        .where(new.itemid.in_(itemids), new.duplicate_of.is_(None))
+        .order_by(new.itemid, original.createdtimestamp, original.itemid)
+        .distinct(new.itemid)
+        .subquery()
+    )
+    return (
+        update(Transaction)
+        .where(Transaction.itemid == matches.c.itemid)
+        .values(duplicate_of=matches.c.original_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def hash_source_values(values: Iterable[Any]) -> str:
+    """Hash source-owned values given in SOURCE_COLUMNS order.
+
+    Args:
+        values (Iterable[Any]): One value per SOURCE_COLUMNS entry.
+
+    Returns:
+        str: Hex SHA-256 digest, stable across runs.
+    """
+    parts = ["" if v is None else v.isoformat() if isinstance(v, datetime) else repr(v) for v in values]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+def compute_content_hash(data: TransactionCreate) -> str:
+    """Hash the source-owned fields of a transaction.
+
+    Args:
+        data (TransactionCreate): Transaction data.
+
+    Returns:
+        str: Hex SHA-256 digest, stable across runs.
+    """
+    return hash_source_values(getattr(data, column) for column in SOURCE_COLUMNS)
+
+
+def _bulk_row(data: TransactionCreate) -> tuple:
+    """Build the bulk row (COPY_COLUMNS order) of one transaction."""
+    return (*(getattr(data, column) for column in TransactionCreate.model_fields), compute_content_hash(data))
+
+
+def validate_transaction_rows(rows: list[tuple]) -> list[tuple]:
+    """Validate a batch of bulk rows in one pass.
+
+    Applies the same type and length constraints as TransactionCreate, but
+    through a single cached TypeAdapter call for the whole batch instead of
+    one model instance per row.
+
+    Args:
+        rows (list[tuple]): Rows in COPY_COLUMNS order.
+
+    Returns:
+        list[tuple]: The validated (and coerced) rows.
+
+    Raises:
+        pydantic.ValidationError: If any row is invalid.
+    """
+    return _ROWS_ADAPTER.validate_python(rows)
+
+
+def max_bulk_batch_size() -> int:
+    """Largest number of rows a single multi-row INSERT can carry.
+
+    Every column of a row may become one bind parameter, and PostgreSQL
+    accepts at most POSTGRES_MAX_BIND_PARAMS parameters per statement.
+
+    Returns:
+        int: Maximum rows per INSERT statement for the transactions table.
+    """
+    return POSTGRES_MAX_BIND_PARAMS // len(Transaction.__table__.columns)
 
 
 def create_transactions_bulk(
     db: Session,
     transactions: list[TransactionCreate],
     skip_duplicates: bool = True,
+    batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    commit_per_batch: bool = False,
+    mode: BulkInsertMode = "insert",
 ) -> tuple[int, int]:
     """Bulk insert transactions with optional duplicate handling.
 
+    In ``"insert"`` mode rows are inserted in chunks of ``batch_size`` so
+    large backfills stay below PostgreSQL's bind-parameter limit and each
+    statement stays cheap to compile. ``batch_size`` is capped at
+    ``max_bulk_batch_size()``.
+
+    In ``"copy"`` mode all rows are streamed into a temporary staging table
+    with ``COPY FROM STDIN`` and merged with one ``INSERT ... SELECT``. This
+    is much faster for large imports; ``batch_size`` and
+    ``commit_per_batch`` do not apply.
+
+    Inserted rows are checked for duplicates from other sources with one
+    query per chunk (see ``flag_duplicates``).
+
     Args:
         db (Session): Database session.
         transactions (list[TransactionCreate]): List of transactions.
         skip_duplicates (bool): If True, skip duplicates based on
             external_id. Defaults to True.
+        batch_size (int): Rows per INSERT statement. Defaults to
+            DEFAULT_BULK_BATCH_SIZE.
+        commit_per_batch (bool): Commit after every chunk instead of once
+            for the whole run. Defaults to False.
+        mode (BulkInsertMode): "insert" for multi-row VALUES inserts or
+            "copy" for COPY into a staging table. Defaults to "insert".
 
     Returns:
         tuple[int, int]: (inserted_count, skipped_count).
+
+    Raises:
+        ValueError: If batch_size is not positive or mode is unknown.
     """
-    if not transactions:
+    return create_transaction_rows_bulk(
+        db,
+        [_bulk_row(t) for t in transactions],
+        skip_duplicates=skip_duplicates,
+        batch_size=batch_size,
+        commit_per_batch=commit_per_batch,
+        mode=mode,
+    )
+
+
+def create_transaction_rows_bulk(
+    db: Session,
+    rows: Sequence[tuple],
+    skip_duplicates: bool = True,
+    batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    commit_per_batch: bool = False,
+    mode: BulkInsertMode = "insert",
+) -> tuple[int, int]:
+    """Bulk insert prepared rows; see ``create_transactions_bulk``.
+
+    Takes rows in COPY_COLUMNS order (content hash included), as built by
+    bulk adapters that skip TransactionCreate. Rows are written as given;
+    run them through ``validate_transaction_rows`` first.
+
+    Args:
+        db (Session): Database session.
+        rows (Sequence[tuple]): Rows in COPY_COLUMNS order.
+        skip_duplicates (bool): If True, skip duplicates based on
+            external_id. Defaults to True.
+        batch_size (int): Rows per INSERT statement. Defaults to
+            DEFAULT_BULK_BATCH_SIZE.
+        commit_per_batch (bool): Commit after every chunk instead of once
+            for the whole run. Defaults to False.
+        mode (BulkInsertMode): "insert" or "copy". Defaults to "insert".
+
+    Returns:
+        tuple[int, int]: (inserted_count, skipped_count).
+
+    Raises:
+        ValueError: If batch_size is not positive or mode is unknown.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than 0")
+    if mode not in ("insert", "copy"):
+        raise ValueError(f"unknown bulk insert mode: {mode}")
+
+    if not rows:
         return (0, 0)
 
-    stmt = insert(Transaction).values([t.model_dump() for t in transactions])
+    if mode == "copy":
+        return _copy_rows(db, rows, skip_duplicates)
+
+    batch_size = min(batch_size, max_bulk_batch_size())
+    inserted = len(_insert_rows(db, rows, skip_duplicates, batch_size, commit_per_batch))
+    skipped = len(rows) - inserted
+
+    logger.info(
+        "Bulk insert complete: %d inserted, %d skipped (duplicates) in %d batch(es)",
+        inserted,
+        skipped,
+        math.ceil(len(rows) / batch_size),
+    )
+
+    return (inserted, skipped)
+
+
+def _insert_rows(
+    db: Session,
+    rows: Sequence[tuple],
+    skip_duplicates: bool,
+    batch_size: int,
+    commit_per_batch: bool,
+    itemids: Sequence[UUID] | None = None,
+) -> list[UUID]:
+    """Insert bulk rows with one multi-row INSERT per chunk and commit.
+
+    Args:
+        db (Session): Database session.
+        rows (Sequence[tuple]): Rows in COPY_COLUMNS order.
+        skip_duplicates (bool): Skip rows whose external_id exists.
+        batch_size (int): Rows per INSERT statement, at most
+            ``max_bulk_batch_size()``.
+        commit_per_batch (bool): Commit after every chunk.
+        itemids (Sequence[UUID] | None): IDs to give the rows, in row
+            order. Defaults to generated ones.
+
+    Returns:
+        list[UUID]: IDs of the inserted rows.
+    """
+    inserted: list[UUID] = []
+
+    for offset in range(0, len(rows), batch_size):
+        values = [dict(zip(COPY_COLUMNS, row, strict=True)) for row in rows[offset : offset + batch_size]]
+        if itemids is not None:
+            for value, itemid in zip(values, itemids[offset : offset + batch_size], strict=True):
+                value["itemid"] = itemid
+        stmt = insert(Transaction).values(values)
+
+        if skip_duplicates:
+            # PostgreSQL UPSERT: skip conflicts on external_id
+            stmt = stmt.on_conflict_do_nothing(index_elements=["external_id"])
+
+        chunk_itemids = db.scalars(stmt.returning(Transaction.itemid)).all()
+        inserted += chunk_itemids
+        flag_duplicates(db, chunk_itemids)
+
+        if commit_per_batch:
+            db.commit()
 
-    if skip_duplicates:
-        # PostgreSQL UPSERT: skip conflicts on external_id
-        stmt = stmt.on_conflict_do_nothing(index_elements=["external_id"])
+    if not commit_per_batch:
+        db.commit()
+
+    return inserted
+
+
+def create_transactions_bulk_results(
+    db: Session,
+    transactions: Sequence[TransactionCreate],
+    skip_duplicates: bool = True,
+    batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+) -> list[TransactionBulkResult]:
+    """Bulk insert transactions and report the outcome of each one.
+
+    Takes the multi-row INSERT path of ``create_transactions_bulk``, with
+    the IDs assigned up front so every transaction can be matched to the
+    rows the database returned. Transactions that break a business rule
+    are reported as invalid and the others are still inserted.
+
+    Args:
+        db (Session): Database session.
+        transactions (Sequence[TransactionCreate]): Transactions to insert.
+        skip_duplicates (bool): If True, skip transactions whose
+            external_id exists. Defaults to True.
+        batch_size (int): Rows per INSERT statement. Defaults to
+            DEFAULT_BULK_BATCH_SIZE.
+
+    Returns:
+        list[TransactionBulkResult]: One result per transaction, in order:
+            created, skipped (duplicate external_id) or invalid.
+
+    Raises:
+        ValueError: If batch_size is not positive.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than 0")
+
+    results: list[TransactionBulkResult] = []
+    rows: list[tuple] = []
+    itemids: list[UUID] = []
+    for index, data in enumerate(transactions):
+        try:
+            validate_new_transaction(data)
+        except ValueError as exc:
+            results.append(TransactionBulkResult(index=index, status="invalid", detail=str(exc)))
+            continue
+        itemid = uuid4()
+        rows.append(_bulk_row(data))
+        itemids.append(itemid)
+        results.append(TransactionBulkResult(index=index, itemid=itemid, status="created"))
+
+    inserted = set(_insert_rows(db, rows, skip_duplicates, min(batch_size, max_bulk_batch_size()), False, itemids))
+    for result in results:
+        if result.itemid is not None and result.itemid not in inserted:
+            result.itemid = None
+            result.status = "skipped"
+            result.detail = "external_id already exists"
+
+    logger.info("Bulk create complete: %d of %d transactions inserted", len(inserted), len(results))
+    return results
+
+
+def upsert_transactions_bulk(
+    db: Session,
+    transactions: list[TransactionCreate],
+    batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+) -> tuple[int, int, int]:
+    """Insert new transactions and update changed ones, keyed on external_id.
+
+    An existing row is only rewritten when the incoming record's content
+    hash differs and it is not older than the stored one (by
+    ``external_updated_at``). Rows that did not change are filtered out by
+    the ``ON CONFLICT ... WHERE`` clause, so they cause no new row version,
+    no dead tuple and no update triggers. Only source-owned columns are
+    overwritten; category, tags and notes are left alone.
+
+    Written rows are checked for duplicates from other sources with one
+    query per chunk (see ``flag_duplicates``).
+
+    Args:
+        db (Session): Database session.
+        transactions (list[TransactionCreate]): List of transactions.
+        batch_size (int): Rows per statement. Defaults to
+            DEFAULT_BULK_BATCH_SIZE.
+
+    Returns:
+        tuple[int, int, int]: (inserted_count, updated_count, unchanged_count).
+
+    Raises:
+        ValueError: If batch_size is not positive.
+    """
+    return upsert_transaction_rows_bulk(db, [_bulk_row(t) for t in transactions], batch_size=batch_size)
+
+
+def upsert_transaction_rows_bulk(
+    db: Session,
+    rows: Sequence[tuple],
+    batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+) -> tuple[int, int, int]:
+    """Upsert prepared rows; see ``upsert_transactions_bulk``.
+
+    Args:
+        db (Session): Database session.
+        rows (Sequence[tuple]): Rows in COPY_COLUMNS order, as accepted by
+            ``create_transaction_rows_bulk``.
+        batch_size (int): Rows per statement. Defaults to
+            DEFAULT_BULK_BATCH_SIZE.
+
+    Returns:
+        tuple[int, int, int]: (inserted_count, updated_count, unchanged_count).
+
+    Raises:
+        ValueError: If batch_size is not positive.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than 0")
+
+    if not rows:
+        return (0, 0, 0)
+
+    # One statement may not touch the same row twice, so keep the last
+    # record per external_id; the dropped ones count as unchanged.
+    unique_rows = list(
+        {
+            row[_EXTERNAL_ID_INDEX] or index: dict(zip(COPY_COLUMNS, row, strict=True))
+            for index, row in enumerate(rows)
+        }.values()
+    )
+    batch_size = min(batch_size, max_bulk_batch_size())
+    inserted = updated = 0
+
+    for offset in range(0, len(unique_rows), batch_size):
+        stmt = insert(Transaction).values(unique_rows[offset : offset + batch_size])
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["external_id"],
+            set_={
+                **{column: excluded[column] for column in SOURCE_COLUMNS},
+                "content_hash": excluded.content_hash,
+                "updatedtimestamp": func.now(),
+            },
+            where=Transaction.content_hash.is_distinct_from(excluded.content_hash)
+            & or_(
+                excluded.external_updated_at.is_(None),
+                Transaction.external_updated_at.is_(None),
+                excluded.external_updated_at >= Transaction.external_updated_at,
+            ),
+        ).returning(Transaction.itemid, literal_column("xmax = 0"))
+
+        # xmax is 0 for freshly inserted row versions and set for updated ones
+        itemids = []
+        for itemid, was_inserted in db.execute(stmt):
+            itemids.append(itemid)
+            if was_inserted:
+                inserted += 1
+            else:
+                updated += 1
+        flag_duplicates(db, itemids)
 
-    result = db.execute(stmt)
     db.commit()
 
-    inserted = result.rowcount
-    skipped = len(transactions) - inserted
+    unchanged = len(rows) - inserted - updated
 
     logger.info(
-        "Bulk insert complete: %d inserted, %d skipped (duplicates)",
+        "Bulk upsert complete: %d inserted, %d updated, %d unchanged",
+        inserted,
+        updated,
+        unchanged,
+    )
+
+    return (inserted, updated, unchanged)
+
+
+def _copy_rows(
+    db: Session,
+    rows: Sequence[tuple],
+    skip_duplicates: bool,
+) -> tuple[int, int]:
+    """Load bulk rows through COPY into a staging table, then merge.
+
+    Runs inside the session's transaction: the staging table is dropped on
+    commit, so nothing is left behind.
+    """
+    table = f"{Transaction.__table__.schema}.{Transaction.__tablename__}"
+    columns = ", ".join(COPY_COLUMNS)
+    stream = CsvRowStream(rows)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute("DROP TABLE IF EXISTS pg_temp.transactions_staging")
+        cursor.execute(
+            f"CREATE TEMP TABLE transactions_staging ON COMMIT DROP AS SELECT {columns} FROM {table} WITH NO DATA"
+        )
+        cursor.copy_expert(f"COPY transactions_staging ({columns}) FROM STDIN WITH (FORMAT csv)", stream)
+
+        merge = f"INSERT INTO {table} (itemid, {columns}) SELECT gen_random_uuid(), {columns} FROM transactions_staging"
+        if skip_duplicates:
+            merge += " ON CONFLICT (external_id) DO NOTHING"
+        cursor.execute(merge + " RETURNING itemid")
+        itemids = [itemid for (itemid,) in cursor]
+    finally:
+        cursor.close()
+
+    inserted = len(itemids)
+    flag_duplicates(db, itemids)
+    db.commit()
+
+    skipped = stream.rows_written - inserted
+
+    logger.info(
+        "COPY load complete: %d inserted, %d skipped (duplicates)",
         inserted,
         skipped,
     )
@@ -77,14 +625,133 @@ def create_transactions_bulk(
     return (inserted, skipped)
 
 
+def _order_key(order_by: TransactionOrder) -> Any:
+    """SQL expression of a listing order; matched by an index on (key, itemid)."""
+    if order_by == "created":
+        return Transaction.createdtimestamp
+    if order_by == "booked":
+        return func.coalesce(Transaction.external_created_at, Transaction.createdtimestamp)
+    if order_by == "amount":
+        return Transaction.amount
+    raise ValueError(f"unknown order: {order_by}")
+
+
+def _filter_created(stmt: Any, start: datetime | None, end: datetime | None) -> Any:
+    if start is not None and end is not None and start > end:
+        raise ValueError("start must be <= end")
+    if start is not None:
+        stmt = stmt.where(Transaction.createdtimestamp >= start)
+    if end is not None:
+        stmt = stmt.where(Transaction.createdtimestamp <= end)
+    return stmt
+
+
+def normalized_iban(iban: Any) -> Any:
+    """IBAN without spaces, in upper case; SQL expression or Python string.
+
+    The SQL form matches the expression index on counterparty IBANs.
+    """
+    if isinstance(iban, str):
+        return iban.replace(" ", "").upper()
+    return func.upper(func.replace(iban, " ", ""))
+
+
+def _filtered(stmt: Any, start: datetime | None, end: datetime | None, filters: TransactionFilters | None) -> Any:
+    """Apply the created range and the TransactionFilters to a query.
+
+    Raises:
+        ValueError: If start > end or min_amount > max_amount.
+    """
+    stmt = _filter_created(stmt, start, end)
+    if filters is None:
+        return stmt
+
+    if filters.min_amount is not None and filters.max_amount is not None and filters.min_amount > filters.max_amount:
+        raise ValueError("min_amount must be <= max_amount")
+    for name in ("category", "external_source", "transaction_type"):
+        value = getattr(filters, name)
+        if value is not None:
+            stmt = stmt.where(Transaction.__table__.c[name] == value)
+    if filters.currency is not None:
+        stmt = stmt.where(Transaction.currency == filters.currency.upper())
+    if filters.min_amount is not None:
+        stmt = stmt.where(Transaction.amount >= filters.min_amount)
+    if filters.max_amount is not None:
+        stmt = stmt.where(Transaction.amount <= filters.max_amount)
+    if filters.counterparty_iban is not None:
+        stmt = stmt.where(normalized_iban(Transaction.counterparty_iban) == normalized_iban(filters.counterparty_iban))
+    return stmt
+
+
+def _ordered(stmt: Any, key: Any, descending: bool) -> Any:
+    if descending:
+        return stmt.order_by(key.desc(), Transaction.itemid.desc())
+    return stmt.order_by(key, Transaction.itemid)
+
+
+def encode_cursor(tx: Transaction, order_by: TransactionOrder = "created", descending: bool = False) -> str:
+    """Build the opaque cursor of the page that follows ``tx``.
+
+    Args:
+        tx (Transaction): Last transaction of the current page.
+        order_by (TransactionOrder): Order of the listing.
+        descending (bool): Whether the listing is in descending order.
+
+    Returns:
+        str: URL-safe cursor.
+    """
+    key: float | str
+    if order_by == "amount":
+        key = tx.amount
+    else:
+        key = (
+            tx.createdtimestamp if order_by == "created" else tx.external_created_at or tx.createdtimestamp
+        ).isoformat()
+    state = [order_by, descending, key, str(tx.itemid)]
+    return base64.urlsafe_b64encode(json.dumps(state).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: TransactionOrder, descending: bool) -> tuple[datetime | float, UUID]:
+    """Read the position stored in a cursor.
+
+    Args:
+        cursor (str): Cursor from ``encode_cursor``.
+        order_by (TransactionOrder): Order of the listing being continued.
+        descending (bool): Direction of the listing being continued.
+
+    Returns:
+        tuple[datetime | float, UUID]: Sort key and itemid of the last row
+            seen.
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another order.
+    """
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        cursor_order, cursor_descending, key, itemid = state
+        position = (float(key) if cursor_order == "amount" else datetime.fromisoformat(key), UUID(itemid))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise ValueError("invalid cursor") from exc
+
+    if (cursor_order, cursor_descending) != (order_by, descending):
+        raise ValueError("cursor belongs to a listing with another order")
+    return position
+
+
 def list_transactions(
     db: Session,
     offset: int = 0,
     limit: int = 100,
     start: datetime | None = None,
     end: datetime | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters | None = None,
 ) -> Sequence[Transaction]:
-    """List transactions, optionally filtered by createdtimestamp.
+    """List transactions, optionally filtered.
+
+    Deep offsets still read and discard every earlier row; use
+    ``list_transactions_page`` to page through large tables.
 
     Args:
         db (Session): Database session.
@@ -92,24 +759,167 @@ def list_transactions(
         limit (int): Maximum results. Defaults to 100.
         start (datetime | None): Filter by created >= start.
         end (datetime | None): Filter by created <= end.
+        order_by (TransactionOrder): 'created', 'booked' or 'amount'.
+            Defaults to 'created'. Ties are broken by itemid.
+        descending (bool): Newest (or largest) first. Defaults to False.
+        filters (TransactionFilters | None): Category, currency, amount
+            range, counterparty IBAN, source and type filters.
 
     Returns:
         Sequence[Transaction]: List of transactions.
 
     Raises:
-        ValueError: If start > end.
+        ValueError: If start > end, min_amount > max_amount or the order
+            is unknown.
     """
-    if start is not None and end is not None and start > end:
-        raise ValueError("start must be <= end")
+    stmt = transactions_query(offset, limit, start, end, order_by, descending, filters)
+    return list(db.execute(stmt).scalars().all())
 
-    stmt = select(Transaction)
-    if start is not None:
-        stmt = stmt.where(Transaction.createdtimestamp >= start)
-    if end is not None:
-        stmt = stmt.where(Transaction.createdtimestamp <= end)
 
-    stmt = stmt.offset(offset).limit(limit)
-    return list(db.execute(stmt).scalars().all())
+def transactions_query(
+    offset: int = 0,
+    limit: int = 100,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters | None = None,
+) -> Select:
+    """Build the query of ``list_transactions``; see there for the arguments.
+
+    Raises:
+        ValueError: If start > end, min_amount > max_amount or the order
+            is unknown.
+    """
+    stmt = _filtered(select(Transaction), start, end, filters)
+    return _ordered(stmt, _order_key(order_by), descending).offset(offset).limit(limit)
+
+
+def list_transactions_page(
+    db: Session,
+    limit: int = 100,
+    cursor: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters | None = None,
+) -> tuple[list[Transaction], str | None]:
+    """List one page of transactions using keyset pagination.
+
+    Instead of skipping rows, the page starts right after the (sort key,
+    itemid) position stored in the cursor. With the composite index on
+    the same columns every page is a short index range scan, so page 500
+    is as fast as page 1, and rows inserted meanwhile never shift pages.
+    The common filters have indexes in the same order, see the model.
+
+    Args:
+        db (Session): Database session.
+        limit (int): Page size. Defaults to 100.
+        cursor (str | None): ``next_cursor`` of the previous page; None for
+            the first page.
+        start (datetime | None): Filter by created >= start.
+        end (datetime | None): Filter by created <= end.
+        order_by (TransactionOrder): 'created', 'booked' or 'amount'.
+            Defaults to 'created'.
+        descending (bool): Newest (or largest) first. Defaults to False.
+        filters (TransactionFilters | None): Category, currency, amount
+            range, counterparty IBAN, source and type filters.
+
+    Returns:
+        tuple[list[Transaction], str | None]: (transactions, next_cursor);
+            next_cursor is None on the last page.
+
+    Raises:
+        ValueError: If limit is not positive, start > end, min_amount >
+            max_amount, the order is unknown or the cursor is invalid.
+    """
+    stmt = transactions_page_query(limit, cursor, start, end, order_by, descending, filters)
+    return split_page(list(db.execute(stmt).scalars().all()), limit, order_by, descending)
+
+
+def transactions_page_query(
+    limit: int = 100,
+    cursor: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters | None = None,
+) -> Select:
+    """Build the query of ``list_transactions_page``; see there for the arguments.
+
+    Selects one row more than ``limit``; pass the rows to ``split_page``.
+
+    Raises:
+        ValueError: If limit is not positive, start > end, min_amount >
+            max_amount, the order is unknown or the cursor is invalid.
+    """
+    if limit <= 0:
+        raise ValueError("limit must be greater than 0")
+
+    key = _order_key(order_by)
+    stmt = _filtered(select(Transaction), start, end, filters)
+    if cursor is not None:
+        position = tuple_(key, Transaction.itemid)
+        after = tuple_(*decode_cursor(cursor, order_by, descending))
+        stmt = stmt.where(position < after if descending else position > after)
+
+    # One extra row tells whether another page follows
+    return _ordered(stmt, key, descending).limit(limit + 1)
+
+
+def split_page(
+    rows: list[Transaction], limit: int, order_by: TransactionOrder, descending: bool
+) -> tuple[list[Transaction], str | None]:
+    """Cut the rows of ``transactions_page_query`` into the page and its next_cursor."""
+    next_cursor = encode_cursor(rows[limit - 1], order_by, descending) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+def transaction_export_query(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    order_by: TransactionOrder = "created",
+    descending: bool = False,
+    filters: TransactionFilters | None = None,
+) -> Select:
+    """Build the query of a CSV export, with the filters of the listing.
+
+    Args:
+        start (datetime | None): Filter by created >= start.
+        end (datetime | None): Filter by created <= end.
+        order_by (TransactionOrder): 'created', 'booked' or 'amount'.
+            Defaults to 'created'.
+        descending (bool): Newest (or largest) first. Defaults to False.
+        filters (TransactionFilters | None): Filters of the listing.
+
+    Returns:
+        Select: Query selecting EXPORT_COLUMNS.
+
+    Raises:
+        ValueError: If start > end, min_amount > max_amount or the order
+            is unknown.
+    """
+    stmt = select(*(Transaction.__table__.c[column] for column in EXPORT_COLUMNS))
+    return _ordered(_filtered(stmt, start, end, filters), _order_key(order_by), descending)
+
+
+def export_transactions_csv(db: Session, destination: Any, query: Select | None = None) -> int:
+    """Write transactions as CSV, rendered by PostgreSQL through COPY.
+
+    Args:
+        db (Session): Database session.
+        destination (Any): Object with a ``write(bytes)`` method.
+        query (Select | None): Export query from
+            ``transaction_export_query``. Defaults to all transactions.
+
+    Returns:
+        int: Number of transactions written.
+    """
+    rows = copy_query_to(db, query if query is not None else transaction_export_query(), destination)
+    logger.info("Exported %d transactions as CSV", rows)
+    return rows
 
 
 def get_transaction(db: Session, itemid) -> Transaction | None:
@@ -136,13 +946,9 @@ def update_transaction(db: Session, itemid, data: TransactionUpdate) -> Transact
     Returns:
         Transaction | None: Updated transaction or None if not found.
     """
-    tx = repo.get(db, itemid)
-    if not tx:
-        return None
-
     # Only update non-None fields
     update_dict = {k: v for k, v in data.model_dump().items() if v is not None}
-    return repo.update(db, tx, update_dict)
+    return repo.update_by_id(db, itemid, update_dict)
 
 
 def delete_transaction(db: Session, itemid) -> bool:
@@ -155,11 +961,106 @@ def delete_transaction(db: Session, itemid) -> bool:
     Returns:
         bool: True if deleted, False if not found.
     """
-    tx = repo.get(db, itemid)
-    if not tx:
-        return False
-    repo.delete(db, tx)
-    return True
+    return repo.delete_by_id(db, itemid)
+
+
+def update_transactions_bulk(
+    db: Session,
+    updates: Sequence[TransactionBulkUpdate],
+    batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+) -> list[TransactionBulkResult]:
+    """Apply many updates with one ``UPDATE ... FROM (VALUES ...)`` statement.
+
+    As with ``update_transaction``, only non-None fields are changed.
+    Updates of the same transaction are merged in order, so replaying a
+    queue of edits ends in the same state as sending them one by one.
+
+    Args:
+        db (Session): Database session.
+        updates (Sequence[TransactionBulkUpdate]): Updates to apply.
+        batch_size (int): Transactions per statement. Defaults to
+            DEFAULT_BULK_BATCH_SIZE.
+
+    Returns:
+        list[TransactionBulkResult]: One result per update, in order:
+            updated or not_found.
+
+    Raises:
+        ValueError: If batch_size is not positive.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than 0")
+
+    changes: dict[UUID, dict[str, Any]] = {}
+    for item in updates:
+        changes.setdefault(item.itemid, {}).update(item.model_dump(exclude={"itemid"}, exclude_none=True))
+
+    table = Transaction.__table__
+    updated: set[UUID] = set()
+    pending = list(changes.items())
+    for offset in range(0, len(pending), batch_size):
+        rows = values(
+            column("itemid", table.c.itemid.type), *(column(name) for name in UPDATE_COLUMNS), name="changes"
+        ).data(
+            [
+                (itemid, *(fields.get(name) for name in UPDATE_COLUMNS))
+                for itemid, fields in pending[offset : offset + batch_size]
+            ]
+        )
+        stmt = (
+            update(Transaction)
+            .where(Transaction.itemid == rows.c.itemid)
+            .values(
+                {
+                    # Untyped VALUES columns are cast back to the column type; NULL keeps the current value
+                    name: func.coalesce(cast(rows.c[name], table.c[name].type), table.c[name])
+                    for name in UPDATE_COLUMNS
+                }
+            )
+            .returning(Transaction.itemid)
+            .execution_options(synchronize_session="fetch")
+        )
+        updated.update(db.scalars(stmt))
+    db.commit()
+
+    logger.info("Bulk update complete: %d of %d transactions updated", len(updated), len(changes))
+    return [
+        TransactionBulkResult(index=index, itemid=item.itemid, status="updated")
+        if item.itemid in updated
+        else TransactionBulkResult(index=index, itemid=item.itemid, status="not_found", detail="Transaction not found")
+        for index, item in enumerate(updates)
+    ]
+
+
+def delete_transactions_bulk(db: Session, itemids: Sequence[UUID]) -> list[TransactionBulkResult]:
+    """Delete many transactions with one ``DELETE ... RETURNING`` statement.
+
+    Args:
+        db (Session): Database session.
+        itemids (Sequence[UUID]): Transaction UUIDs.
+
+    Returns:
+        list[TransactionBulkResult]: One result per UUID, in order:
+            deleted or not_found.
+    """
+    deleted: set[UUID] = set()
+    if itemids:
+        stmt = (
+            delete(Transaction)
+            .where(Transaction.itemid.in_(set(itemids)))
+            .returning(Transaction.itemid)
+            .execution_options(synchronize_session="fetch")
+        )
+        deleted.update(db.scalars(stmt))
+        db.commit()
+
+    logger.info("Bulk delete complete: %d of %d transactions deleted", len(deleted), len(set(itemids)))
+    return [
+        TransactionBulkResult(index=index, itemid=itemid, status="deleted")
+        if itemid in deleted
+        else TransactionBulkResult(index=index, itemid=itemid, status="not_found", detail="Transaction not found")
+        for index, itemid in enumerate(itemids)
+    ]
 
 
 def get_transaction_by_external_id(db: Session, external_source: str, external_id: str) -> Transaction | None:
@@ -2,6 +2,10 @@
 Import all models here so that Base.metadata.create_all() picks them up.
 """
 
+from src.db.schema.job import Job
+from src.db.schema.monetary_account_balance import MonetaryAccountBalance
+from src.db.schema.monetaryaccount import MonetaryAccount
+from src.db.schema.sync_watermark import SyncWatermark
 from src.db.schema.transaction import Transaction
 
-__all__ = ["Transaction"]
+__all__ = ["Job", "MonetaryAccount", "MonetaryAccountBalance", "SyncWatermark", "Transaction"]
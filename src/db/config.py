@@ -20,6 +20,8 @@ class Settings(BaseSettings):
 
     database_type: str = "postgresql"
     database_driver: str = "psycopg2"
+    # Driver of the optional async engine used by the API (asyncpg or psycopg)
+    async_database_driver: str = "asyncpg"
     database_user: str = "postgres"
     database_password: str = "postgres"
     database_host: str = "localhost"
@@ -27,6 +29,8 @@ class Settings(BaseSettings):
     database_name: str = "budgetbuddy"
 
     sqlalchemy_echo: bool = False
+    # Serve the transaction routes from the async engine instead of the threadpool
+    async_api: bool = False
 
     @computed_field
     @property
@@ -37,6 +41,15 @@ class Settings(BaseSettings):
             f"{self.database_host}:{self.database_port}/{self.database_name}"
         )
 
+    @computed_field
+    @property
+    def async_database_url(self) -> str:
+        return (
+            f"{self.database_type}+{self.async_database_driver}://"
+            f"{self.database_user}:{self.database_password}@"
+            f"{self.database_host}:{self.database_port}/{self.database_name}"
+        )
+
 
 # Instantiate settings once for application use
 settings = Settings()
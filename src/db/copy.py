@@ -0,0 +1,94 @@
+"""Helpers for streaming rows through PostgreSQL COPY."""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+
+def format_csv_value(value: Any) -> str:
+    """Format a value as a field for ``COPY ... (FORMAT csv)``.
+
+    ``None`` becomes an unquoted empty field, which COPY reads as NULL.
+    Everything else is quoted, so empty strings stay empty strings.
+
+    Args:
+        value (Any): Python value to format.
+
+    Returns:
+        str: CSV field.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, datetime | date):
+        value = value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+class CsvRowStream(io.TextIOBase):
+    """Read-only file object that renders rows as CSV on demand.
+
+    psycopg2's ``copy_expert`` pulls data with ``read(size)``, so rows are
+    only formatted as COPY consumes them and the full CSV is never held in
+    memory.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]):
+        """Wrap an iterable of rows.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): Rows in COPY column order.
+        """
+        self._lines: Iterator[str] = (",".join(format_csv_value(v) for v in row) + "\n" for row in rows)
+        self._buffer = ""
+        self.rows_written = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> str:
+        """Return up to ``size`` characters of CSV (everything if negative)."""
+        while size is None or size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+            self.rows_written += 1
+
+        if size is None or size < 0:
+            chunk, self._buffer = self._buffer, ""
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def copy_query_to(db: Session, query: Select, destination: Any, header: bool = True) -> int:
+    """Write the result of a query as CSV through ``COPY (...) TO STDOUT``.
+
+    PostgreSQL renders the CSV itself and psycopg2 hands every row to
+    ``destination.write`` as bytes, so no Python row objects are built and
+    memory use does not depend on the number of rows.
+
+    Args:
+        db (Session): Database session; the query runs in its transaction.
+        query (Select): Query to export; bound parameters are inlined.
+        destination (Any): Object with a ``write(bytes)`` method.
+        header (bool): Start with a header row. Defaults to True.
+
+    Returns:
+        int: Number of rows written.
+    """
+    cursor = db.connection().connection.cursor()
+    try:
+        compiled = query.compile(dialect=db.get_bind().dialect, compile_kwargs={"render_postcompile": True})
+        sql = cursor.mogrify(str(compiled), compiled.params).decode()
+        options = "FORMAT csv, HEADER" if header else "FORMAT csv"
+        cursor.copy_expert(f"COPY ({sql}) TO STDOUT WITH ({options})", destination)
+        return cursor.rowcount
+    finally:
+        cursor.close()
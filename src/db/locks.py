@@ -0,0 +1,53 @@
+"""PostgreSQL advisory locks for coordinating work across replicas."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection
+
+
+def advisory_lock_key(name: str) -> int:
+    """Map a lock name to a stable signed 64-bit advisory lock key.
+
+    Python's ``hash`` is salted per process, so a digest is used to give
+    every replica the same key for the same name.
+
+    Args:
+        name (str): Lock name, e.g. 'bunq-sync:/path/to/context.conf'.
+
+    Returns:
+        int: Key for the ``pg_*_advisory_lock`` functions.
+    """
+    return int.from_bytes(hashlib.blake2b(name.encode(), digest_size=8).digest(), "big", signed=True)
+
+
+@contextmanager
+def try_advisory_lock(conn: Connection, name: str) -> Iterator[bool]:
+    """Try to take a session-level advisory lock without waiting.
+
+    The lock belongs to the database connection, not to a transaction, so
+    the connection is not left idle in a transaction while the lock is
+    held. It is released when the block exits, or by PostgreSQL if the
+    connection dies.
+
+    Args:
+        conn (Connection): Dedicated connection that holds the lock. Keep it
+            open for the whole block.
+        name (str): Lock name.
+
+    Yields:
+        bool: True if the lock was taken, False if another connection holds it.
+    """
+    key = advisory_lock_key(name)
+    acquired = bool(conn.scalar(select(func.pg_try_advisory_lock(key))))
+    conn.commit()
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            conn.scalar(select(func.pg_advisory_unlock(key)))
+            conn.commit()
@@ -3,15 +3,25 @@ from __future__ import annotations
 from collections.abc import Iterable, Sequence
 from typing import Any, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, inspect, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import ReturningDelete, ReturningUpdate
 
 T = TypeVar("T")
 
 
 class CRUDRepository[T]:
+    """Generic CRUD access to one mapped model.
+
+    Writes are single ``INSERT/UPDATE/DELETE ... RETURNING`` statements,
+    so the written rows, server defaults included, come back in the same
+    round trip instead of through a refresh SELECT per object.
+    """
+
     def __init__(self, model: type[T]):
         self.model = model
+        # Models have a single-column key (itemid)
+        self.primary_key = inspect(model).primary_key[0]
 
     def get(self, db: Session, itemid: Any) -> T | None:
         return db.get(self.model, itemid)
@@ -21,18 +31,17 @@ class CRUDRepository[T]:
         return list(db.execute(stmt).scalars().all())
 
     def create(self, db: Session, obj_in: dict[str, Any]) -> T:
-        db_obj = self.model(**obj_in)
-        db.add(db_obj)
+        db_obj = db.scalars(insert(self.model).values(**obj_in).returning(self.model)).one()
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
     def create_many(self, db: Session, objs_in: Iterable[dict[str, Any]]) -> Sequence[T]:
-        db_objs = [self.model(**data) for data in objs_in]
-        db.add_all(db_objs)
+        objs_in = list(objs_in)
+        if not objs_in:
+            return []
+        # Executed as batched multi-row INSERTs (insertmanyvalues), in input order
+        db_objs = db.scalars(insert(self.model).returning(self.model, sort_by_parameter_order=True), objs_in).all()
         db.commit()
-        for o in db_objs:
-            db.refresh(o)
         return db_objs
 
     @staticmethod
@@ -44,7 +53,43 @@ class CRUDRepository[T]:
         db.refresh(db_obj)
         return db_obj
 
+    def update_by_id_statement(self, itemid: Any, obj_in: dict[str, Any]) -> ReturningUpdate[T]:
+        """Build the ``UPDATE ... RETURNING`` of ``update_by_id``, for async sessions."""
+        return (
+            update(self.model)
+            .where(self.primary_key == itemid)
+            .values(**obj_in)
+            .returning(self.model)
+            # Refresh the object if the session already holds it
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+
+    def update_by_id(self, db: Session, itemid: Any, obj_in: dict[str, Any]) -> T | None:
+        """Update a row by primary key with one ``UPDATE ... RETURNING``.
+
+        Returns None if no row has the key. An empty ``obj_in`` changes
+        nothing and returns the current row.
+        """
+        if not obj_in:
+            return self.get(db, itemid)
+        db_obj = db.scalars(self.update_by_id_statement(itemid, obj_in)).one_or_none()
+        db.commit()
+        return db_obj
+
     @staticmethod
     def delete(db: Session, db_obj: T) -> None:
         db.delete(db_obj)
         db.commit()
+
+    def delete_by_id_statement(self, itemid: Any) -> ReturningDelete[tuple[Any]]:
+        """Build the ``DELETE ... RETURNING`` of ``delete_by_id``, for async sessions."""
+        return delete(self.model).where(self.primary_key == itemid).returning(self.primary_key)
+
+    def delete_by_id(self, db: Session, itemid: Any) -> bool:
+        """Delete a row by primary key with one ``DELETE ... RETURNING``.
+
+        Returns False if no row has the key.
+        """
+        deleted = db.execute(self.delete_by_id_statement(itemid)).first() is not None
+        db.commit()
+        return deleted
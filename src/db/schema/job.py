@@ -0,0 +1,54 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.schema.base import DEFAULT_SCHEMA, ModelBase
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class Job(ModelBase):
+    """Unit of background work, claimed by workers with FOR UPDATE SKIP LOCKED.
+
+    A claimed job is leased until ``locked_until``. If the worker dies, the
+    lease runs out and another worker picks the job up again, until
+    ``max_attempts`` is used up.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Covers the claim query; finished jobs are left out of the index
+        Index(
+            "ix__jobs__claim",
+            "status",
+            text("priority DESC"),
+            "run_after",
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+        {"schema": DEFAULT_SCHEMA},
+    )
+
+    kind: Mapped[str] = mapped_column(String(100), nullable=False)  # e.g. 'bunq.sync'
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    status: Mapped[str] = mapped_column(String(20), nullable=False, server_default=JOB_QUEUED)
+    # Higher runs first
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="3")
+    # Not claimed before this time; pushed back on every retry
+    run_after: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    # Lease of the worker running the job
+    locked_by: Mapped[str | None] = mapped_column(String(255))
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    result: Mapped[dict[str, Any] | None] = mapped_column(JSONB)
+    last_error: Mapped[str | None] = mapped_column(Text)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
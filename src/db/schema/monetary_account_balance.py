@@ -0,0 +1,33 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Identity, Index, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.schema.base import DEFAULT_SCHEMA, Base
+
+
+class MonetaryAccountBalance(Base):
+    """Point-in-time balance of a monetary account.
+
+    Append-only time series written on every account sync. Rows are kept
+    compact (bigint key, no update timestamp) since one is added per
+    account per run.
+    """
+
+    __tablename__ = "monetary_account_balances"
+    __table_args__ = (
+        Index("ix__monetary_account_balances__account_captured_at", "monetary_account_id", "captured_at"),
+        {"schema": DEFAULT_SCHEMA},
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    monetary_account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey(f"{DEFAULT_SCHEMA}.monetary_accounts.itemid", ondelete="CASCADE"),
+        nullable=False,
+    )
+    balance: Mapped[float] = mapped_column(Float, nullable=False)
+    currency: Mapped[str] = mapped_column(String(3), nullable=False)
+    captured_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
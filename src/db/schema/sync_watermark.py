@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.schema.base import DEFAULT_SCHEMA, ModelBase
+
+
+class SyncWatermark(ModelBase):
+    """Per-monetary-account high-water mark for incremental syncs.
+
+    Records the newest payment that has been synced for an account so the
+    next run can stop paging as soon as it reaches a known payment. While
+    a pass is in progress it also checkpoints the pagination cursor, so an
+    interrupted backfill resumes instead of starting over.
+    """
+
+    __tablename__ = "sync_watermarks"
+    __table_args__ = (
+        UniqueConstraint("external_source", "monetary_account_id"),
+        {"schema": DEFAULT_SCHEMA},
+    )
+
+    external_source: Mapped[str] = mapped_column(String(50), nullable=False)  # 'bunq', etc.
+    monetary_account_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    # Newest payment synced for this account, NULL until the first full pass completes
+    last_payment_id: Mapped[int | None] = mapped_column(BigInteger)
+    last_payment_created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    # Checkpoint of an unfinished pass: the older_id cursor of the next page
+    # to fetch and the newest payment seen so far in that pass
+    resume_older_id: Mapped[int | None] = mapped_column(BigInteger)
+    pending_payment_id: Mapped[int | None] = mapped_column(BigInteger)
+    pending_payment_created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -1,8 +1,27 @@
+import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, String
+from sqlalchemy import Computed, DateTime, Float, ForeignKey, Index, String, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
-from src.db.schema.base import ModelBase
+from src.db.schema.base import DEFAULT_SCHEMA, ModelBase
+
+# Counterparty IBAN without spaces, in upper case; IBAN filters compare on it
+NORMALIZED_IBAN_EXPRESSION = "upper(replace(counterparty_iban, ' ', ''))"
+
+# Normalized amount, currency, booking day (UTC) and counterparty IBAN.
+# Only immutable expressions are allowed in a generated column, hence the
+# day number instead of a formatted date. Without an IBAN the concatenation
+# and so the fingerprint is NULL: amount and day alone match unrelated
+# payments (card payments of the same price on the same day).
+FINGERPRINT_EXPRESSION = (
+    "md5("
+    "round(amount::numeric, 2)::text"
+    " || '|' || upper(currency)"
+    " || '|' || ((coalesce(external_created_at, createdtimestamp) AT TIME ZONE 'UTC')::date - DATE '1970-01-01')::text"
+    " || '|' || upper(replace(counterparty_iban, ' ', ''))"
+    ")"
+)
 
 
 class Transaction(ModelBase):
@@ -13,6 +32,39 @@ class Transaction(ModelBase):
     """
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Keyset pagination: one index per listing order, ties broken by itemid
+        Index("ix__transactions__created_itemid", "createdtimestamp", "itemid"),
+        Index("ix__transactions__booked_itemid", text("coalesce(external_created_at, createdtimestamp)"), "itemid"),
+        Index("ix__transactions__amount_itemid", "amount", "itemid"),
+        # Listing filters, followed by the default order so a filtered page
+        # is still a single range scan. Mostly-NULL columns get partial indexes.
+        Index(
+            "ix__transactions__category_created",
+            "category",
+            "createdtimestamp",
+            "itemid",
+            postgresql_where=text("category IS NOT NULL"),
+        ),
+        Index("ix__transactions__source_created", "external_source", "createdtimestamp", "itemid"),
+        Index(
+            "ix__transactions__type_created",
+            "transaction_type",
+            "createdtimestamp",
+            "itemid",
+            postgresql_where=text("transaction_type IS NOT NULL"),
+        ),
+        Index(
+            "ix__transactions__iban_created",
+            text(NORMALIZED_IBAN_EXPRESSION),
+            "createdtimestamp",
+            "itemid",
+            postgresql_where=text("counterparty_iban IS NOT NULL"),
+        ),
+        # Amount ranges are usually asked per currency
+        Index("ix__transactions__currency_amount", "currency", "amount", "itemid"),
+        {"schema": DEFAULT_SCHEMA},
+    )
 
     # Core financial fields
     amount: Mapped[float] = mapped_column(Float, nullable=False)
@@ -31,6 +83,19 @@ class Transaction(ModelBase):
     # Original transaction timestamps from external system
     external_created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     external_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    # SHA-256 of the source-owned fields, used to skip no-op upserts
+    content_hash: Mapped[str | None] = mapped_column(String(64))
+
+    # Cross-source duplicate detection: equal fingerprints from different
+    # sources are probably the same payment
+    fingerprint: Mapped[str | None] = mapped_column(
+        String(32), Computed(FINGERPRINT_EXPRESSION, persisted=True), index=True
+    )
+    duplicate_of: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey(f"{DEFAULT_SCHEMA}.transactions.itemid", ondelete="SET NULL"),
+        index=True,
+    )
 
     # Additional metadata
     category: Mapped[str | None] = mapped_column(String(100))
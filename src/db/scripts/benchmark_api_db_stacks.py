@@ -0,0 +1,110 @@
+"""Benchmark the transaction API on the sync and the async database stack.
+
+Seeds synthetic transactions into the configured database, then runs the
+same mix of concurrent list and get-by-id requests against the app built
+with the threadpool routes and with the async routes. Reports requests/sec
+and p50/p99 latency per stack. Requests go through httpx's ASGI transport,
+so no server is needed; benchmark rows are removed again afterwards.
+
+Usage:
+    python -m src.db.scripts.benchmark_api_db_stacks --requests 2000 --concurrency 10 50 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from uuid import UUID, uuid4
+
+import httpx
+from sqlalchemy import delete, select
+
+from src.budgetbuddy.api.app import create_app
+from src.budgetbuddy.banking.schemas.transaction import TransactionCreate
+from src.budgetbuddy.services.transaction_service import create_transactions_bulk
+from src.db.schema.transaction import Transaction
+from src.db.session import SessionLocal
+
+BENCHMARK_SOURCE = "benchmark_api"
+
+
+def seed_transactions(count: int) -> list[UUID]:
+    run_id = uuid4().hex[:8]
+    transactions = [
+        TransactionCreate(
+            amount=float(i % 500) + 0.99,
+            currency="EUR",
+            description=f"Benchmark payment {i}",
+            external_source=BENCHMARK_SOURCE,
+            external_id=f"{BENCHMARK_SOURCE}_{run_id}_{i}",
+        )
+        for i in range(count)
+    ]
+    with SessionLocal() as db:
+        create_transactions_bulk(db, transactions)
+        return list(db.scalars(select(Transaction.itemid).where(Transaction.external_source == BENCHMARK_SOURCE)))
+
+
+def remove_transactions() -> None:
+    with SessionLocal() as db:
+        db.execute(delete(Transaction).where(Transaction.external_source == BENCHMARK_SOURCE))
+        db.commit()
+
+
+async def run_load(async_api: bool, itemids: list[UUID], requests: int, concurrency: int) -> tuple[float, list[float]]:
+    """Send ``requests`` requests from ``concurrency`` workers; every other one lists a page."""
+    transport = httpx.ASGITransport(app=create_app(async_api=async_api))
+    latencies: list[float] = []
+    counter = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+
+        async def worker() -> None:
+            for i in counter:
+                if i % 2:
+                    url = f"/transactions/{itemids[i % len(itemids)]}"
+                else:
+                    url = "/transactions/?limit=50&order_by=booked&descending=true"
+                start = time.perf_counter()
+                response = await client.get(url)
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return elapsed, latencies
+
+
+async def compare_stacks(itemids: list[UUID], requests: int, concurrencies: list[int]) -> None:
+    # One event loop for all runs: the async engine's pooled connections belong to it
+    print(f"{'stack':>6} {'workers':>8} {'requests':>9} {'req/sec':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for concurrency in concurrencies:
+        for stack, async_api in (("sync", False), ("async", True)):
+            elapsed, latencies = await run_load(async_api, itemids, requests, concurrency)
+            percentiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"{stack:>6} {concurrency:>8} {len(latencies):>9} {len(latencies) / elapsed:>9.0f} "
+                f"{percentiles[49] * 1000:>8.1f} {percentiles[98] * 1000:>8.1f}"
+            )
+
+
+def run_benchmark(rows: int, requests: int, concurrencies: list[int]) -> None:
+    itemids = seed_transactions(rows)
+    try:
+        asyncio.run(compare_stacks(itemids, requests, concurrencies))
+    finally:
+        remove_transactions()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 100])
+    args = parser.parse_args()
+
+    run_benchmark(args.rows, args.requests, args.concurrency)
@@ -0,0 +1,78 @@
+"""Benchmark create_transactions_bulk throughput at different chunk sizes.
+
+Inserts synthetic transactions into the configured database and reports
+rows/sec per batch size, followed by the COPY staging path for comparison.
+Benchmark rows are tagged with their own external_source and removed again
+afterwards.
+
+Usage:
+    python -m src.db.scripts.benchmark_bulk_insert --rows 20000 --batch-sizes 250 1000 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from uuid import uuid4
+
+from sqlalchemy import delete
+
+from src.budgetbuddy.banking.schemas.transaction import TransactionCreate
+from src.budgetbuddy.services.transaction_service import create_transactions_bulk, max_bulk_batch_size
+from src.db.schema.transaction import Transaction
+from src.db.session import SessionLocal
+
+BENCHMARK_SOURCE = "benchmark"
+
+
+def make_transactions(count: int) -> list[TransactionCreate]:
+    run_id = uuid4().hex[:8]
+    return [
+        TransactionCreate(
+            amount=float(i % 500) + 0.99,
+            currency="EUR",
+            description=f"Benchmark payment {i}",
+            transaction_type="BUNQ",
+            counterparty_name="Benchmark Shop",
+            counterparty_iban="NL00BUNQ0000000000",
+            external_source=BENCHMARK_SOURCE,
+            external_id=f"{BENCHMARK_SOURCE}_{run_id}_{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def time_load(rows: int, **kwargs) -> tuple[int, float]:
+    transactions = make_transactions(rows)
+
+    with SessionLocal() as db:
+        start = time.perf_counter()
+        inserted, _ = create_transactions_bulk(db, transactions, **kwargs)
+        elapsed = time.perf_counter() - start
+
+        db.execute(delete(Transaction).where(Transaction.external_source == BENCHMARK_SOURCE))
+        db.commit()
+
+    return inserted, elapsed
+
+
+def run_benchmark(rows: int, batch_sizes: list[int], commit_per_batch: bool) -> None:
+    print(f"{'mode':>6} {'batch_size':>10} {'rows':>8} {'seconds':>9} {'rows/sec':>10}")
+
+    for batch_size in batch_sizes:
+        inserted, elapsed = time_load(rows, batch_size=batch_size, commit_per_batch=commit_per_batch)
+        effective = min(batch_size, max_bulk_batch_size())
+        print(f"{'insert':>6} {effective:>10} {inserted:>8} {elapsed:>9.3f} {inserted / elapsed:>10.0f}")
+
+    inserted, elapsed = time_load(rows, mode="copy")
+    print(f"{'copy':>6} {'-':>10} {inserted:>8} {elapsed:>9.3f} {inserted / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 500, 1000, 2000, max_bulk_batch_size()])
+    parser.add_argument("--commit-per-batch", action="store_true")
+    args = parser.parse_args()
+
+    run_benchmark(args.rows, args.batch_sizes, args.commit_per_batch)
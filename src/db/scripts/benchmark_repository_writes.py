@@ -0,0 +1,105 @@
+"""Count the queries and time of CRUDRepository writes.
+
+Compares the repository's RETURNING writes with the previous ORM pattern
+(add/commit/refresh per object, get before update and delete) on the
+configured database. Benchmark rows are tagged with their own
+external_source and removed again afterwards.
+
+Usage:
+    python -m src.db.scripts.benchmark_repository_writes --rows 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import delete, event
+from sqlalchemy.orm import Session
+
+from src.db.repository.base import CRUDRepository
+from src.db.schema.transaction import Transaction
+from src.db.session import SessionLocal, engine
+
+BENCHMARK_SOURCE = "benchmark_repository"
+DML = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+repo = CRUDRepository(Transaction)
+
+
+def make_rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {"amount": float(i % 500) + 0.99, "currency": "EUR", "external_source": BENCHMARK_SOURCE} for i in range(count)
+    ]
+
+
+def measure(work: Callable[[Session], Any]) -> tuple[int, float]:
+    """Run ``work`` in a new session; return its DML query count and seconds."""
+    queries = 0
+
+    def count(conn, cursor, statement, parameters, context, executemany) -> None:
+        nonlocal queries
+        queries += statement.lstrip().upper().startswith(DML)
+
+    with SessionLocal() as db:
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            start = time.perf_counter()
+            work(db)
+            elapsed = time.perf_counter() - start
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+    return queries, elapsed
+
+
+def orm_create_many(db: Session, rows: list[dict[str, Any]]) -> list[Transaction]:
+    objs = [Transaction(**row) for row in rows]
+    db.add_all(objs)
+    db.commit()
+    for obj in objs:
+        db.refresh(obj)
+    return objs
+
+
+def orm_update(db: Session, itemid: Any) -> None:
+    tx = db.get(Transaction, itemid)
+    tx.category = "benchmark"
+    db.commit()
+    db.refresh(tx)
+
+
+def orm_delete(db: Session, itemid: Any) -> None:
+    db.delete(db.get(Transaction, itemid))
+    db.commit()
+
+
+def run_benchmark(rows: int) -> None:
+    print(f"{'operation':>24} {'queries':>8} {'seconds':>9}")
+    created: dict[str, list[Any]] = {}
+
+    cases = [
+        ("orm create_many", lambda db: created.update(orm=[t.itemid for t in orm_create_many(db, make_rows(rows))])),
+        ("repo create_many", lambda db: created.update(repo=[t.itemid for t in repo.create_many(db, make_rows(rows))])),
+        ("orm get+update+refresh", lambda db: orm_update(db, created["orm"][0])),
+        ("repo update_by_id", lambda db: repo.update_by_id(db, created["repo"][0], {"category": "benchmark"})),
+        ("orm get+delete", lambda db: orm_delete(db, created["orm"][0])),
+        ("repo delete_by_id", lambda db: repo.delete_by_id(db, created["repo"][0])),
+    ]
+    try:
+        for name, work in cases:
+            queries, elapsed = measure(work)
+            print(f"{name:>24} {queries:>8} {elapsed:>9.3f}")
+    finally:
+        with SessionLocal() as db:
+            db.execute(delete(Transaction).where(Transaction.external_source == BENCHMARK_SOURCE))
+            db.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000)
+    args = parser.parse_args()
+
+    run_benchmark(args.rows)
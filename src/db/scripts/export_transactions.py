@@ -0,0 +1,55 @@
+"""Export transactions to a Parquet file or an Arrow IPC stream for pandas.
+
+Reads the transactions table through a server-side cursor and writes one
+row group (or record batch) per batch, so memory stays flat for any
+number of rows. Needs the 'arrow' extra (pyarrow).
+
+Usage:
+    python -m src.db.scripts.export_transactions transactions.parquet
+    python -m src.db.scripts.export_transactions transactions.arrow --format arrow --start 2025-01-01T00:00:00+00:00
+
+Then load it with ``pandas.read_parquet("transactions.parquet")``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime
+
+from src.budgetbuddy.services.transaction_export_service import (
+    DEFAULT_ARROW_BATCH_SIZE,
+    arrow_export_query,
+    export_transactions_arrow,
+)
+from src.common.log.logger import get_logger
+from src.db.session import SessionLocal
+
+logger = get_logger(__name__)
+
+
+def main():
+    """Write the export file."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="output file")
+    parser.add_argument("--format", choices=["parquet", "arrow"], help="defaults to the file extension, else parquet")
+    parser.add_argument("--start", type=datetime.fromisoformat, help="only transactions created at or after this")
+    parser.add_argument("--end", type=datetime.fromisoformat, help="only transactions created at or before this")
+    parser.add_argument("--order-by", choices=["created", "booked", "amount"], default="created")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_ARROW_BATCH_SIZE)
+    args = parser.parse_args()
+
+    file_format = args.format or ("arrow" if args.path.endswith((".arrow", ".arrows")) else "parquet")
+    query = arrow_export_query(start=args.start, end=args.end, order_by=args.order_by)
+
+    started = time.perf_counter()
+    with SessionLocal() as session:
+        rows = export_transactions_arrow(session, args.path, file_format, query, batch_size=args.batch_size)
+
+    logger.info("File:                  %s (%s)", args.path, file_format)
+    logger.info("Transactions:          %d", rows)
+    logger.info("Elapsed seconds:       %.2f", time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 # Centralized SQLAlchemy engine and session factory
+from functools import lru_cache
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from src.db.config import DATABASE_URL, settings
@@ -13,3 +16,19 @@ engine = create_engine(
 
 # Session factory. expire_on_commit=False keeps attributes accessible after commit.
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Session factory of the async engine, created on first use.
+
+    Only the API uses the async engine; scripts and workers keep using
+    SessionLocal. It is created lazily so the async driver (asyncpg by
+    default, see the 'async' extra) is only needed when it is used.
+    """
+    async_engine = create_async_engine(
+        settings.async_database_url,
+        echo=settings.sqlalchemy_echo,
+        pool_pre_ping=True,
+    )
+    return async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
@@ -0,0 +1,47 @@
+"""Tests for the banking API router."""
+
+import pytest
+
+
+@pytest.mark.integration
+def test_banking_accounts_and_balances(client, db_session):
+    """Test synced accounts and their balance history are served from the database."""
+    from src.budgetbuddy.banking.schemas.monetaryaccount import MonetaryAccountCreate
+    from src.budgetbuddy.services.monetary_account_service import upsert_monetary_accounts
+
+    account = MonetaryAccountCreate(
+        account_name="Main", currency="EUR", balance=42.0, external_source="bunq", external_id="bunq_1"
+    )
+    upsert_monetary_accounts(db_session, [account])
+
+    r = client.get("/banking/accounts")
+    assert r.status_code == 200
+    accounts = r.json()
+    assert [a["account_name"] for a in accounts] == ["Main"]
+    assert accounts[0]["balance"] == 42.0
+
+    r = client.get(f"/banking/accounts/{accounts[0]['itemid']}/balances")
+    assert r.status_code == 200
+    assert [b["balance"] for b in r.json()] == [42.0]
+
+    r = client.get("/banking/accounts/00000000-0000-0000-0000-000000000000/balances")
+    assert r.status_code == 404
+
+
+@pytest.mark.integration
+def test_enqueue_bunq_sync_and_poll_job(client):
+    """Test a sync request is queued for the workers and its status can be polled."""
+    r = client.post("/banking/bunq/sync", json={"full_resync": True, "priority": 3})
+    assert r.status_code == 202
+    job = r.json()
+    assert job["kind"] == "bunq.sync"
+    assert job["status"] == "queued"
+    assert job["priority"] == 3
+    assert job["payload"] == {"full_resync": True, "load_mode": "insert"}
+
+    r = client.get(f"/banking/jobs/{job['itemid']}")
+    assert r.status_code == 200
+    assert r.json()["status"] == "queued"
+
+    assert client.post("/banking/bunq/sync", json={"load_mode": "merge"}).status_code == 422
+    assert client.get("/banking/jobs/00000000-0000-0000-0000-000000000000").status_code == 404
@@ -0,0 +1,50 @@
+"""Tests for streaming request bodies to blocking consumers."""
+
+import asyncio
+import threading
+
+import pytest
+from src.budgetbuddy.api.body_stream import consume_request_body
+from starlette.requests import ClientDisconnect
+
+
+class _DroppedRequest:
+    """Request whose client disconnects after the first chunk."""
+
+    async def stream(self):
+        yield b"first chunk,"
+        raise ClientDisconnect()
+
+
+@pytest.mark.unit
+def test_consume_request_body_reads_whole_body():
+    class _Request:
+        async def stream(self):
+            for chunk in (b"a,", b"", b"b,", b"c"):
+                yield chunk
+
+    assert asyncio.run(consume_request_body(_Request(), lambda stream: stream.read())) == b"a,b,c"
+
+
+@pytest.mark.unit
+def test_dropped_upload_ends_the_consumer():
+    consumer_done = threading.Event()
+    errors = []
+
+    def consume(stream):
+        try:
+            return stream.read()
+        except OSError as exc:
+            errors.append(exc)
+            raise
+        finally:
+            consumer_done.set()
+
+    async def upload():
+        await asyncio.wait_for(consume_request_body(_DroppedRequest(), consume), timeout=5)
+
+    with pytest.raises(ClientDisconnect):
+        asyncio.run(upload())
+
+    assert consumer_done.is_set()
+    assert len(errors) == 1
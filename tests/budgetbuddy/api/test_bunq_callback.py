@@ -0,0 +1,67 @@
+"""Tests for push ingestion through the Bunq callback endpoint."""
+
+import contextlib
+
+import pytest
+from sqlalchemy import func, select
+from src.budgetbuddy.api.app import app
+from src.budgetbuddy.api.deps import get_bunq_server_public_key, get_session_factory
+from src.budgetbuddy.banking.bunq.stand_in import BunqStandIn, SyntheticHistory
+from src.db.schema.transaction import Transaction
+
+
+@pytest.fixture
+def notifier():
+    """Stand-in whose server key the callback endpoint trusts.
+
+    Yields:
+        BunqStandIn: Stand-in used to sign notifications.
+    """
+    with BunqStandIn(SyntheticHistory(accounts=1, payments_per_account=3)) as server:
+        app.dependency_overrides[get_bunq_server_public_key] = lambda: server.server_key.publickey()
+        yield server
+
+
+@pytest.fixture
+def push_client(client, db_session, notifier):
+    """TestClient whose background tasks write through the test session."""
+    app.dependency_overrides[get_session_factory] = lambda: lambda: contextlib.nullcontext(db_session)
+    return client
+
+
+def _payment_count(db_session):
+    return db_session.scalar(select(func.count()).select_from(Transaction))
+
+
+@pytest.mark.integration
+def test_signed_notification_is_ingested_once(push_client, notifier, db_session):
+    """Test a verified payment notification is upserted, and retries are idempotent."""
+    account_id = notifier.history.account_ids()[0]
+    payment_id = notifier.history.payment_ids(account_id)[-1]
+    body, headers = notifier.notification(account_id, payment_id)
+
+    first = push_client.post("/banking/bunq/callback", content=body, headers=headers)
+    retry = push_client.post("/banking/bunq/callback", content=body, headers=headers)
+
+    assert first.status_code == retry.status_code == 202
+    assert first.json() == {"status": "accepted", "payment_id": payment_id}
+    assert _payment_count(db_session) == 1
+    stored = db_session.scalars(select(Transaction)).one()
+    assert stored.external_id == f"bunq_{payment_id}"
+
+
+@pytest.mark.integration
+def test_rejects_bad_signatures_and_ignores_other_categories(push_client, notifier, db_session):
+    """Test unsigned or tampered bodies are refused and non-payment events skipped."""
+    account_id = notifier.history.account_ids()[0]
+    body, headers = notifier.notification(account_id, notifier.history.payment_ids(account_id)[0])
+
+    tampered = push_client.post("/banking/bunq/callback", content=body.replace(b"EUR", b"USD"), headers=headers)
+    unsigned = push_client.post("/banking/bunq/callback", content=body, headers={"Content-Type": "application/json"})
+    body, headers = notifier.notification(account_id, notifier.history.payment_ids(account_id)[0], "CARD_TRANSACTION")
+    other = push_client.post("/banking/bunq/callback", content=body, headers=headers)
+
+    assert tampered.status_code == unsigned.status_code == 401
+    assert other.status_code == 202
+    assert other.json() == {"status": "ignored"}
+    assert _payment_count(db_session) == 0
@@ -9,9 +9,24 @@
 # from tests.budgetbuddy.db.test_db import TestSessionLocal
 #
 
-from uuid import UUID
+import contextlib
+import csv
+import io
+from uuid import UUID, uuid4
 
 import pytest
+from src.budgetbuddy.api.app import app
+from src.budgetbuddy.api.deps import get_session_factory
+from src.budgetbuddy.api.router.transaction import MAX_BULK_ITEMS
+
+MT940_STATEMENT = b""":20:STMT
+:25:NL20INGB0001234567
+:60F:C240301EUR100,00
+:61:2403010301D12,50NTRFNONREF
+:86:/NAME/Coffee Shop/REMI/Coffee/
+:62F:C240301EUR87,50
+-
+"""
 
 
 @pytest.mark.smoke
@@ -69,3 +84,110 @@ def test_transaction_crud_flow(client):
     # Ensure 404 after delete
     r = client.get(f"/transactions/{itemid}")
     assert r.status_code == 404
+
+
+@pytest.mark.integration
+def test_import_statement(client):
+    """Test a statement posted as the raw body is imported idempotently."""
+    resp = client.post("/transactions/import", content=MT940_STATEMENT)
+    assert resp.status_code == 201, resp.text
+    body = resp.json()
+    assert (body["format"], body["entries"], body["inserted"]) == ("mt940", 1, 1)
+
+    again = client.post("/transactions/import?format=mt940", content=MT940_STATEMENT).json()
+    assert (again["inserted"], again["unchanged"]) == (0, 1)
+
+
+@pytest.mark.integration
+def test_import_statement_rejects_malformed_file(client):
+    resp = client.post("/transactions/import?format=csv&account=NL91ABNA0417164300", content=b"date,amount\nx,1\n")
+    assert resp.status_code == 400
+
+
+@pytest.mark.integration
+def test_list_transactions_cursor_pages(client):
+    """Test following X-Next-Cursor pages through every transaction once."""
+    created = {client.post("/transactions/", json={"amount": n, "currency": "EUR"}).json()["itemid"] for n in (1, 2, 3)}
+
+    seen, params = [], {"limit": 2}
+    while True:
+        r = client.get("/transactions/", params=params)
+        assert r.status_code == 200
+        seen += [x["itemid"] for x in r.json()]
+        if "X-Next-Cursor" not in r.headers:
+            break
+        params = {"limit": 2, "cursor": r.headers["X-Next-Cursor"]}
+
+    assert sorted(seen) == sorted(created)
+    first_cursor = client.get("/transactions/", params={"limit": 1}).headers["X-Next-Cursor"]
+    assert client.get("/transactions/", params={"cursor": first_cursor, "offset": 2}).status_code == 400
+    assert client.get("/transactions/", params={"cursor": "garbage"}).status_code == 400
+
+
+@pytest.mark.integration
+def test_list_transactions_filters(client):
+    for category, amount in (("groceries", 12.5), ("groceries", 80.0), ("rent", 950.0)):
+        client.post("/transactions/", json={"amount": amount, "currency": "EUR", "category": category})
+
+    r = client.get("/transactions/", params={"category": "groceries", "max_amount": 50, "order_by": "amount"})
+    assert r.status_code == 200
+    assert [(x["category"], x["amount"]) for x in r.json()] == [("groceries", 12.5)]
+    assert client.get("/transactions/", params={"min_amount": 10, "max_amount": 1}).status_code == 400
+    assert client.get("/transactions/", params={"currency": "EURO"}).status_code == 422
+
+
+@pytest.mark.integration
+def test_bulk_write_flow(client):
+    """Test creating, updating and deleting transactions in bulk."""
+    r = client.post(
+        "/transactions/bulk",
+        json=[{"amount": 1.5, "currency": "EUR", "description": "a"}, {"amount": 0, "currency": "EUR"}],
+    )
+    assert r.status_code == 200
+    created, invalid = r.json()
+    assert created["status"] == "created" and invalid["status"] == "invalid"
+
+    r = client.patch("/transactions/bulk", json=[{"itemid": created["itemid"], "description": "b"}])
+    assert r.status_code == 200
+    assert r.json()[0]["status"] == "updated"
+    assert client.get(f"/transactions/{created['itemid']}").json()["description"] == "b"
+
+    r = client.request("DELETE", "/transactions/bulk", json=[created["itemid"]])
+    assert r.status_code == 200
+    assert r.json()[0]["status"] == "deleted"
+    assert client.get(f"/transactions/{created['itemid']}").status_code == 404
+
+
+@pytest.mark.integration
+def test_bulk_write_rejects_oversized_requests(client):
+    resp = client.request("DELETE", "/transactions/bulk", json=[str(uuid4()) for _ in range(MAX_BULK_ITEMS + 1)])
+    assert resp.status_code == 422
+
+
+@pytest.mark.integration
+def test_export_transactions_csv(client, db_session):
+    """Test the CSV export streams every transaction."""
+    app.dependency_overrides[get_session_factory] = lambda: lambda: contextlib.nullcontext(db_session)
+    for amount in (1, 2, 3):
+        client.post("/transactions/", json={"amount": amount, "currency": "EUR", "description": f"row {amount}"})
+
+    resp = client.get("/transactions/export.csv")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert sorted(row["description"] for row in rows) == ["row 1", "row 2", "row 3"]
+    assert client.get("/transactions/export.csv?start=2030-01-02T00:00:00Z&end=2030-01-01T00:00:00Z").status_code == 400
+
+
+@pytest.mark.integration
+def test_export_transactions_parquet(client, db_session):
+    pq = pytest.importorskip("pyarrow.parquet")
+    app.dependency_overrides[get_session_factory] = lambda: lambda: contextlib.nullcontext(db_session)
+    client.post("/transactions/", json={"amount": 4.2, "currency": "EUR", "description": "parquet row"})
+
+    resp = client.get("/transactions/export.parquet")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/vnd.apache.parquet"
+    assert "parquet row" in pq.read_table(io.BytesIO(resp.content)).column("description").to_pylist()
@@ -0,0 +1,105 @@
+import pytest
+
+pytest.importorskip("asyncpg")
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from src.budgetbuddy.api.app import create_app
+from src.budgetbuddy.api.deps import get_async_db, get_session_factory
+from src.budgetbuddy.api.router.transaction import NEXT_CURSOR_HEADER
+
+
+@pytest.fixture()
+def async_client(test_engine):
+    """TestClient of the async-routes app; each test runs in a rolled-back transaction."""
+    app = create_app(async_api=True)
+    url = test_engine.url.set(drivername="postgresql+asyncpg")
+    state = {}
+
+    async def begin():
+        state["engine"] = create_async_engine(url, poolclass=NullPool)
+        state["connection"] = await state["engine"].connect()
+        state["transaction"] = await state["connection"].begin()
+        state["session"] = AsyncSession(
+            bind=state["connection"], join_transaction_mode="create_savepoint", expire_on_commit=False
+        )
+
+    async def rollback():
+        await state["session"].close()
+        await state["transaction"].rollback()
+        await state["connection"].close()
+        await state["engine"].dispose()
+
+    async def _get_test_db():
+        yield state["session"]
+
+    app.dependency_overrides[get_async_db] = _get_test_db
+    # Requests run on the client's event loop, so the async connection is opened there too
+    with TestClient(app) as c:
+        c.portal.call(begin)
+        try:
+            yield c
+        finally:
+            c.portal.call(rollback)
+
+
+@pytest.mark.integration
+def test_async_transaction_crud_flow(async_client):
+    r = async_client.post("/transactions/", json={"amount": 5.0, "currency": "EUR", "description": "coffee"})
+    assert r.status_code == 201
+    itemid = r.json()["itemid"]
+
+    r = async_client.get(f"/transactions/{itemid}")
+    assert r.status_code == 200
+    assert r.json()["description"] == "coffee"
+
+    r = async_client.patch(f"/transactions/{itemid}", json={"description": "latte"})
+    assert r.status_code == 200
+    assert r.json()["description"] == "latte"
+
+    r = async_client.delete(f"/transactions/{itemid}")
+    assert r.status_code == 204
+    assert async_client.get(f"/transactions/{itemid}").status_code == 404
+
+
+@pytest.mark.integration
+def test_async_create_flags_duplicate(async_client):
+    payload = {"amount": 9.99, "currency": "EUR", "counterparty_iban": "NL20INGB0001234567"}
+    first = async_client.post("/transactions/", json={**payload, "external_source": "bunq"}).json()
+    second = async_client.post("/transactions/", json={**payload, "external_source": "mt940"}).json()
+
+    assert second["duplicate_of"] == first["itemid"]
+
+
+@pytest.mark.integration
+def test_async_list_pages_with_cursor(async_client):
+    created = [
+        async_client.post("/transactions/", json={"amount": float(i + 1), "currency": "EUR"}).json()["itemid"]
+        for i in range(5)
+    ]
+
+    seen = []
+    r = async_client.get("/transactions/", params={"limit": 2})
+    while True:
+        assert r.status_code == 200
+        seen += [item["itemid"] for item in r.json()]
+        cursor = r.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+        r = async_client.get("/transactions/", params={"limit": 2, "cursor": cursor})
+
+    assert len(seen) == len(set(seen))
+    assert set(created) <= set(seen)
+    assert async_client.get("/transactions/", params={"offset": 1, "cursor": "x"}).status_code == 400
+
+
+@pytest.mark.integration
+def test_async_app_keeps_sync_file_routes(async_client, test_engine):
+    # /export.csv must not be captured by the async /{itemid} route
+    async_client.app.dependency_overrides[get_session_factory] = lambda: sessionmaker(bind=test_engine)
+
+    r = async_client.get("/transactions/export.csv")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/csv")
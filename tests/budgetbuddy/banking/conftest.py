@@ -4,7 +4,11 @@ from datetime import datetime
 from unittest.mock import Mock
 
 import pytest
-from bunq.sdk.model.generated.endpoint import PaymentApiObject
+from bunq.sdk.model.generated.endpoint import (
+    MonetaryAccountBankApiObject,
+    MonetaryAccountSavingsApiObject,
+    PaymentApiObject,
+)
 from bunq.sdk.model.generated.object_ import (
     AmountObject as Amount,
 )
@@ -14,6 +18,8 @@ from bunq.sdk.model.generated.object_ import (
 from bunq.sdk.model.generated.object_ import (
     PointerObject as Pointer,
 )
+from src.budgetbuddy.banking.bunq.rate_limit import BunqRateLimiter
+from src.budgetbuddy.banking.bunq.stand_in import BunqStandIn, SyntheticHistory, sdk_base_url
 
 
 @pytest.fixture
@@ -75,3 +81,79 @@ def mock_bunq_payments(mock_bunq_payment, mock_bunq_payment_minimal):
         list: List of mock payment objects.
     """
     return [mock_bunq_payment, mock_bunq_payment_minimal]
+
+
+@pytest.fixture
+def mock_bunq_bank_account():
+    """Create a mock Bunq MonetaryAccountBankApiObject for testing.
+
+    Returns:
+        Mock: A mock checking account with an IBAN alias.
+    """
+    account = Mock(spec=MonetaryAccountBankApiObject)
+    account.id_ = 100
+    account.description = "Main account"
+    account.currency = "EUR"
+    account.status = "ACTIVE"
+    account.created = datetime(2024, 1, 1, 9, 0, 0)
+    account.updated = datetime(2025, 10, 1, 9, 0, 0)
+
+    account.balance = Mock(spec=Amount)
+    account.balance.value = "1234.56"
+    account.balance.currency = "EUR"
+
+    iban = Mock(spec=Pointer, type_="IBAN", value="NL12BUNQ0123456789")
+    iban.name = "Jane Doe"
+    email = Mock(spec=Pointer, type_="EMAIL", value="jane@example.com")
+    email.name = "Jane Doe"
+    account.alias = [email, iban]
+
+    return account
+
+
+@pytest.fixture
+def mock_bunq_savings_account():
+    """Create a mock Bunq MonetaryAccountSavingsApiObject for testing.
+
+    Returns:
+        Mock: A mock savings account without aliases.
+    """
+    account = Mock(spec=MonetaryAccountSavingsApiObject)
+    account.id_ = 200
+    account.description = "Holiday"
+    account.currency = "EUR"
+    account.status = "ACTIVE"
+    account.created = None
+    account.updated = None
+
+    account.balance = Mock(spec=Amount)
+    account.balance.value = "500.00"
+    account.balance.currency = "EUR"
+    account.alias = []
+
+    return account
+
+
+@pytest.fixture
+def stand_in(tmp_path):
+    """Run a local Bunq API stand-in that answers 20% of requests with 429.
+
+    Serves three accounts of 45 payments each, with the SDK pointed at it.
+
+    Yields:
+        tuple[BunqStandIn, Path]: The server and an API context file for it.
+    """
+    with BunqStandIn(SyntheticHistory(accounts=3, payments_per_account=45), throttle_rate=0.2, seed=3) as server:
+        context_path = server.write_api_context(tmp_path / "bunq_api_context.conf")
+        with sdk_base_url(server.url):
+            yield server, context_path
+
+
+@pytest.fixture
+def fast_rate_limiter():
+    """Create a rate limiter with generous limits and near-instant backoff.
+
+    Returns:
+        BunqRateLimiter: Limiter suited to the local stand-in.
+    """
+    return BunqRateLimiter(limits={"GET": 1000}, window_seconds=1.0, backoff_seconds=0.001, max_retries=20)
@@ -3,8 +3,18 @@
 from datetime import datetime
 
 import pytest
-from src.budgetbuddy.banking.bunq.adapter import BunqPaymentAdapter
+from bunq.sdk.json import converter
+from bunq.sdk.model.generated.endpoint import PaymentApiObject
+from pydantic import ValidationError
+from src.budgetbuddy.banking.bunq.adapter import (
+    BunqMonetaryAccountAdapter,
+    BunqPaymentAdapter,
+    BunqRawPaymentAdapter,
+    payment_values,
+)
+from src.budgetbuddy.banking.bunq.stand_in import SyntheticHistory
 from src.budgetbuddy.banking.schemas.transaction import TransactionCreate
+from src.budgetbuddy.services.transaction_service import COPY_COLUMNS, _bulk_row
 
 
 @pytest.mark.unit
@@ -117,3 +127,76 @@ def test_bunq_adapter_handles_no_counterparty_info(mock_bunq_payment):
 
     assert result.counterparty_name is None
     assert result.counterparty_iban is None
+
+
+@pytest.mark.unit
+def test_monetary_account_adapter_converts_bank_account(mock_bunq_bank_account):
+    """Test adapter converts a Bunq bank account to MonetaryAccountCreate."""
+    result = BunqMonetaryAccountAdapter.to_monetary_account_create(mock_bunq_bank_account)
+
+    assert result.account_name == "Main account"
+    assert result.account_type == "checking"
+    assert result.currency == "EUR"
+    assert result.balance == 1234.56
+    assert result.iban == "NL12BUNQ0123456789"
+    assert result.bic == "BUNQNL2A"
+    assert result.account_status == "ACTIVE"
+    assert result.external_source == "bunq"
+    assert result.external_id == "bunq_100"
+    assert result.external_created_at == datetime(2024, 1, 1, 9, 0, 0)
+
+
+@pytest.mark.unit
+def test_monetary_account_adapter_converts_savings_account(mock_bunq_savings_account):
+    """Test adapter marks savings accounts and handles missing aliases."""
+    result = BunqMonetaryAccountAdapter.to_monetary_account_create(mock_bunq_savings_account)
+
+    assert result.account_type == "savings"
+    assert result.balance == 500.0
+    assert result.iban is None
+    assert result.bic is None
+    assert result.external_id == "bunq_200"
+
+
+@pytest.mark.unit
+def test_raw_adapter_matches_sdk_adapter_rows():
+    """Test the raw JSON fast path builds exactly the rows of the SDK adapter path."""
+    history = SyntheticHistory(accounts=1, payments_per_account=12)
+    account_id = history.account_ids()[0]
+    raw = [history.payment(account_id, i) for i in history.payment_ids(account_id)]
+    raw.append({"id": 77, "description": "", "created": "2025-10-01 12:00:00.000000"})
+
+    sdk_payments = [converter.deserialize(PaymentApiObject, payment) for payment in raw]
+    expected = [_bulk_row(t) for t in BunqPaymentAdapter.to_transaction_creates(sdk_payments)]
+
+    rows = BunqRawPaymentAdapter.to_transaction_rows(raw)
+
+    assert rows == expected
+    assert all(len(row) == len(COPY_COLUMNS) for row in rows)
+    assert rows[-1][COPY_COLUMNS.index("amount")] == 0.0
+    assert rows[-1][COPY_COLUMNS.index("description")] is None
+
+
+@pytest.mark.unit
+def test_live_and_replay_mapping_agree_on_stand_in_payloads():
+    """Test the SDK and raw adapters map every stand-in payload through the same fields."""
+    history = SyntheticHistory(accounts=3, payments_per_account=20)
+
+    for account_id in history.account_ids():
+        raw = [history.payment(account_id, i) for i in history.payment_ids(account_id)]
+        sdk_payments = [converter.deserialize(PaymentApiObject, payment) for payment in raw]
+
+        creates = BunqPaymentAdapter.to_transaction_creates(sdk_payments)
+
+        assert creates == [TransactionCreate(**payment_values(payment)) for payment in raw]
+        assert BunqRawPaymentAdapter.to_transaction_rows(raw) == [_bulk_row(t) for t in creates]
+        assert all(t.counterparty_name and t.counterparty_iban for t in creates)
+
+
+@pytest.mark.unit
+def test_raw_adapter_validates_batch():
+    """Test invalid payments are rejected like TransactionCreate would."""
+    payment = {"id": 1, "amount": {"value": "-3.00", "currency": "EURO"}}
+
+    with pytest.raises(ValidationError):
+        BunqRawPaymentAdapter.to_transaction_rows([payment])
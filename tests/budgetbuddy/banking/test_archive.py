@@ -0,0 +1,95 @@
+"""Tests for the raw Bunq payment archive and offline replay."""
+
+import gzip
+import json
+
+import pytest
+from sqlalchemy import delete, func, select
+from src.budgetbuddy.banking.bunq.archive import PaymentArchive
+from src.budgetbuddy.banking.bunq.fetch import BunqClient
+from src.budgetbuddy.banking.bunq.sync_service import BunqSyncService
+from src.db.schema.transaction import Transaction
+
+
+def _page_body(*payment_ids):
+    items = [{"Payment": {"id": i, "amount": {"value": "-1.50", "currency": "EUR"}}} for i in payment_ids]
+    return json.dumps({"Response": items}, indent=2).encode()
+
+
+@pytest.mark.unit
+class TestPaymentArchive:
+    """Tests for PaymentArchive."""
+
+    def test_round_trips_raw_pages_per_account(self, tmp_path):
+        archive = PaymentArchive(tmp_path)
+
+        archive.append(1, _page_body(12, 11), [12, 11])
+        archive.append(1, _page_body(10), [10])
+        archive.append(2, _page_body(20), [20])
+
+        pages = list(archive.iter_pages())
+
+        assert archive.account_ids() == [1, 2]
+        assert [(p.monetary_account_id, p.min_payment_id, p.max_payment_id) for p in pages] == [
+            (1, 11, 12),
+            (1, 10, 10),
+            (2, 20, 20),
+        ]
+        assert json.loads(pages[0].body) == json.loads(_page_body(12, 11))
+        assert [payment.id_ for payment in pages[0].payments()] == [12, 11]
+        assert pages[0].payments()[0].amount.value == "-1.50"
+
+    def test_appends_gzip_members_without_rewriting(self, tmp_path):
+        archive = PaymentArchive(tmp_path)
+        archive.append(1, _page_body(2), [2])
+        first_member = archive.path_for(1).read_bytes()
+
+        archive.append(1, _page_body(1), [1])
+
+        assert archive.path_for(1).read_bytes().startswith(first_member)
+        assert gzip.decompress(archive.path_for(1).read_bytes()).count(b"\n") == 4
+
+    def test_skips_empty_pages_and_filters_by_id_range(self, tmp_path):
+        archive = PaymentArchive(tmp_path)
+
+        assert archive.append(1, _page_body(), []) is False
+        archive.append(1, _page_body(30, 29), [30, 29])
+        archive.append(1, _page_body(5, 4), [5, 4])
+
+        assert [p.max_payment_id for p in archive.iter_pages([1], min_payment_id=10)] == [30]
+        assert list(archive.iter_pages([3])) == []
+
+
+@pytest.mark.unit
+def test_client_archives_every_fetched_page(stand_in, fast_rate_limiter, tmp_path):
+    """Test fetching with an archive stores each page's raw body."""
+    server, context_path = stand_in
+    archive = PaymentArchive(tmp_path / "archive")
+    client = BunqClient(context_path, rate_limiter=fast_rate_limiter, archive=archive)
+
+    pages = list(client.iter_all_payment_pages("ACTIVE", page_size=10))
+    archived = list(archive.iter_pages())
+
+    assert archive.account_ids() == list(server.history.account_ids())
+    assert len(archived) == len(pages)
+    assert sum(len(page.payments()) for page in archived) == server.history.total_payments
+
+
+@pytest.mark.integration
+def test_replay_rebuilds_transactions_without_api_calls(stand_in, fast_rate_limiter, tmp_path, db_session):
+    """Test replaying the archive restores deleted transactions offline."""
+    server, context_path = stand_in
+    archive = PaymentArchive(tmp_path / "archive")
+    BunqSyncService(context_path, rate_limiter=fast_rate_limiter, archive=archive).sync_all_payments(db_session)
+    db_session.execute(delete(Transaction))
+    db_session.commit()
+    api_calls = server.stats()["api_calls"]
+
+    stats = BunqSyncService.replay_archive(db_session, archive, batch_size=40)
+    rerun = BunqSyncService.replay_archive(db_session, archive)
+
+    assert stats["payments"] == stats["inserted"] == server.history.total_payments
+    assert rerun["skipped"] == server.history.total_payments
+    assert rerun["inserted"] == rerun["updated"] == 0
+    assert server.stats()["api_calls"] == api_calls
+    assert db_session.scalar(select(func.count()).select_from(Transaction)) == server.history.total_payments
@@ -4,14 +4,14 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
-from src.budgetbuddy.banking.bunq.fetch import BunqClient
+from src.budgetbuddy.banking.bunq.fetch import BunqClient, PaymentPage
 
 
 @pytest.mark.unit
 class TestBunqClientInitialization:
     """Tests for BunqClient initialization."""
 
-    @patch("src.budgetbuddy.banking.bunq.fetch.ApiContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
     @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
     def test_client_initialization_with_string_path(self, mock_bunq_ctx, mock_api_ctx):
         """Test client initializes with string path."""
@@ -23,7 +23,7 @@ class TestBunqClientInitialization:
         mock_api_ctx.restore.assert_called_once_with(config_path)
         mock_bunq_ctx.load_api_context.assert_called_once()
 
-    @patch("src.budgetbuddy.banking.bunq.fetch.ApiContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
     @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
     def test_client_initialization_with_path_object(self, mock_bunq_ctx, mock_api_ctx):
         """Test client initializes with Path object."""
@@ -40,7 +40,7 @@ class TestBunqClientListAccounts:
     """Tests for listing monetary accounts."""
 
     @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
-    @patch("src.budgetbuddy.banking.bunq.fetch.ApiContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
     @patch("src.budgetbuddy.banking.bunq.fetch.MonetaryAccountBankApiObject")
     @patch("src.budgetbuddy.banking.bunq.fetch.MonetaryAccountSavingsApiObject")
     def test_list_all_monetary_accounts(self, mock_savings, mock_bank, mock_api_ctx, mock_bunq_ctx):
@@ -66,7 +66,7 @@ class TestBunqClientListAccounts:
         assert savings_account in accounts
 
     @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
-    @patch("src.budgetbuddy.banking.bunq.fetch.ApiContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
     @patch("src.budgetbuddy.banking.bunq.fetch.MonetaryAccountBankApiObject")
     @patch("src.budgetbuddy.banking.bunq.fetch.MonetaryAccountSavingsApiObject")
     def test_list_accounts_with_status_filter(self, mock_savings, mock_bank, mock_api_ctx, mock_bunq_ctx):
@@ -96,7 +96,7 @@ class TestBunqClientFetchPayments:
     """Tests for fetching payments."""
 
     @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
-    @patch("src.budgetbuddy.banking.bunq.fetch.ApiContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
     @patch("src.budgetbuddy.banking.bunq.fetch.PaymentApiObject")
     @patch("src.budgetbuddy.banking.bunq.fetch.Pagination")
     def test_fetch_payments_for_account_single_page(
@@ -123,7 +123,7 @@ class TestBunqClientFetchPayments:
         assert payment2 in payments
 
     @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
-    @patch("src.budgetbuddy.banking.bunq.fetch.ApiContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
     @patch("src.budgetbuddy.banking.bunq.fetch.PaymentApiObject")
     @patch("src.budgetbuddy.banking.bunq.fetch.Pagination")
     def test_fetch_payments_multiple_pages(self, mock_pagination_cls, mock_payment, mock_api_ctx, mock_bunq_ctx):
@@ -156,7 +156,93 @@ class TestBunqClientFetchPayments:
         assert payment2 in payments
 
     @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
-    @patch("src.budgetbuddy.banking.bunq.fetch.ApiContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
+    @patch("src.budgetbuddy.banking.bunq.fetch.PaymentApiObject")
+    @patch("src.budgetbuddy.banking.bunq.fetch.Pagination")
+    def test_fetch_payments_stops_at_watermark(self, mock_pagination_cls, mock_payment, mock_api_ctx, mock_bunq_ctx):
+        """Test paging stops once a payment at or below the watermark is reached."""
+        # First page: only new payments
+        response1 = Mock()
+        response1.value = [Mock(id_=30), Mock(id_=29)]
+        pagination1 = Mock()
+        pagination1.has_previous_page.return_value = True
+        pagination1.url_params_previous_page = {"older_id": "29"}
+        response1.pagination = pagination1
+
+        # Second page: reaches the watermark, older pages must not be requested
+        response2 = Mock()
+        response2.value = [Mock(id_=28), Mock(id_=27), Mock(id_=26)]
+        pagination2 = Mock()
+        pagination2.has_previous_page.return_value = True
+        pagination2.url_params_previous_page = {"older_id": "26"}
+        response2.pagination = pagination2
+
+        mock_payment.list.side_effect = [response1, response2]
+        mock_pagination_cls.return_value = Mock(count=2, url_params_count_only={})
+
+        client = BunqClient("/path/to/config.conf")
+        payments = client.fetch_payments_for_account(123, page_size=2, since_id=27)
+
+        assert [p.id_ for p in payments] == [30, 29, 28]
+        assert mock_payment.list.call_count == 2
+
+    @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
+    @patch("src.budgetbuddy.banking.bunq.fetch.PaymentApiObject")
+    @patch("src.budgetbuddy.banking.bunq.fetch.Pagination")
+    def test_iter_payment_pages_is_lazy(self, mock_pagination_cls, mock_payment, mock_api_ctx, mock_bunq_ctx):
+        """Test the next page is only requested once the previous one is consumed."""
+        response1 = Mock(value=[Mock(id_=2)])
+        response1.pagination.has_previous_page.return_value = True
+        response1.pagination.url_params_previous_page = {"older_id": "2"}
+        response2 = Mock(value=[Mock(id_=1)])
+        response2.pagination.has_previous_page.return_value = False
+
+        mock_payment.list.side_effect = [response1, response2]
+        mock_pagination_cls.return_value = Mock(count=1, url_params_count_only={})
+
+        client = BunqClient("/path/to/config.conf")
+        pages = client.iter_payment_pages(123, page_size=1)
+
+        first = next(pages)
+        assert mock_payment.list.call_count == 1
+        assert [p.id_ for p in first.payments] == [2]
+        assert first.is_last is False
+
+        second = next(pages)
+        assert mock_payment.list.call_count == 2
+        assert second.is_last is True
+        assert next(pages, None) is None
+
+    @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
+    @patch("src.budgetbuddy.banking.bunq.fetch.PaymentApiObject")
+    @patch("src.budgetbuddy.banking.bunq.fetch.Pagination")
+    def test_iter_payment_pages_resumes_from_cursor(
+        self, mock_pagination_cls, mock_payment, mock_api_ctx, mock_bunq_ctx
+    ):
+        """Test paging starts at the page older than the given cursor and reports the next cursor."""
+        response1 = Mock(value=[Mock(id_=40), Mock(id_=39)])
+        response1.pagination.has_previous_page.return_value = True
+        response1.pagination.older_id = 39
+        response1.pagination.url_params_previous_page = {"older_id": "39"}
+        response2 = Mock(value=[Mock(id_=38)])
+        response2.pagination.has_previous_page.return_value = False
+
+        mock_payment.list.side_effect = [response1, response2]
+        pagination = Mock(url_params_previous_page={"count": "2", "older_id": "41"})
+        mock_pagination_cls.return_value = pagination
+
+        client = BunqClient("/path/to/config.conf")
+        pages = list(client.iter_payment_pages(123, page_size=2, older_id=41))
+
+        assert pagination.older_id == 41
+        first_call = mock_payment.list.call_args_list[0]
+        assert first_call.kwargs["params"] == {"count": "2", "older_id": "41"}
+        assert [page.older_id for page in pages] == [39, None]
+
+    @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
     @patch("src.budgetbuddy.banking.bunq.fetch.PaymentApiObject")
     def test_fetch_payments_api_failure(self, mock_payment, mock_api_ctx, mock_bunq_ctx):
         """Test handling of API failure when fetching payments."""
@@ -173,7 +259,7 @@ class TestBunqClientFetchAllPayments:
     """Tests for fetch_all_payments method."""
 
     @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
-    @patch("src.budgetbuddy.banking.bunq.fetch.ApiContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
     def test_fetch_all_payments_from_multiple_accounts(self, mock_api_ctx, mock_bunq_ctx):
         """Test fetching payments from all accounts."""
         client = BunqClient("/path/to/config.conf")
@@ -199,7 +285,7 @@ class TestBunqClientFetchAllPayments:
         assert client.fetch_payments_for_account.call_count == 2
 
     @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
-    @patch("src.budgetbuddy.banking.bunq.fetch.ApiContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
     def test_fetch_all_payments_skips_account_without_id(self, mock_api_ctx, mock_bunq_ctx):
         """Test that accounts without IDs are skipped."""
         client = BunqClient("/path/to/config.conf")
@@ -216,3 +302,94 @@ class TestBunqClientFetchAllPayments:
 
         assert len(all_payments) == 1
         assert client.fetch_payments_for_account.call_count == 1
+
+    @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
+    def test_fetch_payments_by_account_passes_watermarks(self, mock_api_ctx, mock_bunq_ctx):
+        """Test each account is fetched from its own watermark."""
+        client = BunqClient("/path/to/config.conf")
+
+        account1 = Mock()
+        account1.id_ = 1
+        account2 = Mock()
+        account2.id_ = 2
+
+        client.list_all_monetary_accounts = Mock(return_value=[account1, account2])
+        client.fetch_payments_for_account = Mock(side_effect=[[Mock()], []])
+
+        payments_by_account = client.fetch_payments_by_account(watermarks={1: 500})
+
+        assert set(payments_by_account) == {1, 2}
+        client.fetch_payments_for_account.assert_any_call(1, page_size=100, since_id=500)
+        client.fetch_payments_for_account.assert_any_call(2, page_size=100, since_id=None)
+
+    @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
+    def test_fetch_payments_by_account_concurrently(self, mock_api_ctx, mock_bunq_ctx):
+        """Test accounts are fetched on a worker pool and all results are collected."""
+        client = BunqClient("/path/to/config.conf")
+
+        accounts = [Mock(id_=acct_id) for acct_id in range(1, 6)]
+        client.list_all_monetary_accounts = Mock(return_value=accounts)
+        client.fetch_payments_for_account = Mock(side_effect=lambda acct_id, page_size, since_id: [Mock(id_=acct_id)])
+
+        payments_by_account = client.fetch_payments_by_account(max_workers=3)
+
+        assert set(payments_by_account) == {1, 2, 3, 4, 5}
+        assert all(result.payments[0].id_ == acct_id for acct_id, result in payments_by_account.items())
+        assert all(result.elapsed_seconds >= 0 for result in payments_by_account.values())
+        assert client.fetch_payments_for_account.call_count == 5
+
+    @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
+    def test_iter_all_payment_pages_sequential(self, mock_api_ctx, mock_bunq_ctx):
+        """Test pages of every account are streamed from each account's watermark."""
+        client = BunqClient("/path/to/config.conf")
+        client.list_all_monetary_accounts = Mock(return_value=[Mock(id_=1), Mock(id_=2)])
+        client.iter_payment_pages = Mock(
+            side_effect=lambda acct_id, page_size, since_id, older_id: iter([PaymentPage(acct_id, [Mock()], True)])
+        )
+
+        pages = list(client.iter_all_payment_pages(watermarks={1: 500}, resume_from={2: 77}))
+
+        assert [page.monetary_account_id for page in pages] == [1, 2]
+        client.iter_payment_pages.assert_any_call(1, page_size=100, since_id=500, older_id=None)
+        client.iter_payment_pages.assert_any_call(2, page_size=100, since_id=None, older_id=77)
+
+    @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
+    def test_iter_all_payment_pages_concurrently(self, mock_api_ctx, mock_bunq_ctx):
+        """Test concurrent streaming yields every page and keeps per-account order."""
+        client = BunqClient("/path/to/config.conf")
+        client.list_all_monetary_accounts = Mock(return_value=[Mock(id_=acct_id) for acct_id in range(1, 6)])
+
+        def pages_for(acct_id, page_size, since_id, older_id):
+            for n in range(3):
+                yield PaymentPage(acct_id, [Mock(id_=n)], is_last=n == 2)
+
+        client.iter_payment_pages = Mock(side_effect=pages_for)
+
+        pages = list(client.iter_all_payment_pages(max_workers=3))
+
+        assert len(pages) == 15
+        for acct_id in range(1, 6):
+            own = [page for page in pages if page.monetary_account_id == acct_id]
+            assert [page.payments[0].id_ for page in own] == [0, 1, 2]
+            assert own[-1].is_last
+
+    @patch("src.budgetbuddy.banking.bunq.fetch.BunqContext")
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
+    def test_iter_all_payment_pages_propagates_worker_errors(self, mock_api_ctx, mock_bunq_ctx):
+        """Test an error in a worker thread is raised to the consumer."""
+        client = BunqClient("/path/to/config.conf")
+        client.list_all_monetary_accounts = Mock(return_value=[Mock(id_=1), Mock(id_=2)])
+
+        def pages_for(acct_id, page_size, since_id, older_id):
+            if acct_id == 2:
+                raise RuntimeError("boom")
+            yield PaymentPage(acct_id, [], True)
+
+        client.iter_payment_pages = Mock(side_effect=pages_for)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            list(client.iter_all_payment_pages(max_workers=2))
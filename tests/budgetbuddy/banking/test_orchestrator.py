@@ -0,0 +1,81 @@
+"""Tests for the multi-context sync orchestrator."""
+
+import contextlib
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from src.budgetbuddy.banking.bunq import orchestrator
+from src.budgetbuddy.banking.bunq.orchestrator import ContextSyncResult, aggregate_results, sync_contexts
+
+
+@pytest.mark.unit
+class TestAggregateResults:
+    """Tests for aggregate_results."""
+
+    def test_sums_stats_and_collects_failures(self):
+        results = [
+            ContextSyncResult("a.conf", {"fetched": 3, "inserted": 2, "updated": 0, "skipped": 1}, accounts=2),
+            ContextSyncResult("b.conf", {"fetched": 5, "inserted": 5, "updated": 1, "skipped": 0}, accounts=1),
+            ContextSyncResult("c.conf", error="ConnectionError: down"),
+        ]
+
+        totals = aggregate_results(results)
+
+        assert totals["fetched"] == 8
+        assert totals["inserted"] == 7
+        assert totals["updated"] == 1
+        assert totals["skipped"] == 1
+        assert totals["accounts"] == 3
+        assert totals["failed"] == ["c.conf"]
+        assert set(totals["contexts"]) == {"a.conf", "b.conf", "c.conf"}
+
+    def test_no_contexts(self):
+        assert sync_contexts([])["fetched"] == 0
+
+
+@pytest.mark.unit
+class TestSyncContext:
+    """Tests for the worker-side sync of one context."""
+
+    @patch("src.budgetbuddy.banking.bunq.orchestrator.BunqSyncService")
+    def test_sync_context_uses_worker_session(self, mock_service_cls):
+        session = MagicMock()
+        mock_service = Mock()
+        mock_service.sync_monetary_accounts.return_value = {"accounts": 2}
+        mock_service.sync_all_payments.return_value = {"fetched": 4}
+        mock_service_cls.return_value = mock_service
+
+        with patch.object(orchestrator, "_worker_sessionmaker", Mock(return_value=session)):
+            result = orchestrator._sync_context("a.conf", {"max_workers": 2})
+
+        mock_service_cls.assert_called_once_with("a.conf")
+        mock_service.sync_all_payments.assert_called_once_with(session.__enter__.return_value, max_workers=2)
+        assert result.accounts == 2
+        assert result.stats == {"fetched": 4}
+        assert result.error is None
+
+    @patch("src.budgetbuddy.banking.bunq.orchestrator.BunqSyncService")
+    def test_sync_context_captures_errors(self, mock_service_cls):
+        mock_service_cls.side_effect = FileNotFoundError("a.conf")
+
+        with patch.object(orchestrator, "_worker_sessionmaker", MagicMock()):
+            result = orchestrator._sync_context("a.conf", {})
+
+        assert result.error == "FileNotFoundError: a.conf"
+        assert result.stats == {}
+
+    @patch("src.budgetbuddy.banking.bunq.orchestrator.BunqSyncService")
+    def test_sync_context_skips_locked_context(self, mock_service_cls):
+        with (
+            patch.object(orchestrator, "_worker_sessionmaker", MagicMock()),
+            patch.object(orchestrator, "try_advisory_lock", return_value=contextlib.nullcontext(False)) as lock,
+        ):
+            result = orchestrator._sync_context("a.conf", {})
+
+        assert lock.call_args.args[1] == "bunq-sync:a.conf"
+        mock_service_cls.assert_not_called()
+        assert result.error.startswith("locked")
+
+    def test_sync_context_requires_initialized_worker(self):
+        with pytest.raises(RuntimeError, match="worker not initialized"):
+            orchestrator._sync_context("a.conf", {})
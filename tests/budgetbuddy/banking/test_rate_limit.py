@@ -0,0 +1,119 @@
+"""Tests for the Bunq rate limiter."""
+
+from unittest.mock import Mock
+
+import pytest
+from bunq.sdk.exception.too_many_requests_exception import TooManyRequestsException
+from src.budgetbuddy.banking.bunq.rate_limit import (
+    BUNQ_RATE_LIMITS,
+    BUNQ_RATE_WINDOW_SECONDS,
+    BunqRateLimiter,
+    SlidingWindowLimiter,
+)
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.mark.unit
+class TestSlidingWindowLimiter:
+    """Tests for SlidingWindowLimiter."""
+
+    def test_burst_up_to_limit_without_waiting(self):
+        """Test an empty window allows `limit` acquisitions immediately."""
+        clock = FakeClock()
+        window = SlidingWindowLimiter(3, 3.0, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            window.acquire()
+
+        assert clock.sleeps == []
+
+    def test_waits_until_oldest_leaves_window(self):
+        """Test the next acquisition waits for the oldest one to expire."""
+        clock = FakeClock()
+        window = SlidingWindowLimiter(3, 3.0, clock=clock, sleep=clock.sleep)
+
+        window.acquire()
+        clock.now = 1.0
+        for _ in range(3):
+            window.acquire()
+
+        assert clock.now == pytest.approx(3.0)
+
+    def test_penalize_blocks_callers(self):
+        """Test penalize delays the next acquisition."""
+        clock = FakeClock()
+        window = SlidingWindowLimiter(3, 3.0, clock=clock, sleep=clock.sleep)
+
+        window.penalize(10.0)
+        window.acquire()
+
+        assert clock.now >= 10.0
+
+
+@pytest.mark.unit
+class TestBunqRateLimiter:
+    """Tests for BunqRateLimiter."""
+
+    def test_windows_are_shared_per_endpoint(self):
+        """Test the same endpoint and method share a window."""
+        limiter = BunqRateLimiter()
+
+        assert limiter.window("payment") is limiter.window("payment")
+        assert limiter.window("payment") is not limiter.window("monetary-account-bank")
+        assert limiter.window("payment", "POST").limit == 5
+
+    @pytest.mark.parametrize("method", ["GET", "POST", "PUT"])
+    def test_no_window_exceeds_bunq_limit(self, method):
+        """Test no 3-second window, wherever it starts, holds more calls than Bunq allows."""
+        clock = FakeClock()
+        limiter = BunqRateLimiter(clock=clock, sleep=clock.sleep)
+        calls = []
+
+        for _ in range(40):
+            limiter.call("payment", lambda: calls.append(clock.now), method=method)
+            clock.now += 0.25  # callers ask faster than the limit allows
+
+        limit = BUNQ_RATE_LIMITS[method]
+        for start in calls:
+            in_window = [t for t in calls if start <= t < start + BUNQ_RATE_WINDOW_SECONDS]
+            assert len(in_window) <= limit
+        # ...while still using the full allowance
+        assert len([t for t in calls if t < BUNQ_RATE_WINDOW_SECONDS]) == limit
+
+    def test_call_retries_after_429(self):
+        """Test a 429 is retried after backing off."""
+        clock = FakeClock()
+        limiter = BunqRateLimiter(clock=clock, sleep=clock.sleep, backoff_seconds=1.0)
+        func = Mock(side_effect=[TooManyRequestsException("slow down", 429, "id"), "ok"])
+
+        result = limiter.call("payment", func, 1, params={"count": "10"})
+
+        assert result == "ok"
+        assert func.call_count == 2
+        func.assert_called_with(1, params={"count": "10"})
+        assert clock.now >= 1.0
+
+    def test_call_gives_up_after_max_retries(self):
+        """Test the 429 is raised once retries are exhausted."""
+        clock = FakeClock()
+        limiter = BunqRateLimiter(clock=clock, sleep=clock.sleep, max_retries=2, backoff_seconds=0.1)
+        func = Mock(side_effect=TooManyRequestsException("slow down", 429, "id"))
+
+        with pytest.raises(TooManyRequestsException):
+            limiter.call("payment", func)
+
+        assert func.call_count == 3
@@ -0,0 +1,137 @@
+"""Tests for the Bunq sync scheduler and its advisory locks."""
+
+import asyncio
+import contextlib
+import datetime
+
+import pytest
+from sqlalchemy import func, select
+from src.budgetbuddy.banking.bunq.jobs import run_sync_job
+from src.budgetbuddy.banking.bunq.scheduler import (
+    LOCK_PREFIX,
+    BunqSyncScheduler,
+    ContextSchedule,
+    ScheduleConfig,
+    poll_interval,
+)
+from src.db.locks import advisory_lock_key, try_advisory_lock
+from src.db.schema.transaction import Transaction
+
+NOW = datetime.datetime(2025, 6, 1, 12, 0, tzinfo=datetime.UTC)
+
+
+@pytest.mark.unit
+class TestSchedule:
+    """Tests for the interval and due-time bookkeeping."""
+
+    def test_recent_activity_polls_more_often(self):
+        config = ScheduleConfig(hot_interval=60, dormant_interval=3600, hot_window=datetime.timedelta(days=2))
+
+        assert poll_interval(NOW - datetime.timedelta(hours=5), NOW, config) == 60
+        assert poll_interval(NOW - datetime.timedelta(days=30), NOW, config) == 3600
+        assert poll_interval(None, NOW, config) == 3600
+
+    def test_new_accounts_are_due_and_closed_ones_dropped(self):
+        schedule = ContextSchedule("a.conf", next_accounts_at=500.0, next_poll_at={1: 300.0, 2: 900.0})
+
+        schedule.set_accounts([2, 3], now=100.0)
+
+        assert schedule.next_poll_at == {2: 900.0, 3: 100.0}
+        assert schedule.due_account_ids(now=100.0) == [3]
+        assert schedule.next_due() == 100.0
+
+        schedule.postpone(600.0)
+        assert schedule.next_poll_at == {2: 900.0, 3: 600.0}
+        assert schedule.next_accounts_at == 600.0
+
+    def test_lock_keys_are_stable_signed_64_bit(self):
+        key = advisory_lock_key("bunq-sync:a.conf")
+
+        assert key == advisory_lock_key("bunq-sync:a.conf")
+        assert key != advisory_lock_key("bunq-sync:b.conf")
+        assert -(2**63) <= key < 2**63
+
+
+@pytest.fixture
+def scheduler_for(test_engine, db_session, fast_rate_limiter):
+    """Build a jitter-free scheduler that writes through the test session."""
+
+    def build(*config_paths):
+        return BunqSyncScheduler(
+            config_paths,
+            engine=test_engine,
+            session_factory=lambda: contextlib.nullcontext(db_session),
+            config=ScheduleConfig(jitter=0.0, hot_interval=60, dormant_interval=3600, account_interval=7200),
+            rate_limiter=fast_rate_limiter,
+            max_workers=2,
+        )
+
+    return build
+
+
+@pytest.mark.integration
+def test_run_once_syncs_due_accounts_only(stand_in, scheduler_for, db_session):
+    """Test the first run syncs everything and schedules dormant accounts for later."""
+    server, context_path = stand_in
+    scheduler = scheduler_for(context_path)
+    schedule = scheduler.schedules[0]
+
+    first = scheduler.run_once(schedule, now=0.0)
+    api_calls = server.stats()["api_calls"]
+    idle = scheduler.run_once(schedule, now=10.0)
+
+    assert first["accounts"]["accounts"] == 3
+    assert first["payments"]["inserted"] == server.history.total_payments
+    # The stand-in's history ended long ago, so every account is dormant
+    assert schedule.next_poll_at == dict.fromkeys(server.history.account_ids(), 3600.0)
+    assert schedule.next_accounts_at == 7200.0
+    assert idle == {"accounts": None, "payments": None}
+    assert server.stats()["api_calls"] == api_calls
+    assert db_session.scalar(select(func.count()).select_from(Transaction)) == server.history.total_payments
+
+
+@pytest.mark.integration
+def test_context_locked_by_another_replica_is_skipped(stand_in, scheduler_for, test_engine):
+    """Test a replica backs off while another one holds the context's lock."""
+    server, context_path = stand_in
+    scheduler = scheduler_for(context_path)
+    schedule = scheduler.schedules[0]
+
+    with test_engine.connect() as other_replica, try_advisory_lock(other_replica, schedule.lock_name) as held:
+        assert held
+        assert scheduler.run_once(schedule, now=0.0) is None
+
+    assert server.stats()["api_calls"] == 0
+    assert schedule.next_accounts_at == scheduler.config.retry_interval
+    assert scheduler.run_once(schedule, now=schedule.next_accounts_at) is not None
+
+
+@pytest.mark.integration
+def test_sync_job_skips_context_locked_by_scheduler(stand_in, test_engine, db_session, monkeypatch):
+    """Test a queued sync job does not run next to a scheduler syncing the same context."""
+    server, context_path = stand_in
+    monkeypatch.setenv("BUNQ_CONFIG_PATH", str(context_path))
+
+    with test_engine.connect() as scheduler_conn, try_advisory_lock(scheduler_conn, f"{LOCK_PREFIX}{context_path}"):
+        assert run_sync_job(db_session, {}) == {"locked": True}
+
+    assert server.stats()["api_calls"] == 0
+
+
+@pytest.mark.unit
+def test_run_loop_stops_on_event():
+    """Test the loop runs due contexts and exits once stopped."""
+    scheduler = BunqSyncScheduler(["a.conf", "b.conf"], engine=object(), session_factory=object, clock=lambda: 0.0)
+    synced = []
+    stop = asyncio.Event()
+
+    def fake_run_once(schedule):
+        synced.append(schedule.config_path)
+        schedule.next_accounts_at = float("inf")
+        if len(synced) == 2:
+            stop.set()
+
+    scheduler.run_once = fake_run_once
+    asyncio.run(scheduler.run(stop))
+
+    assert sorted(synced) == ["a.conf", "b.conf"]
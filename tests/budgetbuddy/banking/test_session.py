@@ -0,0 +1,92 @@
+"""Tests for Bunq session reuse and refresh."""
+
+import datetime
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+from src.budgetbuddy.banking.bunq.session import BunqSessionManager, atomic_write_text
+
+NOW = datetime.datetime(2025, 10, 1, 12, 0, 0)
+
+
+def _api_context(expires_in_seconds, payload='{"session": 1}'):
+    api_context = Mock()
+    api_context.session_context.expiry_time = NOW + datetime.timedelta(seconds=expires_in_seconds)
+    api_context.to_json.return_value = payload
+
+    def reset_session():
+        api_context.to_json.return_value = '{"session": 2}'
+        api_context.session_context.expiry_time = NOW + datetime.timedelta(hours=1)
+
+    api_context.reset_session.side_effect = reset_session
+    return api_context
+
+
+@pytest.mark.unit
+class TestBunqSessionManager:
+    """Tests for BunqSessionManager."""
+
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
+    def test_live_session_is_reused_without_handshake(self, mock_api_ctx, tmp_path):
+        """Test a session far from expiry is used as-is and not rewritten."""
+        config_path = tmp_path / "bunq.conf"
+        config_path.write_text('{"session": 1}')
+        api_context = _api_context(expires_in_seconds=3600)
+        mock_api_ctx.restore.return_value = api_context
+
+        manager = BunqSessionManager(config_path, clock=lambda: NOW)
+
+        assert manager.load() is api_context
+        assert manager.load() is api_context
+        mock_api_ctx.restore.assert_called_once_with(str(config_path))
+        api_context.reset_session.assert_not_called()
+        assert config_path.read_text() == '{"session": 1}'
+
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
+    def test_session_refreshed_ahead_of_expiry_and_saved(self, mock_api_ctx, tmp_path):
+        """Test a session expiring within the window is renegotiated and persisted."""
+        config_path = tmp_path / "bunq.conf"
+        config_path.write_text('{"session": 1}')
+        mock_api_ctx.restore.return_value = _api_context(expires_in_seconds=60)
+
+        manager = BunqSessionManager(config_path, refresh_ahead_seconds=300, clock=lambda: NOW)
+        api_context = manager.load()
+
+        api_context.reset_session.assert_called_once()
+        assert config_path.read_text() == '{"session": 2}'
+        assert manager.save_if_changed() is False
+
+    @patch("src.budgetbuddy.banking.bunq.session.ApiContext")
+    def test_context_manager_persists_sdk_reset(self, mock_api_ctx, tmp_path):
+        """Test a session reset by the SDK during use is saved on exit."""
+        config_path = tmp_path / "bunq.conf"
+        config_path.write_text('{"session": 1}')
+        mock_api_ctx.restore.return_value = _api_context(expires_in_seconds=3600)
+
+        with BunqSessionManager(config_path, clock=lambda: NOW) as api_context:
+            api_context.to_json.return_value = '{"session": 3}'
+
+        assert config_path.read_text() == '{"session": 3}'
+
+    def test_missing_session_needs_refresh(self, tmp_path):
+        """Test a context without a session is refreshed."""
+        manager = BunqSessionManager(tmp_path / "bunq.conf")
+        manager.api_context = Mock(session_context=None)
+
+        assert manager.seconds_until_expiry() is None
+        assert manager.needs_refresh() is True
+
+
+@pytest.mark.unit
+def test_atomic_write_keeps_permissions_and_leaves_no_temp_files(tmp_path):
+    """Test atomic writes replace the file in place with its original mode."""
+    path = tmp_path / "bunq.conf"
+    path.write_text("old")
+    os.chmod(path, 0o600)
+
+    atomic_write_text(path, "new")
+
+    assert path.read_text() == "new"
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert os.listdir(tmp_path) == ["bunq.conf"]
@@ -0,0 +1,81 @@
+"""End-to-end tests of the Bunq client and sync against the local API stand-in."""
+
+import pytest
+from sqlalchemy import func, select
+from src.budgetbuddy.banking.bunq.fetch import BunqClient
+from src.budgetbuddy.banking.bunq.stand_in import FIRST_ACCOUNT_ID, SyntheticHistory
+from src.budgetbuddy.banking.bunq.sync_service import BunqSyncService
+from src.db.schema.transaction import Transaction
+
+
+@pytest.mark.unit
+class TestSyntheticHistory:
+    """Tests for the generated payment pages."""
+
+    def test_pages_walk_history_newest_first(self):
+        history = SyntheticHistory(accounts=2, payments_per_account=5)
+        account_id = FIRST_ACCOUNT_ID + 1
+        ids = history.payment_ids(account_id)
+
+        first, older_id = history.payment_page(account_id, count=3, older_id=None)
+        second, last_older_id = history.payment_page(account_id, count=3, older_id=older_id)
+
+        assert first == [ids[4], ids[3], ids[2]]
+        assert second == [ids[1], ids[0]]
+        assert older_id == ids[2]
+        assert last_older_id is None
+
+    def test_payment_ids_do_not_overlap_between_accounts(self):
+        history = SyntheticHistory(accounts=3, payments_per_account=10)
+        all_ids = [i for account_id in history.account_ids() for i in history.payment_ids(account_id)]
+
+        assert len(set(all_ids)) == history.total_payments
+
+
+@pytest.mark.unit
+def test_client_pages_all_payments_through_throttling(stand_in, fast_rate_limiter):
+    """Test the real SDK pages every payment, retrying injected 429s."""
+    server, context_path = stand_in
+    client = BunqClient(context_path, rate_limiter=fast_rate_limiter)
+
+    accounts = client.list_all_monetary_accounts("ACTIVE")
+    pages = list(client.iter_all_payment_pages("ACTIVE", page_size=10, max_workers=2))
+
+    assert sorted(account.id_ for account in accounts) == list(server.history.account_ids())
+    assert sum(len(page.payments) for page in pages) == server.history.total_payments
+    assert server.stats()["throttled"] > 0
+
+
+@pytest.mark.unit
+def test_register_payment_callbacks_keeps_existing_filters(stand_in, fast_rate_limiter):
+    """Test callback registration adds one filter per account and is idempotent."""
+    server, context_path = stand_in
+    client = BunqClient(context_path, rate_limiter=fast_rate_limiter)
+    account_id = server.history.account_ids()[0]
+    existing = {"category": "PAYMENT", "notification_target": "https://other.example/hook"}
+    server.set_notification_filters(account_id, [existing])
+
+    first = client.register_payment_callbacks("https://budgetbuddy.example/banking/bunq/callback")
+    second = client.register_payment_callbacks("https://budgetbuddy.example/banking/bunq/callback")
+
+    assert first == dict.fromkeys(server.history.account_ids(), True)
+    assert second == dict.fromkeys(server.history.account_ids(), False)
+    assert client.list_notification_filters(account_id) == [
+        existing,
+        {"category": "MUTATION", "notification_target": "https://budgetbuddy.example/banking/bunq/callback"},
+    ]
+
+
+@pytest.mark.integration
+def test_full_sync_against_stand_in(stand_in, fast_rate_limiter, db_session):
+    """Test a full sync stores every stand-in payment and a rerun fetches nothing."""
+    server, context_path = stand_in
+    service = BunqSyncService(context_path, rate_limiter=fast_rate_limiter)
+
+    assert service.sync_monetary_accounts(db_session)["accounts"] == 3
+    first = service.sync_all_payments(db_session, max_workers=3)
+    second = service.sync_all_payments(db_session, max_workers=3)
+
+    assert first["fetched"] == first["inserted"] == server.history.total_payments
+    assert second["fetched"] == 0
+    assert db_session.scalar(select(func.count()).select_from(Transaction)) == server.history.total_payments
@@ -0,0 +1,181 @@
+"""Tests for the bank statement parsers and importer."""
+
+import io
+
+import pytest
+from sqlalchemy import func, select
+from src.budgetbuddy.banking.statements.base import CREDIT, DEBIT, StatementParseError
+from src.budgetbuddy.banking.statements.camt import parse_camt053
+from src.budgetbuddy.banking.statements.csv_statement import CsvLayout, parse_csv
+from src.budgetbuddy.banking.statements.importer import import_statement, sniff_format
+from src.budgetbuddy.banking.statements.mt940 import parse_mt940, parse_structured_information
+from src.db.schema.transaction import Transaction
+
+CAMT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Document xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.02">
+  <BkToCstmrStmt>
+    <Stmt>
+      <Id>STMT-1</Id>
+      <Acct><Id><IBAN>NL91ABNA0417164300</IBAN></Id></Acct>
+      <Ntry>
+        <Amt Ccy="EUR">12.50</Amt>
+        <CdtDbtInd>DBIT</CdtDbtInd>
+        <Sts>BOOK</Sts>
+        <BookgDt><Dt>2024-03-01</Dt></BookgDt>
+        <AcctSvcrRef>REF-1</AcctSvcrRef>
+        <NtryDtls><TxDtls>
+          <RltdPties>
+            <Cdtr><Nm>Coffee Shop</Nm></Cdtr>
+            <CdtrAcct><Id><IBAN>NL02RABO0123456789</IBAN></Id></CdtrAcct>
+          </RltdPties>
+          <RmtInf><Ustrd>Coffee</Ustrd></RmtInf>
+        </TxDtls></NtryDtls>
+      </Ntry>
+      <Ntry>
+        <Amt Ccy="EUR">99.00</Amt>
+        <CdtDbtInd>CRDT</CdtDbtInd>
+        <Sts>PDNG</Sts>
+        <BookgDt><Dt>2024-03-02</Dt></BookgDt>
+      </Ntry>
+      <Ntry>
+        <Amt Ccy="EUR">30.00</Amt>
+        <CdtDbtInd>CRDT</CdtDbtInd>
+        <Sts>BOOK</Sts>
+        <BookgDt><Dt>2024-03-02</Dt></BookgDt>
+        <AcctSvcrRef>BATCH-1</AcctSvcrRef>
+        <NtryDtls>
+          <TxDtls>
+            <AmtDtls><TxAmt><Amt Ccy="EUR">10.00</Amt></TxAmt></AmtDtls>
+            <RltdPties><Dbtr><Nm>Alice</Nm></Dbtr></RltdPties>
+          </TxDtls>
+          <TxDtls>
+            <AmtDtls><TxAmt><Amt Ccy="EUR">20.00</Amt></TxAmt></AmtDtls>
+            <RltdPties><Dbtr><Nm>Bob</Nm></Dbtr></RltdPties>
+          </TxDtls>
+        </NtryDtls>
+      </Ntry>
+    </Stmt>
+  </BkToCstmrStmt>
+</Document>
+"""
+
+MT940 = b"""{1:F01INGBNL2AXXXX0000000000}{4:
+:20:INGEB
+:25:NL20INGB0001234567
+:28C:1
+:60F:C240301EUR1000,00
+:61:2403010301D12,50NTRFNONREF//BANKREF1
+:86:/TRTP/SEPA OVERBOEKING/IBAN/NL02RABO0123456789/BIC/RABONL2U/NAME/
+Coffee Shop/REMI/USTD//Coffee/
+:61:240302C100,00NTRFNONREF
+:86:Salary March
+:62F:C240302EUR1087,50
+-}
+"""
+
+CSV = (
+    b"date;amount;description;counterparty_name\n"
+    b"01-03-2024;-4,50;Coffee;Coffee Shop\n"
+    b"01-03-2024;-4,50;Coffee;Coffee Shop\n"
+    b"02-03-2024;1.250,00;Salary;Employer\n"
+)
+CSV_LAYOUT = CsvLayout(delimiter=";", decimal_comma=True, date_format="%d-%m-%Y", currency=None)
+
+
+@pytest.mark.unit
+class TestStatementParsers:
+    """Tests for the CAMT.053, MT940 and CSV parsers."""
+
+    def test_camt053_maps_booked_entries_and_splits_batches(self):
+        entries = list(parse_camt053(io.BytesIO(CAMT)))
+
+        assert [(e.amount, e.transaction_type) for e in entries] == [(12.5, DEBIT), (10.0, CREDIT), (20.0, CREDIT)]
+        coffee = entries[0]
+        assert coffee.counterparty_name == "Coffee Shop"
+        assert coffee.counterparty_iban == "NL02RABO0123456789"
+        assert coffee.description == "Coffee"
+        assert coffee.external_source == "camt053"
+        assert coffee.external_created_at.isoformat() == "2024-03-01T00:00:00+00:00"
+        assert [e.counterparty_name for e in entries[1:]] == ["Alice", "Bob"]
+        assert len({e.external_id for e in entries}) == 3
+
+    def test_camt053_rejects_malformed_xml(self):
+        with pytest.raises(StatementParseError):
+            list(parse_camt053(io.BytesIO(CAMT[:600])))
+
+    def test_mt940_maps_statement_lines(self):
+        entries = list(parse_mt940(io.BytesIO(MT940)))
+
+        assert [(e.amount, e.currency, e.transaction_type) for e in entries] == [
+            (12.5, "EUR", DEBIT),
+            (100.0, "EUR", CREDIT),
+        ]
+        assert entries[0].counterparty_name == "Coffee Shop"
+        assert entries[0].counterparty_iban == "NL02RABO0123456789"
+        assert entries[0].description == "Coffee"
+        assert entries[1].description == "Salary March"
+
+    def test_parse_structured_information(self):
+        assert parse_structured_information("/NAME/Jane Doe/REMI/Invoice 12/") == {
+            "NAME": "Jane Doe",
+            "REMI": "Invoice 12",
+        }
+        assert parse_structured_information("Card payment") == {}
+
+    def test_csv_gives_identical_rows_distinct_stable_ids(self):
+        """Test identical same-day rows get distinct IDs that survive a re-parse."""
+        first = list(parse_csv(io.BytesIO(CSV), account="NL91ABNA0417164300", layout=CSV_LAYOUT))
+        second = list(parse_csv(io.BytesIO(CSV), account="NL91ABNA0417164300", layout=CSV_LAYOUT))
+        other_account = list(parse_csv(io.BytesIO(CSV), account="NL20INGB0001234567", layout=CSV_LAYOUT))
+
+        assert [(e.amount, e.currency, e.transaction_type) for e in first] == [
+            (4.5, "EUR", DEBIT),
+            (4.5, "EUR", DEBIT),
+            (1250.0, "EUR", CREDIT),
+        ]
+        assert len({e.external_id for e in first}) == 3
+        assert [e.external_id for e in first] == [e.external_id for e in second]
+        assert not {e.external_id for e in first} & {e.external_id for e in other_account}
+
+    def test_csv_unordered_identical_rows_get_distinct_ids(self):
+        """Test identical rows of one day stay apart when another day sits between them."""
+        unordered = (
+            b"date;amount;description;counterparty_name\n"
+            b"01-03-2024;-4,50;Coffee;Coffee Shop\n"
+            b"02-03-2024;1.250,00;Salary;Employer\n"
+            b"01-03-2024;-4,50;Coffee;Coffee Shop\n"
+        )
+
+        entries = list(parse_csv(io.BytesIO(unordered), account="NL91ABNA0417164300", layout=CSV_LAYOUT))
+
+        assert len({e.external_id for e in entries}) == 3
+
+    def test_csv_rejects_invalid_values(self):
+        with pytest.raises(StatementParseError, match="Line 2"):
+            list(parse_csv(io.BytesIO(b"date,amount\nyesterday,1.00\n")))
+
+    @pytest.mark.parametrize(
+        ("head", "expected"),
+        [(CAMT, "camt053"), (MT940, "mt940"), (b":20:STMT\r\n:25:NL", "mt940"), (CSV, "csv")],
+    )
+    def test_sniff_format(self, head, expected):
+        assert sniff_format(head[:512]) == expected
+
+
+@pytest.mark.integration
+class TestImportStatement:
+    """Tests for importing statements into the database."""
+
+    def test_reimport_is_idempotent(self, db_session):
+        """Test importing the same file twice only inserts once."""
+        first = import_statement(db_session, io.BytesIO(MT940), batch_size=1)
+        second = import_statement(db_session, io.BytesIO(MT940), batch_size=1)
+
+        assert (first["format"], first["entries"], first["inserted"], first["batches"]) == ("mt940", 2, 2, 2)
+        assert (second["inserted"], second["updated"], second["unchanged"]) == (0, 0, 2)
+        count = db_session.scalar(select(func.count()).where(Transaction.external_source == "mt940"))
+        assert count == 2
+
+    def test_rejects_non_positive_batch_size(self, db_session):
+        with pytest.raises(ValueError, match="batch_size"):
+            import_statement(db_session, io.BytesIO(CSV), batch_size=0)
@@ -3,6 +3,8 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from bunq.sdk.model.generated.endpoint import PaymentApiObject
+from src.budgetbuddy.banking.bunq.fetch import PaymentPage
 from src.budgetbuddy.banking.bunq.sync_service import BunqSyncService
 from src.budgetbuddy.banking.schemas.transaction import TransactionCreate
 
@@ -18,7 +20,7 @@ class TestBunqSyncService:
 
         service = BunqSyncService(config_path)
 
-        mock_client_cls.assert_called_once_with(config_path)
+        mock_client_cls.assert_called_once_with(config_path, rate_limiter=None, archive=None)
         assert service.client is not None
 
     @patch("src.budgetbuddy.banking.bunq.sync_service.BunqClient")
@@ -27,12 +29,12 @@ class TestBunqSyncService:
     def test_sync_all_payments_success(self, mock_bulk_create, mock_adapter, mock_client_cls, db_session):
         """Test successful sync of all payments."""
         # Setup mocks
-        mock_payment1 = Mock()
-        mock_payment2 = Mock()
+        mock_payment1 = Mock(id_=1)
+        mock_payment2 = Mock(id_=2)
         mock_payments = [mock_payment1, mock_payment2]
 
         mock_client = Mock()
-        mock_client.fetch_all_payments.return_value = mock_payments
+        mock_client.iter_all_payment_pages.return_value = [PaymentPage(100, mock_payments, True)]
         mock_client_cls.return_value = mock_client
 
         transaction1 = TransactionCreate(
@@ -54,15 +56,88 @@ class TestBunqSyncService:
         assert stats["inserted"] == 2
         assert stats["skipped"] == 0
 
-        mock_client.fetch_all_payments.assert_called_once_with(ma_status_filter="ACTIVE")
+        mock_client.iter_all_payment_pages.assert_called_once_with(
+            ma_status_filter="ACTIVE", watermarks={}, max_workers=1, resume_from={}, account_ids=None
+        )
         mock_adapter.to_transaction_creates.assert_called_once_with(mock_payments)
         mock_bulk_create.assert_called_once()
 
+    @patch("src.budgetbuddy.banking.bunq.sync_service.BunqClient")
+    @patch("src.budgetbuddy.banking.bunq.sync_service.create_transactions_bulk")
+    def test_sync_reports_per_account_stats(self, mock_bulk_create, mock_client_cls, db_session):
+        """Test stats include counts and fetch timing for every account."""
+        mock_client = Mock()
+        mock_client.iter_all_payment_pages.return_value = [
+            PaymentPage(100, [Mock(id_=1, created=None)], True, elapsed_seconds=0.5),
+            PaymentPage(200, [], True, elapsed_seconds=0.25),
+        ]
+        mock_client_cls.return_value = mock_client
+        mock_bulk_create.return_value = (1, 0)
+
+        service = BunqSyncService("/path/to/config.conf")
+        with patch("src.budgetbuddy.banking.bunq.sync_service.BunqPaymentAdapter") as mock_adapter:
+            mock_adapter.to_transaction_creates.return_value = [
+                TransactionCreate(amount=1.0, currency="EUR", external_source="bunq", external_id="bunq_1")
+            ]
+            stats = service.sync_all_payments(db_session, max_workers=4)
+
+        mock_client.iter_all_payment_pages.assert_called_once_with(
+            ma_status_filter="ACTIVE", watermarks={}, max_workers=4, resume_from={}, account_ids=None
+        )
+        assert stats["accounts"][100] == {"fetched": 1, "inserted": 1, "updated": 0, "skipped": 0, "fetch_seconds": 0.5}
+        assert stats["accounts"][200] == {
+            "fetched": 0,
+            "inserted": 0,
+            "updated": 0,
+            "skipped": 0,
+            "fetch_seconds": 0.25,
+        }
+        assert stats["elapsed_seconds"] >= 0
+
+    @patch("src.budgetbuddy.banking.bunq.sync_service.BunqClient")
+    @patch("src.budgetbuddy.banking.bunq.sync_service.BunqPaymentAdapter")
+    @patch("src.budgetbuddy.banking.bunq.sync_service.create_transactions_bulk")
+    def test_sync_loads_each_page_separately(self, mock_bulk_create, mock_adapter, mock_client_cls, db_session):
+        """Test every page is transformed and loaded on its own and stats are summed."""
+        page1 = [Mock(id_=3), Mock(id_=2)]
+        page2 = [Mock(id_=1)]
+        mock_client = Mock()
+        mock_client.iter_all_payment_pages.return_value = [
+            PaymentPage(100, page1, False, elapsed_seconds=0.5),
+            PaymentPage(100, page2, True, elapsed_seconds=0.25),
+        ]
+        mock_client_cls.return_value = mock_client
+        mock_adapter.to_transaction_creates.side_effect = lambda payments: [
+            TransactionCreate(amount=1.0, currency="EUR", external_source="bunq", external_id=f"bunq_{p.id_}")
+            for p in payments
+        ]
+        mock_bulk_create.side_effect = [(2, 0), (0, 1)]
+
+        service = BunqSyncService("/path/to/config.conf")
+        with patch("src.budgetbuddy.banking.bunq.sync_service.advance_watermark") as mock_advance:
+            stats = service.sync_all_payments(db_session)
+
+        assert mock_adapter.to_transaction_creates.call_args_list[0].args == (page1,)
+        assert mock_adapter.to_transaction_creates.call_args_list[1].args == (page2,)
+        assert mock_bulk_create.call_count == 2
+        assert stats["fetched"] == 3
+        assert stats["inserted"] == 2
+        assert stats["skipped"] == 1
+        assert stats["accounts"][100] == {
+            "fetched": 3,
+            "inserted": 2,
+            "updated": 0,
+            "skipped": 1,
+            "fetch_seconds": 0.75,
+        }
+        # Watermark is written once, after the last page, with the newest payment
+        mock_advance.assert_called_once_with(db_session, "bunq", 100, 3, None)
+
     @patch("src.budgetbuddy.banking.bunq.sync_service.BunqClient")
     def test_sync_all_payments_no_payments(self, mock_client_cls, db_session):
         """Test sync when no payments are fetched."""
         mock_client = Mock()
-        mock_client.fetch_all_payments.return_value = []
+        mock_client.iter_all_payment_pages.return_value = [PaymentPage(100, [], True)]
         mock_client_cls.return_value = mock_client
 
         service = BunqSyncService("/path/to/config.conf")
@@ -78,9 +153,9 @@ class TestBunqSyncService:
     def test_sync_with_duplicates(self, mock_bulk_create, mock_adapter, mock_client_cls, db_session):
         """Test sync handles duplicates correctly."""
         # Setup
-        mock_payment = Mock()
+        mock_payment = Mock(id_=1)
         mock_client = Mock()
-        mock_client.fetch_all_payments.return_value = [mock_payment]
+        mock_client.iter_all_payment_pages.return_value = [PaymentPage(100, [mock_payment], True)]
         mock_client_cls.return_value = mock_client
 
         transaction = TransactionCreate(
@@ -106,13 +181,15 @@ class TestBunqSyncService:
     def test_sync_custom_account_filter(self, mock_bulk_create, mock_adapter, mock_client_cls, db_session):
         """Test sync respects custom account status filter."""
         mock_client = Mock()
-        mock_client.fetch_all_payments.return_value = []
+        mock_client.iter_all_payment_pages.return_value = []
         mock_client_cls.return_value = mock_client
 
         service = BunqSyncService("/path/to/config.conf")
         service.sync_all_payments(db_session, account_status_filter="ALL")
 
-        mock_client.fetch_all_payments.assert_called_once_with(ma_status_filter="ALL")
+        mock_client.iter_all_payment_pages.assert_called_once_with(
+            ma_status_filter="ALL", watermarks={}, max_workers=1, resume_from={}, account_ids=None
+        )
 
 
 @pytest.mark.integration
@@ -126,7 +203,7 @@ class TestBunqSyncServiceEndToEnd:
 
         # Setup mock client
         mock_client = Mock()
-        mock_client.fetch_all_payments.return_value = mock_bunq_payments
+        mock_client.iter_all_payment_pages.return_value = [PaymentPage(100, mock_bunq_payments, True)]
         mock_client_cls.return_value = mock_client
 
         # Execute sync
@@ -151,7 +228,7 @@ class TestBunqSyncServiceEndToEnd:
         from src.db.schema.transaction import Transaction
 
         mock_client = Mock()
-        mock_client.fetch_all_payments.return_value = mock_bunq_payments
+        mock_client.iter_all_payment_pages.return_value = [PaymentPage(100, mock_bunq_payments, True)]
         mock_client_cls.return_value = mock_client
 
         service = BunqSyncService("/path/to/config.conf")
@@ -168,3 +245,132 @@ class TestBunqSyncServiceEndToEnd:
         # Verify only 2 transactions exist
         transactions = db_session.query(Transaction).filter(Transaction.external_source == "bunq").all()
         assert len(transactions) == 2
+
+    @patch("src.budgetbuddy.banking.bunq.sync_service.BunqClient")
+    def test_sync_advances_watermark_per_account(self, mock_client_cls, db_session, mock_bunq_payments):
+        """Test sync stores the newest payment per account and uses it on the next run."""
+        from src.budgetbuddy.services.sync_watermark_service import get_watermarks
+
+        mock_client = Mock()
+        mock_client.iter_all_payment_pages.return_value = [PaymentPage(100, mock_bunq_payments, True)]
+        mock_client_cls.return_value = mock_client
+
+        service = BunqSyncService("/path/to/config.conf")
+        service.sync_all_payments(db_session)
+
+        watermarks = get_watermarks(db_session, "bunq")
+        assert watermarks[100].last_payment_id == 67890
+
+        # Second run passes the stored watermark to the client
+        mock_client.iter_all_payment_pages.return_value = [PaymentPage(100, [], True)]
+        service.sync_all_payments(db_session)
+
+        mock_client.iter_all_payment_pages.assert_called_with(
+            ma_status_filter="ACTIVE", watermarks={100: 67890}, max_workers=1, resume_from={}, account_ids=None
+        )
+
+    @patch("src.budgetbuddy.banking.bunq.sync_service.BunqClient")
+    def test_full_resync_ignores_watermarks(self, mock_client_cls, db_session, mock_bunq_payments):
+        """Test full_resync walks the full history regardless of stored watermarks."""
+        mock_client = Mock()
+        mock_client.iter_all_payment_pages.return_value = [PaymentPage(100, mock_bunq_payments, True)]
+        mock_client_cls.return_value = mock_client
+
+        service = BunqSyncService("/path/to/config.conf")
+        service.sync_all_payments(db_session)
+        service.sync_all_payments(db_session, full_resync=True)
+
+        mock_client.iter_all_payment_pages.assert_called_with(
+            ma_status_filter="ACTIVE", watermarks={}, max_workers=1, resume_from={}, account_ids=None
+        )
+
+    @patch("src.budgetbuddy.banking.bunq.sync_service.BunqClient")
+    def test_upsert_resync_updates_changed_payments(self, mock_client_cls, db_session, mock_bunq_payments):
+        """Test an upsert re-sync updates amended payments and leaves the rest alone."""
+        from src.db.schema.transaction import Transaction
+
+        mock_client = Mock()
+        mock_client.iter_all_payment_pages.return_value = [PaymentPage(100, mock_bunq_payments, True)]
+        mock_client_cls.return_value = mock_client
+
+        service = BunqSyncService("/path/to/config.conf")
+        service.sync_all_payments(db_session, load_mode="upsert")
+
+        mock_bunq_payments[0].description = "Amended description"
+        stats = service.sync_all_payments(db_session, full_resync=True, load_mode="upsert")
+
+        assert stats["inserted"] == 0
+        assert stats["updated"] == 1
+        assert stats["skipped"] == 1
+
+        tx = db_session.query(Transaction).filter(Transaction.external_id == "bunq_12345").one()
+        assert tx.description == "Amended description"
+
+    @patch("src.budgetbuddy.banking.bunq.sync_service.BunqClient")
+    def test_sync_monetary_accounts(
+        self, mock_client_cls, db_session, mock_bunq_bank_account, mock_bunq_savings_account
+    ):
+        """Test accounts are upserted and snapshotted on every run."""
+        from src.db.schema.monetary_account_balance import MonetaryAccountBalance
+        from src.db.schema.monetaryaccount import MonetaryAccount
+
+        mock_client = Mock()
+        mock_client.list_all_monetary_accounts.return_value = [mock_bunq_bank_account, mock_bunq_savings_account]
+        mock_client_cls.return_value = mock_client
+
+        service = BunqSyncService("/path/to/config.conf")
+        stats = service.sync_monetary_accounts(db_session)
+        service.sync_monetary_accounts(db_session)
+
+        assert stats["accounts"] == 2
+        assert db_session.query(MonetaryAccount).count() == 2
+        assert db_session.query(MonetaryAccountBalance).count() == 4
+
+    @patch("src.budgetbuddy.banking.bunq.sync_service.BunqClient")
+    def test_interrupted_sync_resumes_from_checkpoint(self, mock_client_cls, db_session):
+        """Test a pass that dies partway resumes at the next page and completes the watermark."""
+        from src.budgetbuddy.services.sync_watermark_service import get_watermarks
+
+        def payment(payment_id):
+            return Mock(
+                spec=PaymentApiObject,
+                id_=payment_id,
+                amount=None,
+                description=f"Payment {payment_id}",
+                type_=None,
+                counterparty_alias=None,
+                created=None,
+                updated=None,
+            )
+
+        def interrupted_pass(**kwargs):
+            yield PaymentPage(100, [payment(30), payment(29)], False, older_id=29)
+            raise ConnectionError("network dropped")
+
+        mock_client = Mock()
+        mock_client.iter_all_payment_pages.side_effect = interrupted_pass
+        mock_client_cls.return_value = mock_client
+
+        service = BunqSyncService("/path/to/config.conf")
+        with pytest.raises(ConnectionError):
+            service.sync_all_payments(db_session)
+
+        watermark = get_watermarks(db_session, "bunq")[100]
+        assert watermark.last_payment_id is None
+        assert watermark.resume_older_id == 29
+        assert watermark.pending_payment_id == 30
+
+        # Restart: continues at the page older than 29 and completes the pass
+        mock_client.iter_all_payment_pages.side_effect = None
+        mock_client.iter_all_payment_pages.return_value = [PaymentPage(100, [payment(28)], True)]
+        stats = service.sync_all_payments(db_session)
+
+        mock_client.iter_all_payment_pages.assert_called_with(
+            ma_status_filter="ACTIVE", watermarks={}, max_workers=1, resume_from={100: 29}, account_ids=None
+        )
+        assert stats["inserted"] == 1
+
+        db_session.expire_all()
+        watermark = get_watermarks(db_session, "bunq")[100]
+        assert watermark.last_payment_id == 30
+        assert watermark.resume_older_id is None
@@ -0,0 +1,134 @@
+"""Tests for the job queue service and worker."""
+
+import contextlib
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.orm import sessionmaker
+from src.budgetbuddy.services.job_service import claim_job, complete_job, enqueue_job, fail_job, get_job
+from src.budgetbuddy.services.job_worker import JobWorker
+from src.db.schema.job import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, Job
+
+
+@pytest.mark.integration
+class TestJobQueue:
+    """Tests for enqueuing, claiming and settling jobs."""
+
+    def test_claims_highest_priority_due_job(self, db_session):
+        """Test jobs are claimed by priority and delayed jobs wait."""
+        low = enqueue_job(db_session, "test.job", {"n": 1})
+        high = enqueue_job(db_session, "test.job", {"n": 2}, priority=5)
+        enqueue_job(db_session, "test.job", {"n": 3}, priority=9, delay_seconds=3600)
+
+        first = claim_job(db_session, "w1", lease_seconds=60)
+        second = claim_job(db_session, "w1", lease_seconds=60)
+
+        assert (first.itemid, second.itemid) == (high.itemid, low.itemid)
+        assert first.status == JOB_RUNNING
+        assert first.attempts == 1
+        assert first.locked_by == "w1"
+        assert claim_job(db_session, "w1", lease_seconds=60) is None
+
+    def test_claims_only_handled_kinds(self, db_session):
+        enqueue_job(db_session, "other.job")
+
+        assert claim_job(db_session, "w1", lease_seconds=60, kinds=["test.job"]) is None
+        assert claim_job(db_session, "w1", lease_seconds=60, kinds=["other.job"]).kind == "other.job"
+
+    def test_failed_attempts_retry_until_exhausted(self, db_session):
+        """Test failures requeue the job and the last attempt marks it failed."""
+        job = enqueue_job(db_session, "test.job", max_attempts=2)
+
+        claimed = claim_job(db_session, "w1", lease_seconds=60)
+        assert fail_job(db_session, claimed.itemid, "w1", "boom", retry_delay_seconds=0)
+        db_session.refresh(job)
+        assert (job.status, job.last_error) == (JOB_QUEUED, "boom")
+
+        claimed = claim_job(db_session, "w1", lease_seconds=60)
+        assert claimed.attempts == 2
+        fail_job(db_session, claimed.itemid, "w1", "boom again", retry_delay_seconds=0)
+        db_session.refresh(job)
+        assert job.status == JOB_FAILED
+        assert job.finished_at is not None
+        assert claim_job(db_session, "w1", lease_seconds=60) is None
+
+    def test_expired_lease_is_reclaimed_by_another_worker(self, db_session):
+        """Test a job whose worker died is picked up again, and the old worker loses it."""
+        job = enqueue_job(db_session, "test.job", max_attempts=2)
+        # A negative lease is already expired within the test transaction
+        claim_job(db_session, "dead-worker", lease_seconds=-1)
+
+        reclaimed = claim_job(db_session, "w2", lease_seconds=-1)
+
+        assert reclaimed.itemid == job.itemid
+        assert (reclaimed.locked_by, reclaimed.attempts) == ("w2", 2)
+        assert complete_job(db_session, job.itemid, "dead-worker", {"ok": True}) is False
+
+        # The second lease expires on the final attempt
+        assert claim_job(db_session, "w3", lease_seconds=60) is None
+        db_session.refresh(job)
+        assert job.status == JOB_FAILED
+
+    def test_concurrent_claims_skip_locked_jobs(self, test_engine):
+        """Test a worker skips a job another worker is claiming instead of waiting."""
+        Session = sessionmaker(bind=test_engine, expire_on_commit=False)
+        with Session() as setup:
+            jobs = [enqueue_job(setup, "test.skip-locked") for _ in range(2)]
+
+        try:
+            with Session() as first, Session() as second:
+                # Hold the row lock of the first claim open
+                first.execute(delete(Job).where(Job.itemid == jobs[0].itemid).returning(Job.itemid))
+                claimed = claim_job(second, "w2", lease_seconds=60, kinds=["test.skip-locked"])
+                first.rollback()
+
+            assert claimed.itemid == jobs[1].itemid
+        finally:
+            with Session() as cleanup:
+                cleanup.execute(delete(Job).where(Job.kind == "test.skip-locked"))
+                cleanup.commit()
+
+
+@pytest.mark.integration
+class TestJobWorker:
+    """Tests for JobWorker."""
+
+    @pytest.fixture
+    def worker_for(self, db_session):
+        def build(handlers):
+            return JobWorker(handlers, session_factory=lambda: contextlib.nullcontext(db_session), retry_base_seconds=0)
+
+        return build
+
+    def test_runs_handlers_and_stores_results(self, db_session, worker_for):
+        job = enqueue_job(db_session, "test.add", {"a": 2, "b": 3})
+        worker = worker_for({"test.add": lambda db, payload: {"sum": payload["a"] + payload["b"]}})
+
+        assert worker.run(max_jobs=1) == 1
+
+        db_session.refresh(job)
+        assert job.status == JOB_SUCCEEDED
+        assert job.result == {"sum": 5}
+        assert get_job(db_session, job.itemid).locked_by is None
+
+    def test_retries_failing_handlers(self, db_session, worker_for):
+        calls = []
+
+        def flaky(db, payload):
+            calls.append(payload)
+            if len(calls) < 2:
+                raise ConnectionError("Bunq unreachable")
+            return {"ok": True}
+
+        job = enqueue_job(db_session, "test.flaky")
+        worker = worker_for({"test.flaky": flaky})
+
+        worker.run_next()
+        db_session.refresh(job)
+        assert (job.status, job.last_error) == (JOB_QUEUED, "ConnectionError: Bunq unreachable")
+
+        worker.run_next()
+        db_session.refresh(job)
+        assert job.status == JOB_SUCCEEDED
+        assert job.attempts == 2
+        assert worker.run_next() is None
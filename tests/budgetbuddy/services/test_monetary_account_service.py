@@ -0,0 +1,80 @@
+"""Tests for monetary account service."""
+
+import pytest
+from src.budgetbuddy.banking.schemas.monetaryaccount import MonetaryAccountCreate
+from src.budgetbuddy.services.monetary_account_service import (
+    list_balance_snapshots,
+    list_monetary_accounts,
+    upsert_monetary_accounts,
+)
+from src.db.schema.monetary_account_balance import MonetaryAccountBalance
+from src.db.schema.monetaryaccount import MonetaryAccount
+
+
+def _account(external_id, balance, name="Main", iban=None):
+    return MonetaryAccountCreate(
+        account_name=name,
+        account_type="checking",
+        currency="EUR",
+        balance=balance,
+        iban=iban,
+        account_status="ACTIVE",
+        external_source="bunq",
+        external_id=external_id,
+    )
+
+
+@pytest.mark.integration
+class TestUpsertMonetaryAccounts:
+    """Tests for upsert_monetary_accounts function."""
+
+    def test_upsert_inserts_accounts_and_snapshots(self, db_session):
+        """Test new accounts are inserted with one balance snapshot each."""
+        synced = upsert_monetary_accounts(
+            db_session, [_account("bunq_1", 100.0, iban="NL01BUNQ0000000001"), _account("bunq_2", 50.0, "Savings")]
+        )
+
+        assert synced == 2
+        assert db_session.query(MonetaryAccount).count() == 2
+        assert db_session.query(MonetaryAccountBalance).count() == 2
+
+    def test_upsert_updates_existing_and_appends_snapshot(self, db_session):
+        """Test a re-sync updates the account in place and adds a new snapshot."""
+        upsert_monetary_accounts(db_session, [_account("bunq_1", 100.0)])
+        account = db_session.query(MonetaryAccount).one()
+        account.notes = "kept"
+        db_session.commit()
+
+        upsert_monetary_accounts(db_session, [_account("bunq_1", 75.0, name="Renamed")])
+
+        db_session.expire_all()
+        account = db_session.query(MonetaryAccount).one()
+        assert account.balance == 75.0
+        assert account.account_name == "Renamed"
+        assert account.notes == "kept"
+
+        snapshots = list_balance_snapshots(db_session, account.itemid)
+        assert sorted(s.balance for s in snapshots) == [75.0, 100.0]
+
+    def test_upsert_empty_list(self, db_session):
+        """Test upserting nothing writes nothing."""
+        assert upsert_monetary_accounts(db_session, []) == 0
+
+    def test_list_monetary_accounts_filters_by_source(self, db_session):
+        """Test listing accounts by external source."""
+        upsert_monetary_accounts(db_session, [_account("bunq_1", 1.0, "B"), _account("bunq_2", 2.0, "A")])
+        db_session.add(MonetaryAccount(account_name="Cash", currency="EUR", balance=0.0, external_source="manual"))
+        db_session.commit()
+
+        accounts = list_monetary_accounts(db_session, external_source="bunq")
+
+        assert [a.account_name for a in accounts] == ["A", "B"]
+
+    def test_list_balance_snapshots_rejects_inverted_range(self, db_session):
+        """Test start after end is rejected."""
+        from datetime import UTC, datetime
+
+        with pytest.raises(ValueError):
+            list_balance_snapshots(
+                db_session, None, start=datetime(2025, 1, 2, tzinfo=UTC), end=datetime(2025, 1, 1, tzinfo=UTC)
+            )
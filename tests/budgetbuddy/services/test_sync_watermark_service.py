@@ -0,0 +1,65 @@
+"""Tests for sync watermark service."""
+
+from datetime import UTC, datetime
+
+import pytest
+from src.budgetbuddy.services.sync_watermark_service import advance_watermark, get_watermarks, save_checkpoint
+
+
+@pytest.mark.integration
+class TestSyncWatermarks:
+    """Tests for reading and advancing watermarks."""
+
+    def test_get_watermarks_empty(self, db_session):
+        """Test no watermarks are returned for an unsynced source."""
+        assert get_watermarks(db_session, "bunq") == {}
+
+    def test_advance_creates_and_moves_forward(self, db_session):
+        """Test advancing creates a watermark and moves it to newer payments."""
+        created_at = datetime(2025, 10, 1, 12, 0, tzinfo=UTC)
+        advance_watermark(db_session, "bunq", 1, 100, created_at)
+        advance_watermark(db_session, "bunq", 1, 150)
+
+        watermarks = get_watermarks(db_session, "bunq")
+
+        assert watermarks[1].last_payment_id == 150
+
+    def test_advance_never_moves_backwards(self, db_session):
+        """Test an older payment does not overwrite a newer watermark."""
+        advance_watermark(db_session, "bunq", 1, 150)
+        advance_watermark(db_session, "bunq", 1, 100)
+
+        db_session.expire_all()
+        watermarks = get_watermarks(db_session, "bunq")
+
+        assert watermarks[1].last_payment_id == 150
+
+    def test_watermarks_are_scoped_per_source(self, db_session):
+        """Test watermarks of other sources are not returned."""
+        advance_watermark(db_session, "bunq", 1, 100)
+        advance_watermark(db_session, "other", 1, 999)
+
+        assert get_watermarks(db_session, "bunq")[1].last_payment_id == 100
+
+    def test_checkpoint_before_first_watermark(self, db_session):
+        """Test a checkpoint can be stored before any pass has completed."""
+        save_checkpoint(db_session, "bunq", 1, resume_older_id=80, pending_payment_id=120)
+
+        watermark = get_watermarks(db_session, "bunq")[1]
+
+        assert watermark.last_payment_id is None
+        assert watermark.resume_older_id == 80
+        assert watermark.pending_payment_id == 120
+
+    def test_advance_clears_checkpoint(self, db_session):
+        """Test completing a pass clears the checkpoint and keeps the newest watermark."""
+        advance_watermark(db_session, "bunq", 1, 150)
+        save_checkpoint(db_session, "bunq", 1, resume_older_id=40, pending_payment_id=200)
+        advance_watermark(db_session, "bunq", 1, 200)
+
+        db_session.expire_all()
+        watermark = get_watermarks(db_session, "bunq")[1]
+
+        assert watermark.last_payment_id == 200
+        assert watermark.resume_older_id is None
+        assert watermark.pending_payment_id is None
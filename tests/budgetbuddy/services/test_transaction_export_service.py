@@ -0,0 +1,87 @@
+"""Tests for the Parquet / Arrow transaction export."""
+
+import io
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from src.budgetbuddy.services.transaction_export_service import (
+    arrow_export_query,
+    export_transactions_arrow,
+    iter_record_batches,
+)
+from src.budgetbuddy.services.transaction_service import repo
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+START = datetime(2032, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture()
+def transactions(db_session):
+    return [
+        repo.create(
+            db_session,
+            {
+                "amount": amount,
+                "currency": currency,
+                "description": f"payment {i}",
+                "category": "groceries" if i % 2 else None,
+                "createdtimestamp": datetime(2032, 1, 1 + i, tzinfo=UTC),
+            },
+        )
+        for i, (amount, currency) in enumerate(
+            [(12.5, "EUR"), (0.1, "EUR"), (99.999, "USD"), (3.0, "EUR"), (1.0, "GBP")]
+        )
+    ]
+
+
+@pytest.mark.integration
+class TestArrowExport:
+    """Tests for exporting transactions as Parquet files and Arrow streams."""
+
+    def test_parquet_keeps_types(self, db_session, transactions):
+        destination = io.BytesIO()
+
+        rows = export_transactions_arrow(
+            db_session, destination, "parquet", arrow_export_query(start=START), batch_size=2
+        )
+
+        parquet = pq.ParquetFile(io.BytesIO(destination.getvalue()))
+        table = parquet.read()
+        assert rows == 5
+        assert parquet.metadata.num_row_groups == 3
+        assert table.schema.field("amount").type == pa.decimal128(18, 2)
+        assert table.schema.field("createdtimestamp").type == pa.timestamp("us", tz="UTC")
+        assert pa.types.is_dictionary(table.schema.field("currency").type)
+        assert table.column("amount").to_pylist() == [
+            Decimal("12.50"),
+            Decimal("0.10"),
+            Decimal("100.00"),
+            Decimal("3.00"),
+            Decimal("1.00"),
+        ]
+        assert table.column("currency").to_pylist() == ["EUR", "EUR", "USD", "EUR", "GBP"]
+        assert table.column("itemid").to_pylist() == [str(tx.itemid) for tx in transactions]
+        assert table.column("category").to_pylist() == [None, "groceries", None, "groceries", None]
+
+    def test_arrow_stream_round_trip(self, db_session, transactions):
+        destination = io.BytesIO()
+
+        export_transactions_arrow(
+            db_session, destination, "arrow", arrow_export_query(start=START, descending=True), batch_size=4
+        )
+
+        table = pa.ipc.open_stream(destination.getvalue()).read_all()
+        assert table.column("description").to_pylist() == [f"payment {i}" for i in range(4, -1, -1)]
+        assert table.column("createdtimestamp").to_pylist()[0] == datetime(2032, 1, 5, tzinfo=UTC)
+
+    def test_batches_follow_batch_size(self, db_session, transactions):
+        batches = list(iter_record_batches(db_session, arrow_export_query(start=START), batch_size=2))
+
+        assert [batch.num_rows for batch in batches] == [2, 2, 1]
+
+    def test_rejects_unknown_format(self, db_session):
+        with pytest.raises(ValueError, match="format"):
+            export_transactions_arrow(db_session, io.BytesIO(), "feather")
@@ -1,20 +1,55 @@
 """Enhanced tests for transaction service with new functionality."""
 
+import csv
+import io
 from datetime import UTC, datetime
+from typing import Annotated, get_args
+from uuid import uuid4
 
 import pytest
-from src.budgetbuddy.banking.schemas.transaction import TransactionCreate, TransactionUpdate
+from src.budgetbuddy.banking.schemas.transaction import (
+    TransactionBulkUpdate,
+    TransactionCreate,
+    TransactionFilters,
+    TransactionUpdate,
+)
 from src.budgetbuddy.services.transaction_service import (
+    COPY_COLUMNS,
+    EXPORT_COLUMNS,
+    TransactionRow,
     create_transaction,
     create_transactions_bulk,
+    create_transactions_bulk_results,
+    delete_transactions_bulk,
+    export_transactions_csv,
     get_transaction_by_external_id,
     list_transactions,
+    list_transactions_page,
+    max_bulk_batch_size,
     repo,
+    transaction_export_query,
     update_transaction,
+    update_transactions_bulk,
+    upsert_transactions_bulk,
 )
 from src.db.schema.transaction import Transaction
 
 
+@pytest.mark.unit
+def test_transaction_row_matches_transaction_create():
+    """Test TransactionRow has TransactionCreate's field types in COPY_COLUMNS order."""
+    fields = TransactionCreate.model_fields
+    expected = [
+        Annotated[(fields[name].annotation, *fields[name].metadata)]
+        if fields[name].metadata
+        else fields[name].annotation
+        for name in COPY_COLUMNS[:-1]
+    ]
+
+    assert COPY_COLUMNS[-1] == "content_hash"
+    assert list(get_args(TransactionRow)) == [*expected, str]
+
+
 @pytest.mark.integration
 class TestCreateTransaction:
     """Tests for create_transaction function."""
@@ -178,6 +213,257 @@ class TestBulkCreateTransactions:
         assert skipped == 0
         assert elapsed < 1.0  # Should complete in under 1 second
 
+    def test_bulk_create_in_batches(self, db_session):
+        """Test rows are inserted across several chunks with accurate counts."""
+        initial = [
+            TransactionCreate(amount=1.0, currency="EUR", external_source="bunq", external_id=f"bunq_chunk_{i}")
+            for i in range(0, 10, 2)
+        ]
+        create_transactions_bulk(db_session, initial)
+
+        transactions = [
+            TransactionCreate(amount=1.0, currency="EUR", external_source="bunq", external_id=f"bunq_chunk_{i}")
+            for i in range(10)
+        ]
+        inserted, skipped = create_transactions_bulk(db_session, transactions, batch_size=3)
+
+        assert inserted == 5
+        assert skipped == 5
+        assert db_session.query(Transaction).filter(Transaction.external_id.like("bunq_chunk_%")).count() == 10
+
+    def test_bulk_create_commit_per_batch(self, db_session):
+        """Test committing after every chunk inserts all rows."""
+        transactions = [
+            TransactionCreate(amount=1.0, currency="EUR", external_source="bunq", external_id=f"bunq_commit_{i}")
+            for i in range(7)
+        ]
+
+        inserted, skipped = create_transactions_bulk(db_session, transactions, batch_size=2, commit_per_batch=True)
+
+        assert inserted == 7
+        assert skipped == 0
+
+    def test_bulk_create_beyond_bind_parameter_limit(self, db_session):
+        """Test a run larger than one statement can carry is split automatically."""
+        count = max_bulk_batch_size() + 10
+        transactions = [
+            TransactionCreate(amount=1.0, currency="EUR", external_source="bunq", external_id=f"bunq_big_{i}")
+            for i in range(count)
+        ]
+
+        inserted, skipped = create_transactions_bulk(db_session, transactions, batch_size=100_000)
+
+        assert inserted == count
+        assert skipped == 0
+
+    def test_bulk_create_copy_mode(self, db_session):
+        """Test COPY mode loads new rows and skips existing external IDs."""
+        created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        create_transactions_bulk(
+            db_session,
+            [TransactionCreate(amount=1.0, currency="EUR", external_source="bunq", external_id="bunq_copy_0")],
+        )
+
+        transactions = [
+            TransactionCreate(
+                amount=float(i) + 0.5,
+                currency="EUR",
+                description=f'Copy "{i}", quoted' if i else "",
+                counterparty_name=None,
+                external_source="bunq",
+                external_id=f"bunq_copy_{i}",
+                external_created_at=created_at,
+            )
+            for i in range(5)
+        ]
+
+        inserted, skipped = create_transactions_bulk(db_session, transactions, mode="copy")
+
+        assert inserted == 4
+        assert skipped == 1
+
+        tx = get_transaction_by_external_id(db_session, "bunq", "bunq_copy_3")
+        assert tx.amount == 3.5
+        assert tx.description == 'Copy "3", quoted'
+        assert tx.counterparty_name is None
+        assert tx.external_created_at == created_at
+        assert tx.itemid is not None
+
+    def test_bulk_create_rejects_unknown_mode(self, db_session):
+        """Test an unknown bulk insert mode is rejected."""
+        with pytest.raises(ValueError, match="mode"):
+            create_transactions_bulk(db_session, [], mode="merge")
+
+    def test_bulk_create_rejects_invalid_batch_size(self, db_session):
+        """Test a non-positive batch size is rejected."""
+        with pytest.raises(ValueError, match="batch_size"):
+            create_transactions_bulk(db_session, [], batch_size=0)
+
+
+@pytest.mark.integration
+class TestUpsertTransactionsBulk:
+    """Tests for upsert_transactions_bulk function."""
+
+    @staticmethod
+    def _ctid(db_session, external_id):
+        from sqlalchemy import text
+
+        return db_session.execute(
+            text("SELECT ctid FROM budgetbuddy.transactions WHERE external_id = :external_id"),
+            {"external_id": external_id},
+        ).scalar_one()
+
+    @staticmethod
+    def _tx(external_id, description="Payment", updated_at=None, **kwargs):
+        return TransactionCreate(
+            amount=10.0,
+            currency="EUR",
+            description=description,
+            external_source="bunq",
+            external_id=external_id,
+            external_updated_at=updated_at,
+            **kwargs,
+        )
+
+    def test_upsert_inserts_new_rows(self, db_session):
+        """Test upsert inserts rows that do not exist yet."""
+        inserted, updated, unchanged = upsert_transactions_bulk(
+            db_session, [self._tx("bunq_up_1"), self._tx("bunq_up_2")]
+        )
+
+        assert (inserted, updated, unchanged) == (2, 0, 0)
+        assert get_transaction_by_external_id(db_session, "bunq", "bunq_up_1").content_hash is not None
+
+    def test_upsert_skips_unchanged_rows_without_writing(self, db_session):
+        """Test identical records leave the stored row version untouched."""
+        upsert_transactions_bulk(db_session, [self._tx("bunq_up_same")])
+        ctid_before = self._ctid(db_session, "bunq_up_same")
+
+        inserted, updated, unchanged = upsert_transactions_bulk(db_session, [self._tx("bunq_up_same")])
+
+        assert (inserted, updated, unchanged) == (0, 0, 1)
+        assert self._ctid(db_session, "bunq_up_same") == ctid_before
+
+    def test_upsert_updates_changed_rows(self, db_session):
+        """Test a changed record is updated while user fields are kept."""
+        upsert_transactions_bulk(db_session, [self._tx("bunq_up_change")])
+        tx = get_transaction_by_external_id(db_session, "bunq", "bunq_up_change")
+        update_transaction(db_session, tx.itemid, TransactionUpdate(category="groceries"))
+
+        inserted, updated, unchanged = upsert_transactions_bulk(
+            db_session, [self._tx("bunq_up_change", description="Amended"), self._tx("bunq_up_new")]
+        )
+
+        assert (inserted, updated, unchanged) == (1, 1, 0)
+        db_session.expire_all()
+        tx = get_transaction_by_external_id(db_session, "bunq", "bunq_up_change")
+        assert tx.description == "Amended"
+        assert tx.category == "groceries"
+
+    def test_upsert_ignores_older_records(self, db_session):
+        """Test a record older than the stored one does not overwrite it."""
+        newer = datetime(2024, 2, 1, tzinfo=UTC)
+        older = datetime(2024, 1, 1, tzinfo=UTC)
+        upsert_transactions_bulk(db_session, [self._tx("bunq_up_old", "Current", newer)])
+
+        inserted, updated, unchanged = upsert_transactions_bulk(db_session, [self._tx("bunq_up_old", "Stale", older)])
+
+        assert (inserted, updated, unchanged) == (0, 0, 1)
+        db_session.expire_all()
+        assert get_transaction_by_external_id(db_session, "bunq", "bunq_up_old").description == "Current"
+
+    def test_upsert_deduplicates_within_batch(self, db_session):
+        """Test repeated external IDs in one call keep the last record."""
+        inserted, updated, unchanged = upsert_transactions_bulk(
+            db_session, [self._tx("bunq_up_dup", "First"), self._tx("bunq_up_dup", "Second")]
+        )
+
+        assert (inserted, updated, unchanged) == (1, 0, 1)
+        assert get_transaction_by_external_id(db_session, "bunq", "bunq_up_dup").description == "Second"
+
+    def test_bulk_insert_stores_content_hash(self, db_session):
+        """Test rows loaded by create_transactions_bulk are recognised as unchanged."""
+        create_transactions_bulk(db_session, [self._tx("bunq_up_ins")])
+        create_transactions_bulk(db_session, [self._tx("bunq_up_copy")], mode="copy")
+
+        inserted, updated, unchanged = upsert_transactions_bulk(
+            db_session, [self._tx("bunq_up_ins"), self._tx("bunq_up_copy")]
+        )
+
+        assert (inserted, updated, unchanged) == (0, 0, 2)
+
+
+@pytest.mark.integration
+class TestDuplicateFlagging:
+    """Tests for cross-source duplicate detection by fingerprint."""
+
+    @staticmethod
+    def _tx(source, external_id, iban="NL02RABO0123456789", amount=12.5, hour=10):
+        return TransactionCreate(
+            amount=amount,
+            currency="EUR",
+            counterparty_iban=iban,
+            external_source=source,
+            external_id=external_id,
+            external_created_at=datetime(2024, 3, 1, hour, tzinfo=UTC),
+        )
+
+    def test_fingerprint_normalizes_iban_and_day(self, db_session):
+        create_transactions_bulk(
+            db_session,
+            [
+                self._tx("bunq", "fp_1"),
+                self._tx("bunq", "fp_2", iban="nl02 rabo 0123 4567 89", amount=12.500001, hour=23),
+                self._tx("bunq", "fp_3", amount=12.51),
+            ],
+        )
+
+        fingerprints = [
+            get_transaction_by_external_id(db_session, "bunq", external_id).fingerprint
+            for external_id in ("fp_1", "fp_2", "fp_3")
+        ]
+        assert fingerprints[0] == fingerprints[1] != fingerprints[2]
+
+    def test_rows_without_iban_are_not_flagged(self, db_session):
+        """Test equal amount and day alone do not make a duplicate."""
+        create_transactions_bulk(db_session, [self._tx("bunq", "no_iban_bunq", iban=None)])
+        create_transactions_bulk(db_session, [self._tx("camt053", "no_iban_camt", iban=None)])
+
+        flagged = get_transaction_by_external_id(db_session, "camt053", "no_iban_camt")
+        assert flagged.fingerprint is None
+        assert flagged.duplicate_of is None
+
+    def test_bulk_ingest_flags_other_source_matches(self, db_session):
+        """Test only a match from another source is flagged, pointing at the existing row."""
+        create_transactions_bulk(db_session, [self._tx("bunq", "dup_bunq")])
+        upsert_transactions_bulk(
+            db_session,
+            [self._tx("camt053", "dup_camt"), self._tx("camt053", "dup_other", amount=99.0)],
+        )
+        create_transactions_bulk(db_session, [self._tx("bunq", "dup_bunq_again")])
+
+        original = get_transaction_by_external_id(db_session, "bunq", "dup_bunq")
+        flagged = get_transaction_by_external_id(db_session, "camt053", "dup_camt")
+        assert original.duplicate_of is None
+        assert flagged.duplicate_of == original.itemid
+        assert get_transaction_by_external_id(db_session, "camt053", "dup_other").duplicate_of is None
+        # Same source as the original and the camt053 row is itself a duplicate
+        assert get_transaction_by_external_id(db_session, "bunq", "dup_bunq_again").duplicate_of is None
+
+    def test_copy_mode_flags_duplicates(self, db_session):
+        create_transactions_bulk(db_session, [self._tx("bunq", "dup_copy_bunq")])
+        create_transactions_bulk(db_session, [self._tx("mt940", "dup_copy_mt940")], mode="copy")
+
+        original = get_transaction_by_external_id(db_session, "bunq", "dup_copy_bunq")
+        assert get_transaction_by_external_id(db_session, "mt940", "dup_copy_mt940").duplicate_of == original.itemid
+
+    def test_manual_entry_is_flagged(self, db_session):
+        create_transactions_bulk(db_session, [self._tx("bunq", "dup_manual_bunq")])
+        manual = create_transaction(db_session, self._tx(None, None))
+
+        original = get_transaction_by_external_id(db_session, "bunq", "dup_manual_bunq")
+        assert manual.duplicate_of == original.itemid
+
 
 @pytest.mark.integration
 class TestUpdateTransaction:
@@ -208,6 +494,63 @@ class TestUpdateTransaction:
         assert result is None
 
 
+@pytest.mark.integration
+class TestBulkWrites:
+    """Tests for the per-item bulk create, update and delete functions."""
+
+    def test_create_reports_each_item(self, db_session):
+        """Test created, skipped and invalid items are reported in order."""
+        create_transaction(
+            db_session, TransactionCreate(amount=1.0, currency="EUR", external_source="app", external_id="bulk_taken")
+        )
+
+        results = create_transactions_bulk_results(
+            db_session,
+            [
+                TransactionCreate(amount=2.0, currency="EUR", external_source="app", external_id="bulk_new"),
+                TransactionCreate(amount=3.0, currency="EUR", external_source="app", external_id="bulk_taken"),
+                TransactionCreate(amount=-4.0, currency="EUR"),
+            ],
+        )
+
+        assert [(r.index, r.status) for r in results] == [(0, "created"), (1, "skipped"), (2, "invalid")]
+        assert results[0].itemid == get_transaction_by_external_id(db_session, "app", "bulk_new").itemid
+        assert results[1].itemid is None and results[2].detail == "amount must be greater than 0"
+
+    def test_update_merges_items_per_transaction(self, db_session):
+        """Test only given fields change and later items win."""
+        tx = create_transaction(db_session, TransactionCreate(amount=10.0, currency="EUR", description="Original"))
+        missing = uuid4()
+
+        results = update_transactions_bulk(
+            db_session,
+            [
+                TransactionBulkUpdate(itemid=tx.itemid, description="First", category="food"),
+                TransactionBulkUpdate(itemid=missing, description="Nope"),
+                TransactionBulkUpdate(itemid=tx.itemid, description="Second", amount=12.5),
+            ],
+        )
+
+        assert [r.status for r in results] == ["updated", "not_found", "updated"]
+        updated = repo.get(db_session, tx.itemid)
+        assert (updated.description, updated.category, updated.amount, updated.currency) == (
+            "Second",
+            "food",
+            12.5,
+            "EUR",
+        )
+
+    def test_delete_reports_missing_items(self, db_session):
+        """Test deleted and unknown IDs are told apart."""
+        tx = create_transaction(db_session, TransactionCreate(amount=10.0, currency="EUR"))
+        missing = uuid4()
+
+        results = delete_transactions_bulk(db_session, [tx.itemid, missing])
+
+        assert [(r.itemid, r.status) for r in results] == [(tx.itemid, "deleted"), (missing, "not_found")]
+        assert repo.get(db_session, tx.itemid) is None
+
+
 @pytest.mark.integration
 class TestGetTransactionByExternalId:
     """Tests for get_transaction_by_external_id function."""
@@ -303,3 +646,179 @@ def test_list_transactions_service_date_range(db_session):
     # start > end should raise ValueError
     with pytest.raises(ValueError):
         list_transactions(db_session, start=t3, end=t1)
+
+
+@pytest.mark.integration
+class TestKeysetPagination:
+    """Tests for cursor-based transaction listing."""
+
+    @staticmethod
+    def _create(db_session, count, booked=None):
+        return [
+            repo.create(
+                db_session,
+                {
+                    "amount": 1.0 + i,
+                    "currency": "EUR",
+                    # Two rows per timestamp, so itemid has to break ties
+                    "createdtimestamp": datetime(2030, 1, 1 + i // 2, tzinfo=UTC),
+                    "external_created_at": booked[i] if booked else None,
+                },
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _all_pages(db_session, limit, **kwargs):
+        ids, cursor, pages = [], None, 0
+        while True:
+            items, cursor = list_transactions_page(
+                db_session, limit=limit, cursor=cursor, start=datetime(2030, 1, 1, tzinfo=UTC), **kwargs
+            )
+            ids += [tx.itemid for tx in items]
+            pages += 1
+            if cursor is None:
+                return ids, pages
+
+    def test_pages_cover_all_rows_in_order(self, db_session):
+        created = self._create(db_session, 7)
+        expected = [tx.itemid for tx in sorted(created, key=lambda tx: (tx.createdtimestamp, tx.itemid))]
+
+        ids, pages = self._all_pages(db_session, limit=3)
+
+        assert ids == expected
+        assert pages == 3
+        assert list_transactions(db_session, start=datetime(2030, 1, 1, tzinfo=UTC), limit=3, offset=3) == [
+            repo.get(db_session, itemid) for itemid in expected[3:6]
+        ]
+
+    def test_descending_pages(self, db_session):
+        created = self._create(db_session, 5)
+        expected = [tx.itemid for tx in sorted(created, key=lambda tx: (tx.createdtimestamp, tx.itemid), reverse=True)]
+
+        ids, _ = self._all_pages(db_session, limit=2, descending=True)
+
+        assert ids == expected
+
+    def test_booked_order_falls_back_to_created(self, db_session):
+        booked = [datetime(2020, 1, 3, tzinfo=UTC), None, datetime(2020, 1, 1, tzinfo=UTC), None]
+        created = self._create(db_session, 4, booked=booked)
+
+        ids, _ = self._all_pages(db_session, limit=1, order_by="booked")
+
+        assert ids[:2] == [created[2].itemid, created[0].itemid]
+        assert set(ids[2:]) == {created[1].itemid, created[3].itemid}
+
+    def test_rejects_invalid_and_mismatched_cursors(self, db_session):
+        self._create(db_session, 3)
+        _, cursor = list_transactions_page(db_session, limit=1)
+
+        with pytest.raises(ValueError, match="invalid cursor"):
+            list_transactions_page(db_session, cursor="not-a-cursor")
+        with pytest.raises(ValueError, match="another order"):
+            list_transactions_page(db_session, cursor=cursor, descending=True)
+        with pytest.raises(ValueError, match="limit"):
+            list_transactions_page(db_session, limit=0)
+
+    def test_amount_order_pages(self, db_session):
+        created = self._create(db_session, 5)
+
+        ids, _ = self._all_pages(db_session, limit=2, order_by="amount", descending=True)
+
+        assert ids == [tx.itemid for tx in reversed(created)]
+
+
+@pytest.mark.integration
+class TestListingFilters:
+    """Tests for TransactionFilters in listings."""
+
+    @staticmethod
+    def _create(db_session):
+        rows = [
+            ("groceries", "EUR", 12.5, "NL02RABO0123456789", "bunq", "CARD"),
+            ("groceries", "USD", 40.0, None, "camt053", "CARD"),
+            ("rent", "EUR", 950.0, "NL91ABNA0417164300", "bunq", "TRANSFER"),
+            (None, "EUR", 3.0, None, "manual", None),
+        ]
+        return [
+            repo.create(
+                db_session,
+                {
+                    "category": category,
+                    "currency": currency,
+                    "amount": amount,
+                    "counterparty_iban": iban,
+                    "external_source": source,
+                    "transaction_type": transaction_type,
+                    "createdtimestamp": datetime(2032, 1, 1 + i, tzinfo=UTC),
+                },
+            )
+            for i, (category, currency, amount, iban, source, transaction_type) in enumerate(rows)
+        ]
+
+    @staticmethod
+    def _list(db_session, **filters):
+        return [
+            tx.itemid
+            for tx in list_transactions(
+                db_session, start=datetime(2032, 1, 1, tzinfo=UTC), filters=TransactionFilters(**filters)
+            )
+        ]
+
+    def test_each_filter(self, db_session):
+        groceries, usd, rent, manual = (tx.itemid for tx in self._create(db_session))
+
+        assert self._list(db_session, category="groceries") == [groceries, usd]
+        assert self._list(db_session, currency="usd") == [usd]
+        assert self._list(db_session, min_amount=12.5, max_amount=40) == [groceries, usd]
+        assert self._list(db_session, counterparty_iban="nl91 abna 0417 1643 00") == [rent]
+        assert self._list(db_session, external_source="bunq") == [groceries, rent]
+        assert self._list(db_session, transaction_type="CARD", currency="EUR") == [groceries]
+        assert self._list(db_session) == [groceries, usd, rent, manual]
+
+    def test_filters_apply_to_pages(self, db_session):
+        groceries, _, rent, _ = (tx.itemid for tx in self._create(db_session))
+
+        items, cursor = list_transactions_page(
+            db_session, limit=1, order_by="amount", filters=TransactionFilters(currency="EUR", min_amount=10)
+        )
+        assert [tx.itemid for tx in items] == [groceries]
+        items, cursor = list_transactions_page(
+            db_session,
+            limit=1,
+            cursor=cursor,
+            order_by="amount",
+            filters=TransactionFilters(currency="EUR", min_amount=10),
+        )
+        assert [tx.itemid for tx in items] == [rent]
+        assert cursor is None
+
+    def test_rejects_inverted_amount_range(self, db_session):
+        with pytest.raises(ValueError, match="min_amount"):
+            list_transactions(db_session, filters=TransactionFilters(min_amount=5, max_amount=1))
+
+
+@pytest.mark.integration
+def test_export_transactions_csv(db_session):
+    """Test COPY exports the filtered rows as CSV with a header."""
+    for day, description in ((1, "old"), (5, 'quoted "new"'), (6, "newest")):
+        repo.create(
+            db_session,
+            {
+                "amount": 2.5,
+                "currency": "EUR",
+                "description": description,
+                "createdtimestamp": datetime(2031, 1, day, tzinfo=UTC),
+            },
+        )
+    destination = io.BytesIO()
+
+    query = transaction_export_query(start=datetime(2031, 1, 2, tzinfo=UTC), descending=True)
+    written = export_transactions_csv(db_session, destination, query)
+
+    rows = list(csv.DictReader(io.StringIO(destination.getvalue().decode())))
+    assert written == 2
+    assert list(rows[0]) == list(EXPORT_COLUMNS)
+    assert [row["description"] for row in rows] == ["newest", 'quoted "new"']
+    assert rows[0]["amount"] == "2.5"
+    assert rows[0]["duplicate_of"] == ""
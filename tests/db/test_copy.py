@@ -0,0 +1,56 @@
+"""Tests for the COPY streaming helpers."""
+
+from datetime import UTC, datetime
+
+import pytest
+from src.db.copy import CsvRowStream, format_csv_value
+
+
+@pytest.mark.unit
+class TestFormatCsvValue:
+    """Tests for format_csv_value."""
+
+    def test_none_is_unquoted_empty_field(self):
+        assert format_csv_value(None) == ""
+
+    def test_empty_string_is_quoted(self):
+        assert format_csv_value("") == '""'
+
+    def test_quotes_are_escaped(self):
+        assert format_csv_value('say "hi", bye') == '"say ""hi"", bye"'
+
+    def test_datetime_uses_iso_format(self):
+        value = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        assert format_csv_value(value) == '"2024-01-02T03:04:05+00:00"'
+
+
+@pytest.mark.unit
+class TestCsvRowStream:
+    """Tests for CsvRowStream."""
+
+    def test_read_all(self):
+        stream = CsvRowStream([(1, "a"), (2, None)])
+
+        assert stream.read() == '"1","a"\n"2",\n'
+        assert stream.rows_written == 2
+
+    def test_read_in_chunks_is_lazy(self):
+        produced = []
+
+        def rows():
+            for i in range(100):
+                produced.append(i)
+                yield (i,)
+
+        stream = CsvRowStream(rows())
+        first = stream.read(8)
+
+        assert len(first) == 8
+        assert len(produced) < 100
+
+        rest = ""
+        while chunk := stream.read(8):
+            rest += chunk
+
+        assert (first + rest).count("\n") == 100
+        assert stream.rows_written == 100
@@ -0,0 +1,121 @@
+"""Tests for CRUDRepository, including how many statements each write costs."""
+
+import asyncio
+import contextlib
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+from src.budgetbuddy.banking.schemas.transaction import TransactionCreate, TransactionUpdate
+from src.budgetbuddy.services import async_transaction_service
+from src.budgetbuddy.services.transaction_service import delete_transaction, update_transaction
+from src.db.repository.base import CRUDRepository
+from src.db.schema.transaction import Transaction
+
+DML = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+
+@contextlib.contextmanager
+def count_queries(connection):
+    """Collect the DML statements sent on a connection (savepoints excluded)."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(DML):
+            statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture()
+def repo():
+    return CRUDRepository(Transaction)
+
+
+@pytest.mark.integration
+class TestRepositoryWrites:
+    """Every repository write is one round trip that returns the written row."""
+
+    def test_create_returns_server_values(self, db_session, repo):
+        with count_queries(db_session.connection()) as queries:
+            tx = repo.create(db_session, {"amount": 1.5, "currency": "EUR", "counterparty_iban": "NL02RABO0123456789"})
+
+        assert len(queries) == 1
+        assert tx.createdtimestamp is not None and tx.fingerprint is not None
+
+    def test_create_many_thousand_rows_in_one_insert(self, db_session, repo):
+        rows = [{"amount": float(i + 1), "currency": "EUR", "description": f"row {i}"} for i in range(1000)]
+
+        with count_queries(db_session.connection()) as queries:
+            created = repo.create_many(db_session, rows)
+
+        assert len(queries) == 1 and queries[0].lstrip().startswith("INSERT")
+        assert [tx.description for tx in created] == [row["description"] for row in rows]
+        assert all(tx.createdtimestamp is not None for tx in created)
+
+    def test_update_by_id(self, db_session, repo):
+        tx = repo.create(db_session, {"amount": 1.5, "currency": "EUR", "description": "before"})
+
+        with count_queries(db_session.connection()) as queries:
+            updated = repo.update_by_id(db_session, tx.itemid, {"description": "after"})
+
+        assert len(queries) == 1
+        assert updated is tx
+        assert (updated.description, updated.amount) == ("after", 1.5)
+        assert repo.update_by_id(db_session, uuid4(), {"description": "after"}) is None
+
+    def test_delete_by_id(self, db_session, repo):
+        tx = repo.create(db_session, {"amount": 1.5, "currency": "EUR"})
+
+        with count_queries(db_session.connection()) as queries:
+            assert repo.delete_by_id(db_session, tx.itemid) is True
+
+        assert len(queries) == 1
+        assert repo.get(db_session, tx.itemid) is None
+        assert repo.delete_by_id(db_session, uuid4()) is False
+
+    def test_service_update_and_delete_are_single_queries(self, db_session, repo):
+        tx = repo.create(db_session, {"amount": 1.5, "currency": "EUR"})
+
+        with count_queries(db_session.connection()) as queries:
+            update_transaction(db_session, tx.itemid, TransactionUpdate(category="food"))
+            delete_transaction(db_session, tx.itemid)
+
+        assert [q.lstrip().split()[0] for q in queries] == ["UPDATE", "DELETE"]
+
+    def test_async_service_update_and_delete_are_single_queries(self, test_engine):
+        pytest.importorskip("asyncpg")
+        url = test_engine.url.set(drivername="postgresql+asyncpg")
+
+        async def run():
+            engine = create_async_engine(url, poolclass=NullPool)
+            async with engine.connect() as conn:
+                transaction = await conn.begin()
+                db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+                tx = await async_transaction_service.create_transaction(
+                    db, TransactionCreate(amount=1.5, currency="EUR")
+                )
+
+                with count_queries(conn.sync_connection) as queries:
+                    updated = await async_transaction_service.update_transaction(
+                        db, tx.itemid, TransactionUpdate(category="food")
+                    )
+                    deleted = await async_transaction_service.delete_transaction(db, tx.itemid)
+                    missing = await async_transaction_service.delete_transaction(db, tx.itemid)
+
+                await db.close()
+                await transaction.rollback()
+            await engine.dispose()
+            return updated, deleted, missing, queries
+
+        updated, deleted, missing, queries = asyncio.run(run())
+
+        assert updated.category == "food"
+        assert (deleted, missing) == (True, False)
+        assert [q.lstrip().split()[0] for q in queries] == ["UPDATE", "DELETE", "DELETE"]
@@ -0,0 +1,74 @@
+"""EXPLAIN checks that the common transaction listing filters use an index."""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import text
+from src.budgetbuddy.banking.schemas.transaction import TransactionCreate, TransactionFilters
+from src.budgetbuddy.services.transaction_service import create_transactions_bulk, transactions_page_query
+
+
+def _plan_indexes(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= _plan_indexes(child)
+    return names
+
+
+def _explain(db_session, stmt) -> dict:
+    compiled = stmt.compile(dialect=db_session.get_bind().dialect)
+    result = db_session.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+    plan = result.scalar_one()
+    return (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+
+
+@pytest.fixture()
+def planned_session(db_session):
+    """Session over varied transactions, with statistics and sequential scans off.
+
+    The test table is too small for the planner to prefer an index on its
+    own; disabling sequential scans shows which index it would pick.
+    """
+    create_transactions_bulk(
+        db_session,
+        [
+            TransactionCreate(
+                amount=float(i % 997) + 0.5,
+                currency=("EUR", "USD", "GBP")[i % 3],
+                category=f"category {i % 50}" if i % 4 else None,
+                transaction_type=f"type {i % 20}" if i % 2 else None,
+                counterparty_iban=f"NL{i % 100:02d}BANK0123456789",
+                external_source=f"source {i % 10}",
+                external_id=f"explain_{i}",
+                external_created_at=datetime(2024, 1 + i % 12, 1, tzinfo=UTC),
+            )
+            for i in range(5000)
+        ],
+    )
+    db_session.execute(text("ANALYZE budgetbuddy.transactions"))
+    db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    return db_session
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("order_by", "filters", "expected_index"),
+    [
+        ("created", {}, "ix__transactions__created_itemid"),
+        ("booked", {}, "ix__transactions__booked_itemid"),
+        ("amount", {}, "ix__transactions__amount_itemid"),
+        ("created", {"category": "category 7"}, "ix__transactions__category_created"),
+        ("created", {"external_source": "source 3"}, "ix__transactions__source_created"),
+        ("created", {"transaction_type": "type 5"}, "ix__transactions__type_created"),
+        ("created", {"counterparty_iban": "nl07 bank 0123 4567 89"}, "ix__transactions__iban_created"),
+        ("created", {"currency": "usd", "min_amount": 10, "max_amount": 20}, "ix__transactions__currency_amount"),
+        ("amount", {"min_amount": 10, "max_amount": 20}, "ix__transactions__amount_itemid"),
+    ],
+)
+def test_listing_filter_uses_index(planned_session, order_by, filters, expected_index):
+    stmt = transactions_page_query(limit=100, order_by=order_by, filters=TransactionFilters(**filters))
+
+    plan = _explain(planned_session, stmt)
+
+    assert expected_index in _plan_indexes(plan), json.dumps(plan, indent=2)